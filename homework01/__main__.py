@@ -0,0 +1,20 @@
+"""
+Command line interface for the ciphers:
+
+    $ python -m homework01 caesar encrypt --shift 3 -i plain.txt
+    $ python homework01 caesar encrypt --shift 3 -i plain.txt
+
+The ciphers import each other as top-level modules, so under -m the package
+directory is run the same way python homework01 runs it (with the directory
+on sys.path), and cli is then imported as a plain module.
+"""
+
+import os
+import runpy
+
+if __package__:
+    runpy.run_path(os.path.dirname(os.path.abspath(__file__)), run_name="__main__")
+else:
+    from cli import main
+
+    main()
@@ -0,0 +1,120 @@
+"""
+Encryption and decryption of many independent messages with the same key.
+
+    >>> encrypt_many("caesar", ["python", "java"], 3)
+    ['sbwkrq', 'mdyd']
+    >>> decrypt_many("vigenere", ["LXFOPVEFRNHR"], "LEMON")
+    ['ATTACKATDAWN']
+
+Large batches are split into chunks that run on a process pool; results always
+come back in input order. Batches of at most `serial_threshold` messages are
+processed in the calling process, so small calls do not pay for starting a pool.
+"""
+
+import concurrent.futures
+import functools
+import os
+import typing as tp
+
+import caesar
+import rsa
+import vigenere
+
+
+def _rsa_encrypt(plaintext: str, key: rsa.Key) -> tp.List[int]:
+    return rsa.encrypt(key, plaintext)
+
+
+def _rsa_decrypt(ciphertext: tp.List[int], key: rsa.Key) -> str:
+    return rsa.decrypt(key, ciphertext)
+
+
+def _rsa_encrypt_bytes(plaintext: bytes, key: rsa.Key) -> bytes:
+    return rsa.encrypt_bytes(key, plaintext)
+
+
+def _rsa_decrypt_bytes(ciphertext: bytes, key: rsa.Key) -> bytes:
+    return rsa.decrypt_bytes(key, ciphertext)
+
+
+# cipher name -> (encrypt, decrypt), both called as func(message, key)
+CIPHERS: tp.Dict[str, tp.Tuple[tp.Callable[..., tp.Any], tp.Callable[..., tp.Any]]] = {
+    "caesar": (caesar.encrypt_caesar, caesar.decrypt_caesar),
+    "vigenere": (vigenere.encrypt_vigenere, vigenere.decrypt_vigenere),
+    "rsa": (_rsa_encrypt, _rsa_decrypt),
+    "rsa-bytes": (_rsa_encrypt_bytes, _rsa_decrypt_bytes),
+}
+
+
+def _process_chunk(cipher: str, decrypt: bool, key: tp.Any, messages: tp.List) -> tp.List:
+    func = CIPHERS[cipher][decrypt]
+    return [func(message, key) for message in messages]
+
+
+def _process_many(
+    cipher: str,
+    decrypt: bool,
+    messages: tp.Sequence,
+    key: tp.Any,
+    workers: tp.Optional[int],
+    chunk_size: int,
+    serial_threshold: int,
+    executor: tp.Optional[concurrent.futures.Executor],
+) -> tp.List:
+    if cipher not in CIPHERS:
+        raise ValueError(f"Unknown cipher {cipher!r}, expected one of {sorted(CIPHERS)}")
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be positive")
+    messages = list(messages)
+    workers = workers or os.cpu_count() or 1
+    if executor is None and (len(messages) <= serial_threshold or workers == 1):
+        return _process_chunk(cipher, decrypt, key, messages)
+
+    chunks = [messages[i : i + chunk_size] for i in range(0, len(messages), chunk_size)]
+    process = functools.partial(_process_chunk, cipher, decrypt, key)
+    if executor is not None:
+        results = executor.map(process, chunks)
+        return [result for chunk in results for result in chunk]
+    with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as pool:
+        return [result for chunk in pool.map(process, chunks) for result in chunk]
+
+
+def encrypt_many(
+    cipher: str,
+    messages: tp.Sequence,
+    key: tp.Any,
+    workers: tp.Optional[int] = None,
+    chunk_size: int = 64,
+    serial_threshold: int = 256,
+    executor: tp.Optional[concurrent.futures.Executor] = None,
+) -> tp.List:
+    """
+    Encrypts every message with the same key.
+
+    :param cipher: One of "caesar", "vigenere", "rsa", "rsa-bytes".
+    :param key: Shift, keyword or RSA key, as accepted by the cipher.
+    :param workers: Number of worker processes (default: number of CPUs).
+    :param chunk_size: Number of messages sent to a worker at a time.
+    :param serial_threshold: Batches of this size or smaller are processed without a pool.
+    :param executor: An already running executor to use instead of starting a new pool.
+    """
+    return _process_many(
+        cipher, False, messages, key, workers, chunk_size, serial_threshold, executor
+    )
+
+
+def decrypt_many(
+    cipher: str,
+    messages: tp.Sequence,
+    key: tp.Any,
+    workers: tp.Optional[int] = None,
+    chunk_size: int = 64,
+    serial_threshold: int = 256,
+    executor: tp.Optional[concurrent.futures.Executor] = None,
+) -> tp.List:
+    """
+    Decrypts every message with the same key, see encrypt_many.
+    """
+    return _process_many(
+        cipher, True, messages, key, workers, chunk_size, serial_threshold, executor
+    )
@@ -0,0 +1,245 @@
+"""
+Throughput benchmarks for the ciphers with regression tracking.
+
+    $ python -m bench run --sizes 1KB,1MB -o results.json
+    $ python -m bench compare results.json --threshold 0.1
+    $ python -m bench run --save-baseline
+
+Run the commands from the homework01 directory. The baseline is kept in
+bench/baseline.json next to this file.
+"""
+
+import datetime
+import functools
+import json
+import math
+import os
+import platform
+import time
+import typing as tp
+
+import numpy as np  # type: ignore
+
+import caesar
+import rsa
+import vigenere
+
+BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baseline.json")
+DEFAULT_SIZES = "1KB,64KB,1MB,16MB,100MB"
+UNITS = {"B": 1, "KB": 1 << 10, "MB": 1 << 20, "GB": 1 << 30}
+
+# RSA works block by block in pure Python, so large inputs would take minutes;
+# decryption (a private-key modexp per block) is the slowest of all
+RSA_KEY_BITS = 2048
+RSA_ENCRYPT_MAX_SIZE = 1 << 20
+RSA_DECRYPT_MAX_SIZE = 1 << 16
+
+
+class Case(tp.NamedTuple):
+    name: str
+    max_size: tp.Optional[int]
+    # Gets the input data, returns the function to be timed
+    setup: tp.Callable[[bytes], tp.Callable[[], tp.Any]]
+
+
+def parse_size(value: str) -> int:
+    """
+    >>> parse_size("64KB")
+    65536
+    >>> parse_size("100")
+    100
+    """
+    value = value.strip().upper()
+    for unit in sorted(UNITS, key=len, reverse=True):
+        if value.endswith(unit):
+            return int(float(value[: -len(unit)]) * UNITS[unit])
+    return int(value)
+
+
+def format_size(size: int) -> str:
+    """
+    >>> format_size(1 << 20)
+    '1MB'
+    >>> format_size(1500)
+    '1500B'
+    """
+    for unit in ("GB", "MB", "KB"):
+        if size % UNITS[unit] == 0:
+            return f"{size // UNITS[unit]}{unit}"
+    return f"{size}B"
+
+
+def synthetic_text(size: int, seed: int = 42) -> bytes:
+    """
+    Random ASCII letters, digits, spaces and punctuation.
+    """
+    alphabet = np.frombuffer(
+        b"abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789 .,\n", dtype=np.uint8
+    )
+    rng = np.random.default_rng(seed)
+    return alphabet[rng.integers(0, len(alphabet), size)].tobytes()
+
+
+def percentile(values: tp.Sequence[float], q: float) -> float:
+    """
+    Nearest-rank percentile, q in [0, 100].
+
+    >>> percentile([3, 1, 2, 4], 50)
+    2
+    >>> percentile([3, 1, 2, 4], 99)
+    4
+    """
+    ordered = sorted(values)
+    rank = max(1, math.ceil(q / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+
+@functools.lru_cache(maxsize=None)
+def _rsa_keypair() -> tp.Tuple[tp.Tuple[int, int], rsa.PrivateKey]:
+    return rsa.generate_keypair(bits=RSA_KEY_BITS)
+
+
+def _rsa_cases() -> tp.List[Case]:
+    def setup_encrypt(data: bytes) -> tp.Callable[[], bytes]:
+        public, _ = _rsa_keypair()
+        return lambda: rsa.encrypt_bytes(public, data)
+
+    def setup_decrypt(data: bytes) -> tp.Callable[[], bytes]:
+        public, private = _rsa_keypair()
+        ciphertext = rsa.encrypt_bytes(public, data)
+        return lambda: rsa.decrypt_bytes(private, ciphertext)
+
+    return [
+        Case("rsa.encrypt_bytes", RSA_ENCRYPT_MAX_SIZE, setup_encrypt),
+        Case("rsa.decrypt_bytes", RSA_DECRYPT_MAX_SIZE, setup_decrypt),
+    ]
+
+
+def default_cases() -> tp.List[Case]:
+    return [
+        Case("caesar.encrypt", None, lambda data: lambda: caesar.encrypt_caesar(data.decode(), 7)),
+        Case("caesar.decrypt", None, lambda data: lambda: caesar.decrypt_caesar(data.decode(), 7)),
+        Case(
+            "vigenere.encrypt",
+            None,
+            lambda data: lambda: vigenere.encrypt_vigenere(data.decode(), "LEMON"),
+        ),
+        Case(
+            "vigenere.decrypt",
+            None,
+            lambda data: lambda: vigenere.decrypt_vigenere(data.decode(), "LEMON"),
+        ),
+    ] + _rsa_cases()
+
+
+def measure(
+    func: tp.Callable[[], tp.Any],
+    min_repeats: int = 3,
+    max_repeats: int = 100,
+    min_time: float = 0.5,
+) -> tp.List[float]:
+    """
+    Calls func at least min_repeats times and until min_time seconds have passed
+    (but no more than max_repeats times); returns the duration of every call.
+    """
+    latencies: tp.List[float] = []
+    started = time.perf_counter()
+    while len(latencies) < max_repeats:
+        begin = time.perf_counter()
+        func()
+        latencies.append(time.perf_counter() - begin)
+        if len(latencies) >= min_repeats and time.perf_counter() - started >= min_time:
+            break
+    return latencies
+
+
+def run(
+    sizes: tp.Sequence[int],
+    cases: tp.Optional[tp.Sequence[Case]] = None,
+    min_repeats: int = 3,
+    min_time: float = 0.5,
+    pattern: str = "",
+    log: tp.Optional[tp.Callable[[str], None]] = None,
+) -> tp.Dict[str, tp.Any]:
+    """
+    Benchmarks every case on every input size; `pattern` selects cases by substring.
+    """
+    results = []
+    for case in cases if cases is not None else default_cases():
+        if pattern not in case.name:
+            continue
+        for size in sizes:
+            if case.max_size is not None and size > case.max_size:
+                continue
+            func = case.setup(synthetic_text(size))
+            latencies = measure(func, min_repeats=min_repeats, min_time=min_time)
+            result = {
+                "name": case.name,
+                "size": size,
+                "repeats": len(latencies),
+                "mb_per_s": size / (1 << 20) / percentile(latencies, 50),
+                "p50_ms": percentile(latencies, 50) * 1000,
+                "p99_ms": percentile(latencies, 99) * 1000,
+            }
+            results.append(result)
+            if log is not None:
+                log(format_result(result))
+    return {
+        "created": datetime.datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "results": results,
+    }
+
+
+def format_result(result: tp.Dict[str, tp.Any]) -> str:
+    return (
+        f"{result['name']:<20} {format_size(result['size']):>6} "
+        f"{result['mb_per_s']:10.2f} MB/s  p50 {result['p50_ms']:10.3f} ms  "
+        f"p99 {result['p99_ms']:10.3f} ms  ({result['repeats']} runs)"
+    )
+
+
+class Regression(tp.NamedTuple):
+    name: str
+    size: int
+    baseline: float
+    current: float
+
+    @property
+    def change(self) -> float:
+        return self.current / self.baseline - 1
+
+
+def compare(
+    current: tp.Dict[str, tp.Any], baseline: tp.Dict[str, tp.Any], threshold: float = 0.1
+) -> tp.List[Regression]:
+    """
+    Returns the benchmarks whose throughput fell by more than `threshold` (a fraction)
+    below the baseline. Benchmarks missing from either side are ignored.
+    """
+    before = {(r["name"], r["size"]): r["mb_per_s"] for r in baseline["results"]}
+    regressions = []
+    for result in current["results"]:
+        key = (result["name"], result["size"])
+        if key in before and result["mb_per_s"] < before[key] * (1 - threshold):
+            regressions.append(Regression(key[0], key[1], before[key], result["mb_per_s"]))
+    return regressions
+
+
+def load(path: str) -> tp.Dict[str, tp.Any]:
+    """
+    Reads results written by `save`. Raises OSError if the file cannot be read
+    and ValueError if it is not valid results JSON.
+    """
+    with open(path) as f:
+        results = json.load(f)
+    if not isinstance(results, dict) or not isinstance(results.get("results"), list):
+        raise ValueError(f"{path} has no 'results' list")
+    return results
+
+
+def save(results: tp.Dict[str, tp.Any], path: str) -> None:
+    with open(path, "w") as f:
+        json.dump(results, f, indent=2)
+        f.write("\n")
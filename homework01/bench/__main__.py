@@ -0,0 +1,99 @@
+import argparse
+import sys
+import typing as tp
+
+import bench
+
+
+def cmd_run(args: argparse.Namespace) -> int:
+    sizes = [bench.parse_size(size) for size in args.sizes.split(",")]
+    results = bench.run(
+        sizes,
+        min_repeats=args.repeats,
+        min_time=args.min_time,
+        pattern=args.filter,
+        log=print,
+    )
+    if args.output:
+        bench.save(results, args.output)
+    if args.save_baseline:
+        bench.save(results, args.baseline)
+        print(f"Baseline saved to {args.baseline}")
+    return 0
+
+
+def load_or_report(path: str, what: str) -> tp.Optional[tp.Dict[str, tp.Any]]:
+    try:
+        return bench.load(path)
+    except (OSError, ValueError) as error:
+        print(f"Cannot read {what} {path}: {error}", file=sys.stderr)
+        return None
+
+
+def cmd_compare(args: argparse.Namespace) -> int:
+    current = load_or_report(args.results, "results")
+    baseline = load_or_report(args.baseline, "baseline")
+    if baseline is None:
+        print("Create it with: python -m bench run --save-baseline", file=sys.stderr)
+    if current is None or baseline is None:
+        return 2
+    regressions = bench.compare(current, baseline, threshold=args.threshold)
+    for regression in regressions:
+        print(
+            f"REGRESSION {regression.name} {bench.format_size(regression.size)}: "
+            f"{regression.baseline:.2f} -> {regression.current:.2f} MB/s "
+            f"({regression.change:+.1%})"
+        )
+    if not regressions:
+        print(f"No throughput regressions beyond {args.threshold:.0%}")
+    return 1 if regressions else 0
+
+
+def make_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="bench", description="Cipher throughput benchmarks.")
+    subparsers = parser.add_subparsers(title="commands", dest="command", required=True)
+
+    run_subparser = subparsers.add_parser("run", help="Run the benchmarks.")
+    run_subparser.add_argument(
+        "--sizes",
+        default=bench.DEFAULT_SIZES,
+        help=f"Comma separated input sizes (default: {bench.DEFAULT_SIZES})",
+    )
+    run_subparser.add_argument("--filter", default="", help="Only run benchmarks containing this")
+    run_subparser.add_argument("--repeats", type=int, default=3, help="Minimum number of runs")
+    run_subparser.add_argument(
+        "--min-time", type=float, default=0.5, help="Minimum seconds spent on every benchmark"
+    )
+    run_subparser.add_argument("-o", "--output", help="Write results as JSON to this file")
+    run_subparser.add_argument(
+        "--save-baseline", action="store_true", help="Store the results as the new baseline"
+    )
+    run_subparser.add_argument("--baseline", default=bench.BASELINE_PATH, help=argparse.SUPPRESS)
+    run_subparser.set_defaults(func=cmd_run)
+
+    compare_subparser = subparsers.add_parser(
+        "compare", help="Compare results with the baseline, exit with 1 on regressions."
+    )
+    compare_subparser.add_argument("results", help="JSON file written by 'run -o'")
+    compare_subparser.add_argument(
+        "--baseline",
+        default=bench.BASELINE_PATH,
+        help=f"Baseline JSON file (default: {bench.BASELINE_PATH})",
+    )
+    compare_subparser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.1,
+        help="Allowed throughput drop as a fraction (default: 0.1)",
+    )
+    compare_subparser.set_defaults(func=cmd_compare)
+    return parser
+
+
+def main(argv: tp.Optional[tp.List[str]] = None) -> int:
+    args = make_parser().parse_args(argv)
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
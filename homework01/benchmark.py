@@ -0,0 +1,142 @@
+"""
+Compares the table-driven ciphers with the original character-by-character versions.
+
+    $ python benchmark.py
+"""
+
+import random
+import string
+import timeit
+import typing as tp
+
+import rsa
+from caesar import ENGLISH_FREQUENCIES, decrypt_caesar, encrypt_caesar
+from vigenere import break_vigenere, decrypt_vigenere, encrypt_vigenere
+
+
+def legacy_encrypt_caesar(plaintext: str, shift: int = 3) -> str:
+    ciphertext = ""
+    for char in plaintext:
+        if "a" <= char <= "z":
+            ciphertext += chr(((ord(char) - ord("a") + shift) % 26) + ord("a"))
+        elif "A" <= char <= "Z":
+            ciphertext += chr(((ord(char) - ord("A") + shift) % 26) + ord("A"))
+        else:
+            ciphertext += char
+    return ciphertext
+
+
+def legacy_decrypt_caesar(ciphertext: str, shift: int = 3) -> str:
+    return legacy_encrypt_caesar(ciphertext, -shift)
+
+
+def _legacy_vigenere(text: str, keyword: str, sign: int) -> str:
+    result = ""
+    for i, char in enumerate(text):
+        key = keyword[i % len(keyword)]
+        if "A" <= key <= "Z":
+            shift = ord(key) - ord("A")
+        elif "a" <= key <= "z":
+            shift = ord(key) - ord("a")
+        else:
+            continue
+        if "A" <= char <= "Z":
+            result += chr((ord(char) - ord("A") + sign * shift) % 26 + ord("A"))
+        elif "a" <= char <= "z":
+            result += chr((ord(char) - ord("a") + sign * shift) % 26 + ord("a"))
+        else:
+            result += char
+    return result
+
+
+def legacy_encrypt_vigenere(plaintext: str, keyword: str) -> str:
+    return _legacy_vigenere(plaintext, keyword, 1)
+
+
+def legacy_decrypt_vigenere(ciphertext: str, keyword: str) -> str:
+    return _legacy_vigenere(ciphertext, keyword, -1)
+
+
+def random_text(size: int, seed: int = 42) -> str:
+    rnd = random.Random(seed)
+    alphabet = string.ascii_letters + string.digits + " .,-\n"
+    return "".join(rnd.choices(alphabet, k=size))
+
+
+def english_text(size: int, seed: int = 42) -> str:
+    """
+    Random text whose letters follow English letter frequencies.
+    """
+    rnd = random.Random(seed)
+    weights = list(ENGLISH_FREQUENCIES) + [0.2]
+    return "".join(rnd.choices(string.ascii_lowercase + " ", weights=weights, k=size))
+
+
+def compare(
+    name: str, new: tp.Callable[[], tp.Any], old: tp.Callable[[], tp.Any], number: int = 3
+) -> None:
+    assert new() == old(), f"{name}: outputs differ"
+    new_time = min(timeit.repeat(new, number=1, repeat=number))
+    old_time = min(timeit.repeat(old, number=1, repeat=number))
+    print(
+        f"{name:<20} {old_time * 1000:10.2f} ms {new_time * 1000:10.2f} ms {old_time / new_time:8.1f}x"
+    )
+
+
+def main() -> None:
+    for size in (1_000, 100_000, 1_000_000):
+        text = random_text(size)
+        print(f"--- {size} characters ---")
+        print(f"{'function':<20} {'legacy':>13} {'new':>13} {'speedup':>9}")
+        compare(
+            "encrypt_caesar",
+            lambda: encrypt_caesar(text, 7),
+            lambda: legacy_encrypt_caesar(text, 7),
+        )
+        compare(
+            "decrypt_caesar",
+            lambda: decrypt_caesar(text, 7),
+            lambda: legacy_decrypt_caesar(text, 7),
+        )
+        compare(
+            "encrypt_vigenere",
+            lambda: encrypt_vigenere(text, "LEMON"),
+            lambda: legacy_encrypt_vigenere(text, "LEMON"),
+        )
+        compare(
+            "decrypt_vigenere",
+            lambda: decrypt_vigenere(text, "LEMON"),
+            lambda: legacy_decrypt_vigenere(text, "LEMON"),
+        )
+
+    print("--- break_vigenere ---")
+    for size in (10_000, 1_000_000):
+        ciphertext = encrypt_vigenere(english_text(size), "CRYPTOGRAPHY")
+        assert break_vigenere(ciphertext) == "CRYPTOGRAPHY"
+        elapsed = min(timeit.repeat(lambda: break_vigenere(ciphertext), number=1, repeat=3))
+        print(f"{size:>9} characters {elapsed * 1000:10.2f} ms")
+
+    print("--- rsa.generate_keypair ---")
+    for bits in (1024, 2048, 4096):
+        elapsed = min(timeit.repeat(lambda: rsa.generate_keypair(bits=bits), number=1, repeat=3))
+        print(f"{bits:>9} bits {elapsed * 1000:14.2f} ms")
+
+    print("--- rsa.encrypt_bytes, 1 MB ---")
+    public, private = rsa.generate_keypair(bits=2048)
+    payload = random_text(1_000_000).encode()
+    blocks = -(-len(payload) // rsa.block_size(public[1]))
+    elapsed = min(timeit.repeat(lambda: rsa.encrypt_bytes(public, payload), number=1, repeat=3))
+    print(f"{blocks} blocks, {elapsed * 1000:.2f} ms")
+
+    print("--- rsa.decrypt_bytes, 16 KB: CRT vs (d, n) tuple ---")
+    rsa_ciphertext = rsa.encrypt_bytes(public, payload[:16384])
+    compare(
+        "decrypt_bytes",
+        lambda: rsa.decrypt_bytes(private, rsa_ciphertext),
+        lambda: rsa.decrypt_bytes((private.d, private.n), rsa_ciphertext),
+        number=1,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,30 @@
+import collections
+import functools
 import typing as tp
 
+import numpy as np  # type: ignore
+
+# Relative frequencies of the letters a..z in English text
+# fmt: off
+ENGLISH_FREQUENCIES = np.array([
+    0.08167, 0.01492, 0.02782, 0.04253, 0.12702, 0.02228, 0.02015, 0.06094, 0.06966,
+    0.00153, 0.00772, 0.04025, 0.02406, 0.06749, 0.07507, 0.01929, 0.00095, 0.05987,
+    0.06327, 0.09056, 0.02758, 0.00978, 0.02360, 0.00150, 0.01974, 0.00074,
+])
+# fmt: on
+
+
+@functools.lru_cache(maxsize=26)
+def _caesar_table(shift: int) -> tp.Dict[int, int]:
+    """
+    Builds (and caches) a translation table that shifts ASCII letters by `shift` (0..25).
+    """
+    lower = "abcdefghijklmnopqrstuvwxyz"
+    upper = lower.upper()
+    return str.maketrans(
+        lower + upper, lower[shift:] + lower[:shift] + upper[shift:] + upper[:shift]
+    )
+
 
 def encrypt_caesar(plaintext: str, shift: int = 3) -> str:
     """
@@ -14,16 +39,7 @@ def encrypt_caesar(plaintext: str, shift: int = 3) -> str:
     >>> encrypt_caesar("")
     ''
     """
-
-    ciphertext = ""
-    for i in range(len(plaintext)):
-        if ord('a') <= ord(plaintext[i]) <= ord('z'):
-            ciphertext += chr(((ord(plaintext[i]) - ord('a') + shift) % 26) + ord('a'))
-        elif ord('A') <= ord(plaintext[i]) <= ord('Z'):
-            ciphertext += chr(((ord(plaintext[i]) - ord('A') + shift) % 26) + ord('A'))
-        else:
-            ciphertext += plaintext[i]
-    return ciphertext
+    return plaintext.translate(_caesar_table(shift % 26))
 
 
 def decrypt_caesar(ciphertext: str, shift: int = 3) -> str:
@@ -39,30 +55,120 @@ def decrypt_caesar(ciphertext: str, shift: int = 3) -> str:
     >>> decrypt_caesar("")
     ''
     """
-    plaintext = ""
-    for i in range(len(ciphertext)):
-        if ord('a') <= ord(ciphertext[i]) <= ord('z'):
-            plaintext += chr(((ord(ciphertext[i]) - ord('a') - shift) % 26) + ord('a'))
-        elif ord('A') <= ord(ciphertext[i]) <= ord('Z'):
-            plaintext += chr(((ord(ciphertext[i]) - ord('A') - shift) % 26) + ord('A'))
-        else:
-            plaintext += ciphertext[i]
-    return plaintext
+    return ciphertext.translate(_caesar_table(-shift % 26))
+
+
+def iter_encrypt_caesar(chunks: tp.Iterable[str], shift: int = 3) -> tp.Iterator[str]:
+    """
+    Encrypts a stream of text chunks using a Caesar cipher.
+
+    >>> list(iter_encrypt_caesar(["PYT", "HON"]))
+    ['SBW', 'KRQ']
+    """
+    table = _caesar_table(shift % 26)
+    for chunk in chunks:
+        yield chunk.translate(table)
+
+
+def iter_decrypt_caesar(chunks: tp.Iterable[str], shift: int = 3) -> tp.Iterator[str]:
+    """
+    Decrypts a stream of text chunks using a Caesar cipher.
+
+    >>> list(iter_decrypt_caesar(["SBW", "KRQ"]))
+    ['PYT', 'HON']
+    """
+    return iter_encrypt_caesar(chunks, -shift)
+
+
+def _letter_histogram(text: str) -> np.ndarray:
+    """
+    Counts ASCII letters in text, ignoring case.
+    """
+    codes = np.frombuffer(text.encode("ascii", "ignore").lower(), dtype=np.uint8)
+    return np.bincount(codes, minlength=256)[ord("a") : ord("z") + 1]
+
+
+def _canonical_word(word: str) -> tp.Optional[tp.Tuple[str, int]]:
+    """
+    Shifts a word so that its first letter becomes 'a'/'A'; returns the result and the shift.
+    Words that have the same canonical form are Caesar shifts of each other.
+    """
+    for char in word:
+        if "a" <= char <= "z" or "A" <= char <= "Z":
+            offset = ord(char.lower()) - ord("a")
+            return word.translate(_caesar_table(-offset % 26)), offset
+    return None
+
+
+def _dictionary_hits(ciphertext: str, dictionary: tp.Set[str]) -> np.ndarray:
+    """
+    For every shift, counts ciphertext words that decrypt to a dictionary word.
+    """
+    offsets: tp.Dict[str, tp.List[int]] = {}
+    for word in dictionary:
+        canonical = _canonical_word(word)
+        if canonical is not None:
+            offsets.setdefault(canonical[0], []).append(canonical[1])
+
+    lengths = {len(word) for word in offsets}
+    hits = np.zeros(26, dtype=np.int64)
+    for word, count in collections.Counter(ciphertext.split()).items():
+        if len(word) not in lengths:
+            continue
+        canonical = _canonical_word(word)
+        if canonical is None or canonical[0] not in offsets:
+            continue
+        for offset in offsets[canonical[0]]:
+            hits[(canonical[1] - offset) % 26] += count
+    return hits
+
+
+def rank_caesar_shifts(
+    ciphertext: str, dictionary: tp.Optional[tp.Set[str]] = None
+) -> tp.List[tp.Tuple[int, float]]:
+    """
+    Ranks all 26 shifts from the most to the least likely one.
+
+    Returns (shift, confidence) pairs with confidences summing to 1. Shifts are
+    scored by dictionary hits when a dictionary is given and any word matches,
+    otherwise by the chi-squared distance between the decrypted letter
+    histogram and English letter frequencies.
+
+    >>> rank_caesar_shifts("sbwkrq", {"python"})[0]
+    (3, 1.0)
+    >>> rank_caesar_shifts("Wkh txlfn eurzq ira mxpsv ryhu wkh odcb grj")[0][0]
+    3
+    """
+    histogram = _letter_histogram(ciphertext)
+    total = histogram.sum()
+    if total == 0:
+        return [(shift, 1 / 26) for shift in range(26)]
+
+    # observed[s][i] is how many times letter i appears after decrypting with shift s
+    shifts = np.arange(26)
+    observed = histogram[(shifts[:, None] + shifts[None, :]) % 26]
+    expected = total * ENGLISH_FREQUENCIES
+    chi_squared = ((observed - expected) ** 2 / expected).sum(axis=1)
+
+    hits = _dictionary_hits(ciphertext, dictionary) if dictionary else np.zeros(26)
+    if hits.sum() > 0:
+        confidence = hits / hits.sum()
+    else:
+        confidence = 1 / chi_squared
+        confidence /= confidence.sum()
+
+    order = np.lexsort((shifts, chi_squared, -hits))
+    return [(int(shift), float(confidence[shift])) for shift in order]
 
 
 def caesar_breaker(ciphertext: str, dictionary: tp.Set[str]) -> int:
     """
+    Returns the most likely shift, see rank_caesar_shifts.
+
     >>> d = {"python", "java", "ruby"}
     >>> caesar_breaker("python", d)
     0
     >>> caesar_breaker("sbwkrq", d)
     3
     """
-    best_shift = 0
-    ltrs = ciphertext.split()
-    for ltr in ltrs:
-        for i in range(26):
-            decrypted_word = decrypt_caesar(ltr, i)
-            if decrypted_word in dictionary:
-                best_shift = i
-    return best_shift
\ No newline at end of file
+    return rank_caesar_shifts(ciphertext, dictionary)[0][0]
@@ -0,0 +1,113 @@
+"""
+Streaming command line interface for the ciphers.
+
+    $ python -m homework01 caesar encrypt --shift 3 -i plain.txt -o cipher.txt
+    $ python -m homework01 vigenere decrypt --key LEMON < cipher.txt
+    $ python homework01/cli.py rsa encrypt --key 121,323 -i plain.txt
+
+Input is read in blocks of --chunk-size characters, so memory use does not
+depend on the size of the input.
+"""
+
+import argparse
+import io
+import sys
+import typing as tp
+
+import caesar
+import rsa
+import vigenere
+
+DEFAULT_CHUNK_SIZE = 1 << 20
+
+
+def read_chunks(stream: tp.TextIO, chunk_size: int = DEFAULT_CHUNK_SIZE) -> tp.Iterator[str]:
+    while True:
+        chunk = stream.read(chunk_size)
+        if not chunk:
+            return
+        yield chunk
+
+
+def iter_ints(chunks: tp.Iterable[str]) -> tp.Iterator[tp.List[int]]:
+    """
+    Parses whitespace-separated integers from a stream of text chunks.
+    A number split between two chunks is glued back together.
+    """
+    tail = ""
+    for chunk in chunks:
+        tokens = (tail + chunk).split()
+        if tokens and not chunk[-1].isspace():
+            tail = tokens.pop()
+        else:
+            tail = ""
+        yield [int(token) for token in tokens]
+    if tail:
+        yield [int(tail)]
+
+
+def parse_rsa_key(value: str) -> tp.Tuple[int, int]:
+    key, n = value.split(",")
+    return int(key), int(n)
+
+
+def open_input(path: tp.Optional[str]) -> tp.TextIO:
+    if path is None or path == "-":
+        return io.TextIOWrapper(sys.stdin.buffer, encoding="utf-8", newline="")
+    return open(path, encoding="utf-8", newline="")
+
+
+def open_output(path: tp.Optional[str]) -> tp.TextIO:
+    if path is None or path == "-":
+        return io.TextIOWrapper(sys.stdout.buffer, encoding="utf-8", newline="")
+    return open(path, "w", encoding="utf-8", newline="")
+
+
+def transform(args: argparse.Namespace, chunks: tp.Iterable[str]) -> tp.Iterator[str]:
+    encrypt = args.action == "encrypt"
+    if args.cipher == "caesar":
+        if encrypt:
+            return caesar.iter_encrypt_caesar(chunks, args.shift)
+        return caesar.iter_decrypt_caesar(chunks, args.shift)
+    if args.cipher == "vigenere":
+        if encrypt:
+            return vigenere.iter_encrypt_vigenere(chunks, args.key)
+        return vigenere.iter_decrypt_vigenere(chunks, args.key)
+    key = parse_rsa_key(args.key)
+    if encrypt:
+        return ("".join(f"{c}\n" for c in block) for block in rsa.iter_encrypt(key, chunks))
+    return rsa.iter_decrypt(key, iter_ints(chunks))
+
+
+def make_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="homework01", description=__doc__.split("\n\n")[0])
+    parser.add_argument("cipher", choices=["caesar", "vigenere", "rsa"])
+    parser.add_argument("action", choices=["encrypt", "decrypt"])
+    parser.add_argument("--shift", type=int, default=3, help="Caesar shift (default: 3)")
+    parser.add_argument("--key", help="Vigenere keyword or RSA key as 'key,n'")
+    parser.add_argument("-i", "--input", help="Input file (default: stdin)")
+    parser.add_argument("-o", "--output", help="Output file (default: stdout)")
+    parser.add_argument(
+        "--chunk-size",
+        type=int,
+        default=DEFAULT_CHUNK_SIZE,
+        help=f"Characters read at a time (default: {DEFAULT_CHUNK_SIZE})",
+    )
+    return parser
+
+
+def main(argv: tp.Optional[tp.List[str]] = None) -> None:
+    parser = make_parser()
+    args = parser.parse_args(argv)
+    if args.cipher != "caesar" and not args.key:
+        parser.error(f"--key is required for {args.cipher}")
+    if args.chunk_size <= 0:
+        parser.error("--chunk-size must be positive")
+
+    with open_input(args.input) as src, open_output(args.output) as dst:
+        for block in transform(args, read_chunks(src, args.chunk_size)):
+            dst.write(block)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,42 +1,201 @@
 import random
+import secrets
 import typing as tp
 
+# Miller-Rabin with these bases is exact for every n below _DETERMINISTIC_LIMIT
+_SMALL_PRIMES = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41)
+_DETERMINISTIC_LIMIT = 3_317_044_064_679_887_385_961_981
+_SIEVE_PRIMES = tuple(p for p in range(3, 2000, 2) if all(p % d for d in range(3, p, 2)))
 
-def is_prime(n: int) -> bool:
-  
-    if n == 1:
+
+def is_prime(n: int, rounds: int = 16) -> bool:
+    """
+    Tests to see if a number is prime (Miller-Rabin).
+
+    The test is deterministic below 3.3 * 10**24; larger numbers are also
+    checked against `rounds` random bases, so a composite slips through with
+    probability below 4**-rounds.
+
+    >>> is_prime(2)
+    True
+    >>> is_prime(11)
+    True
+    >>> is_prime(8)
+    False
+    >>> is_prime(2 ** 127 - 1)
+    True
+    """
+    if n < 2:
         return False
-    else:
-        for i in range(2, n):
-            if n % i == 0:
-                return False
-        return True
+    for p in _SMALL_PRIMES:
+        if n % p == 0:
+            return n == p
 
+    d, s = n - 1, 0
+    while d % 2 == 0:
+        d //= 2
+        s += 1
 
-def gcd(a: int, b: int) -> int:
-   
-    if a == 0:
-        return a + b
-    elif b == 0:
-        return a + b
-    else:
-        if a > b:
-            return gcd(a-b, b)
+    bases = list(_SMALL_PRIMES)
+    if n >= _DETERMINISTIC_LIMIT:
+        bases += [random.randrange(2, n - 1) for _ in range(rounds)]
+    for a in bases:
+        x = pow(a, d, n)
+        if x in (1, n - 1):
+            continue
+        for _ in range(s - 1):
+            x = x * x % n
+            if x == n - 1:
+                break
         else:
-            return gcd(b-a, a)
+            return False
+    return True
+
 
+def gcd(a: int, b: int) -> int:
+    """
+    Euclid's algorithm for determining the greatest common divisor.
+
+    >>> gcd(12, 15)
+    3
+    >>> gcd(3, 7)
+    1
+    """
+    while b:
+        a, b = b, a % b
+    return abs(a)
 
 
 def multiplicative_inverse(e: int, phi: int) -> int:
-  
-    e = e % phi
-    for i in range (1,phi):
-        if e * i % phi == 1:
-            return i
-    return 0
+    """
+    Euclid's extended algorithm for finding the multiplicative
+    inverse of two numbers. Returns 0 if e has no inverse modulo phi.
+
+    >>> multiplicative_inverse(7, 40)
+    23
+    """
+    old_r, r = e % phi, phi
+    old_x, x = 1, 0
+    while r:
+        quotient = old_r // r
+        old_r, r = r, old_r - quotient * r
+        old_x, x = x, old_x - quotient * x
+    if old_r != 1:
+        return 0
+    return old_x % phi
+
+
+def generate_prime(bits: int) -> int:
+    """
+    Returns a random prime of exactly `bits` bits with the two top bits set,
+    so that the product of two such primes has exactly 2 * bits bits.
+    """
+    if bits < 2:
+        raise ValueError("A prime needs at least 2 bits")
+    while True:
+        candidate = secrets.randbits(bits) | (3 << (bits - 2)) | 1
+        if any(candidate % p == 0 for p in _SIEVE_PRIMES) and candidate not in _SIEVE_PRIMES:
+            continue
+        if is_prime(candidate):
+            return candidate
+
+
+class PrivateKey:
+    """
+    Private key (d, n) together with the factors of n and the values
+    precomputed for decryption via the Chinese Remainder Theorem.
+
+    Unpacks and compares like the plain (d, n) tuple.
+
+    >>> key = PrivateKey(169, 17, 19)
+    >>> key == (169, 323)
+    True
+    >>> d, n = key
+    >>> key.power(pow(65, 121, 323))
+    65
+    """
+
+    __slots__ = ("d", "n", "p", "q", "dp", "dq", "qinv")
+
+    def __init__(self, d: int, p: int, q: int) -> None:
+        self.d = d
+        self.n = p * q
+        self.p = p
+        self.q = q
+        self.dp = d % (p - 1)
+        self.dq = d % (q - 1)
+        self.qinv = multiplicative_inverse(q, p)
+
+    def power(self, c: int) -> int:
+        """
+        Computes c ** d mod n with two half-size exponentiations.
+        """
+        m1 = pow(c, self.dp, self.p)
+        m2 = pow(c, self.dq, self.q)
+        h = self.qinv * (m1 - m2) % self.p
+        return m2 + h * self.q
+
+    def __iter__(self) -> tp.Iterator[int]:
+        yield self.d
+        yield self.n
+
+    def __getitem__(self, index: int) -> int:
+        return (self.d, self.n)[index]
+
+    def __len__(self) -> int:
+        return 2
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, PrivateKey):
+            return (self.d, self.n) == (other.d, other.n)
+        if isinstance(other, tuple):
+            return (self.d, self.n) == other
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash((self.d, self.n))
 
+    def __repr__(self) -> str:
+        return f"PrivateKey(d={self.d}, p={self.p}, q={self.q})"
 
-def generate_keypair(p: int, q: int) -> tp.Tuple[tp.Tuple[int, int], tp.Tuple[int, int]]:
+
+Key = tp.Union[tp.Tuple[int, int], PrivateKey]
+
+
+def _power(pk: Key, m: int) -> int:
+    """
+    Raises m to the key's exponent; uses CRT for PrivateKey, plain pow for (key, n) tuples.
+    """
+    if isinstance(pk, PrivateKey):
+        return pk.power(m)
+    key, n = pk
+    return pow(m, key, n)
+
+
+def _large_keypair(bits: int, e: int = 65537) -> tp.Tuple[tp.Tuple[int, int], PrivateKey]:
+    if bits < 16:
+        raise ValueError("Key size must be at least 16 bits")
+    while True:
+        p = generate_prime(bits // 2)
+        q = generate_prime(bits - bits // 2)
+        phi = (p - 1) * (q - 1)
+        if p != q and gcd(e, phi) == 1:
+            break
+    d = multiplicative_inverse(e, phi)
+    return ((e, p * q), PrivateKey(d, p, q))
+
+
+def generate_keypair(
+    p: tp.Optional[int] = None, q: tp.Optional[int] = None, bits: int = 2048
+) -> tp.Tuple[tp.Tuple[int, int], PrivateKey]:
+    """
+    Generates a keypair from the primes p and q, or, if none are given,
+    from two random primes making up a `bits`-bit modulus (with e = 65537).
+    """
+    if p is None and q is None:
+        return _large_keypair(bits)
+    if p is None or q is None:
+        raise ValueError("Either both primes or none of them must be given.")
     if not (is_prime(p) and is_prime(q)):
         raise ValueError("Both numbers must be prime.")
     elif p == q:
@@ -44,7 +203,7 @@ def generate_keypair(p: int, q: int) -> tp.Tuple[tp.Tuple[int, int], tp.Tuple[in
 
     n = p * q
 
-    phi = (p-1) * (q-1)
+    phi = (p - 1) * (q - 1)
 
     e = random.randrange(1, phi)
 
@@ -55,21 +214,71 @@ def generate_keypair(p: int, q: int) -> tp.Tuple[tp.Tuple[int, int], tp.Tuple[in
 
     d = multiplicative_inverse(e, phi)
 
-    return ((e, n), (d, n))
+    return ((e, n), PrivateKey(d, p, q))
 
 
-def encrypt(pk: tp.Tuple[int, int], plaintext: str) -> tp.List[int]:
-    key, n = pk
-    cipher = [(ord(char) ** key) % n for char in plaintext]
+def encrypt(pk: Key, plaintext: str) -> tp.List[int]:
+    cipher = [_power(pk, ord(char)) for char in plaintext]
     return cipher
 
 
-def decrypt(pk: tp.Tuple[int, int], ciphertext: tp.List[int]) -> str:
-    key, n = pk
-    plain = [chr((char ** key) % n) for char in ciphertext]
+def decrypt(pk: Key, ciphertext: tp.List[int]) -> str:
+    plain = [chr(_power(pk, char)) for char in ciphertext]
     return "".join(plain)
 
 
+def block_size(n: int) -> int:
+    """
+    Number of plaintext bytes that fit into one block for the modulus n.
+    One byte of every block is taken by a 0x01 marker that keeps leading zero
+    bytes (and the length of a short last block) intact.
+    """
+    size = n.bit_length() // 8 - 1
+    if size < 1:
+        raise ValueError("Modulus is too small for byte encryption, it needs at least 16 bits")
+    return size
+
+
+def encrypt_bytes(pk: Key, plaintext: bytes) -> bytes:
+    """
+    Encrypts a byte string block by block, one modular exponentiation per block.
+    Every block of ciphertext is a fixed-width big-endian number.
+    """
+    _, n = pk
+    size = block_size(n)
+    width = (n.bit_length() + 7) // 8
+    blocks = []
+    for start in range(0, len(plaintext), size):
+        m = int.from_bytes(b"\x01" + plaintext[start : start + size], "big")
+        blocks.append(_power(pk, m).to_bytes(width, "big"))
+    return b"".join(blocks)
+
+
+def decrypt_bytes(pk: Key, ciphertext: bytes) -> bytes:
+    _, n = pk
+    width = (n.bit_length() + 7) // 8
+    if len(ciphertext) % width:
+        raise ValueError(f"Ciphertext length must be a multiple of {width} bytes")
+    blocks = []
+    for start in range(0, len(ciphertext), width):
+        m = _power(pk, int.from_bytes(ciphertext[start : start + width], "big"))
+        block = m.to_bytes((m.bit_length() + 7) // 8, "big")
+        if block[:1] != b"\x01":
+            raise ValueError("Ciphertext is corrupted or was encrypted with another key")
+        blocks.append(block[1:])
+    return b"".join(blocks)
+
+
+def iter_encrypt(pk: Key, chunks: tp.Iterable[str]) -> tp.Iterator[tp.List[int]]:
+    for chunk in chunks:
+        yield encrypt(pk, chunk)
+
+
+def iter_decrypt(pk: Key, chunks: tp.Iterable[tp.List[int]]) -> tp.Iterator[str]:
+    for chunk in chunks:
+        yield decrypt(pk, chunk)
+
+
 if __name__ == "__main__":
     print("RSA Encrypter/ Decrypter")
     p = int(input("Enter a prime number (17, 19, 23, etc): "))
@@ -0,0 +1,45 @@
+import concurrent.futures
+import random
+import string
+import unittest
+
+import batch
+import caesar
+import rsa
+import vigenere
+
+
+class BatchTestCase(unittest.TestCase):
+    def setUp(self):
+        rnd = random.Random(1234)
+        self.messages = [
+            "".join(rnd.choice(string.ascii_letters + " ") for _ in range(rnd.randint(0, 40)))
+            for _ in range(100)
+        ]
+
+    def test_serial_batch(self):
+        expected = [caesar.encrypt_caesar(m, 5) for m in self.messages]
+        self.assertEqual(expected, batch.encrypt_many("caesar", self.messages, 5))
+
+    def test_parallel_batch_keeps_order(self):
+        ciphertexts = batch.encrypt_many(
+            "vigenere", self.messages, "LEMON", workers=2, chunk_size=7, serial_threshold=0
+        )
+        expected = [vigenere.encrypt_vigenere(m, "LEMON") for m in self.messages]
+        self.assertEqual(expected, ciphertexts)
+        plaintexts = batch.decrypt_many(
+            "vigenere", ciphertexts, "LEMON", workers=2, chunk_size=7, serial_threshold=0
+        )
+        self.assertEqual(self.messages, plaintexts)
+
+    def test_rsa_with_executor(self):
+        public, private = rsa.generate_keypair(bits=256)
+        payloads = [m.encode() for m in self.messages]
+        with concurrent.futures.ProcessPoolExecutor(max_workers=2) as executor:
+            ciphertexts = batch.encrypt_many("rsa-bytes", payloads, public, executor=executor)
+            plaintexts = batch.decrypt_many("rsa-bytes", ciphertexts, private, executor=executor)
+        self.assertEqual(payloads, plaintexts)
+
+    def test_unknown_cipher(self):
+        with self.assertRaises(ValueError):
+            batch.encrypt_many("enigma", self.messages, 1)
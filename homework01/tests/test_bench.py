@@ -0,0 +1,71 @@
+import contextlib
+import io
+import os
+import tempfile
+import unittest
+
+import bench
+import bench.__main__ as bench_main
+
+
+class BenchTestCase(unittest.TestCase):
+    def test_run_reports_throughput_and_latency(self):
+        results = bench.run([1024, 4096], min_repeats=2, min_time=0, pattern="caesar")
+        names = {(r["name"], r["size"]) for r in results["results"]}
+        self.assertEqual(
+            {
+                ("caesar.encrypt", 1024),
+                ("caesar.encrypt", 4096),
+                ("caesar.decrypt", 1024),
+                ("caesar.decrypt", 4096),
+            },
+            names,
+        )
+        for result in results["results"]:
+            self.assertGreater(result["mb_per_s"], 0)
+            self.assertLessEqual(result["p50_ms"], result["p99_ms"])
+            self.assertGreaterEqual(result["repeats"], 2)
+
+    def test_compare_flags_regressions(self):
+        baseline = {
+            "results": [
+                {"name": "a", "size": 1, "mb_per_s": 100.0},
+                {"name": "b", "size": 1, "mb_per_s": 100.0},
+                {"name": "c", "size": 1, "mb_per_s": 100.0},
+            ]
+        }
+        current = {
+            "results": [
+                {"name": "a", "size": 1, "mb_per_s": 95.0},
+                {"name": "b", "size": 1, "mb_per_s": 80.0},
+                {"name": "d", "size": 1, "mb_per_s": 1.0},
+            ]
+        }
+        regressions = bench.compare(current, baseline, threshold=0.1)
+        self.assertEqual([("b", 1)], [(r.name, r.size) for r in regressions])
+        self.assertAlmostEqual(-0.2, regressions[0].change)
+
+    def test_synthetic_text(self):
+        text = bench.synthetic_text(1000)
+        self.assertEqual(1000, len(text))
+        self.assertEqual(text, bench.synthetic_text(1000))
+        self.assertTrue(text.isascii())
+
+    def test_baseline_is_committed_next_to_the_package(self):
+        self.assertEqual(os.path.dirname(bench.__file__), os.path.dirname(bench.BASELINE_PATH))
+        self.assertTrue(bench.load(bench.BASELINE_PATH)["results"])
+
+    def test_compare_reports_missing_or_corrupt_baseline(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            results = os.path.join(tmp, "results.json")
+            bench.save({"results": []}, results)
+            corrupt = os.path.join(tmp, "corrupt.json")
+            with open(corrupt, "w") as f:
+                f.write("{")
+            for baseline in (os.path.join(tmp, "missing.json"), corrupt):
+                with self.subTest(baseline=baseline):
+                    stderr = io.StringIO()
+                    with contextlib.redirect_stderr(stderr):
+                        code = bench_main.main(["compare", results, "--baseline", baseline])
+                    self.assertEqual(2, code)
+                    self.assertIn("Cannot read baseline", stderr.getvalue())
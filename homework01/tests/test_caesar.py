@@ -42,6 +42,11 @@ class CaesarTestCase(unittest.TestCase):
             with self.subTest(case=i, chiphertext=chiphertext, plaintext=plaintext):
                 self.assertEqual(plaintext, caesar.decrypt_caesar(chiphertext, shift=shift))
 
+    def test_shift_is_taken_modulo_alphabet_size(self):
+        self.assertEqual("Cheud, ёж", caesar.encrypt_caesar("Zebra, ёж", shift=29))
+        self.assertEqual("Ydaqz", caesar.encrypt_caesar("Zebra", shift=-27))
+        self.assertEqual("Zebra", caesar.decrypt_caesar("Ydaqz", shift=-27))
+
     def test_randomized(self):
         shift = random.randint(8, 24)
         plaintext = "".join(random.choice(string.ascii_letters + " -,") for _ in range(64))
@@ -51,3 +56,19 @@ class CaesarTestCase(unittest.TestCase):
             caesar.decrypt_caesar(ciphertext, shift=shift),
             msg=f"shift={shift}, ciphertext={ciphertext}",
         )
+
+    def test_breaker_picks_the_best_shift(self):
+        plaintext = "the quick brown fox jumps over the lazy dog and python is a language " * 10
+        dictionary = {"the", "quick", "fox", "python", "language"}
+        for shift in (0, 5, 13, 25):
+            with self.subTest(shift=shift):
+                ciphertext = caesar.encrypt_caesar(plaintext, shift=shift)
+                self.assertEqual(shift, caesar.caesar_breaker(ciphertext, dictionary))
+
+    def test_rank_caesar_shifts_without_dictionary(self):
+        plaintext = "It was the best of times, it was the worst of times, it was the age of wisdom"
+        ranked = caesar.rank_caesar_shifts(caesar.encrypt_caesar(plaintext, shift=11))
+        self.assertEqual(11, ranked[0][0])
+        self.assertEqual(26, len(ranked))
+        self.assertEqual(list(range(26)), sorted(shift for shift, _ in ranked))
+        self.assertAlmostEqual(1.0, sum(confidence for _, confidence in ranked))
@@ -0,0 +1,40 @@
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+
+HOMEWORK_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def run_cli(*args: str, data: str) -> str:
+    result = subprocess.run(
+        [sys.executable, HOMEWORK_DIR, *args],
+        input=data.encode("utf-8"),
+        stdout=subprocess.PIPE,
+        check=True,
+    )
+    return result.stdout.decode("utf-8")
+
+
+class CliTestCase(unittest.TestCase):
+    def test_vigenere_roundtrip_in_small_chunks(self):
+        plaintext = "attack at dawn\r\nПривет, World!\n" * 20
+        ciphertext = run_cli("vigenere", "encrypt", "--key", "LEMON", "--chunk-size", "7", data=plaintext)
+        self.assertEqual(plaintext, run_cli("vigenere", "decrypt", "--key", "LEMON", data=ciphertext))
+
+    def test_caesar_files(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            src = os.path.join(tmp, "plain.txt")
+            dst = os.path.join(tmp, "cipher.txt")
+            with open(src, "w") as f:
+                f.write("Python3.6\n")
+            run_cli("caesar", "encrypt", "-i", src, "-o", dst, data="")
+            with open(dst) as f:
+                self.assertEqual("Sbwkrq3.6\n", f.read())
+
+    def test_rsa_roundtrip(self):
+        plaintext = "Hello, world!\n" * 10
+        ciphertext = run_cli("rsa", "encrypt", "--key", "121,323", "--chunk-size", "5", data=plaintext)
+        decrypted = run_cli("rsa", "decrypt", "--key", "169,323", "--chunk-size", "3", data=ciphertext)
+        self.assertEqual(plaintext, decrypted)
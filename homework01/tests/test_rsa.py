@@ -16,6 +16,12 @@ class RSATestCase(unittest.TestCase):
         self.assertFalse(rsa.is_prime(8))
         self.assertTrue(rsa.is_prime(3571))
 
+    def test_is_prime_large(self):
+        self.assertTrue(rsa.is_prime(2 ** 127 - 1))
+        self.assertFalse(rsa.is_prime(2 ** 128 + 1))
+        self.assertFalse(rsa.is_prime(3215031751))  # strong pseudoprime to bases 2, 3, 5, 7
+        self.assertFalse(rsa.is_prime((2 ** 61 - 1) * (2 ** 89 - 1)))
+
     def test_gcd(self):
         self.assertEqual(0, rsa.gcd(0, 0))
         self.assertEqual(1, rsa.gcd(3, 7))
@@ -42,3 +48,52 @@ class RSATestCase(unittest.TestCase):
         self.assertEqual(
             ((9678731, 11188147), (1804547, 11188147)), rsa.generate_keypair(3259, 3433)
         )
+
+    def test_multiplicative_inverse_does_not_exist(self):
+        self.assertEqual(0, rsa.multiplicative_inverse(6, 9))
+
+    def test_generate_large_keypair(self):
+        public, private = rsa.generate_keypair(bits=512)
+        self.assertEqual(65537, public[0])
+        self.assertEqual(512, public[1].bit_length())
+        self.assertEqual(public[1], private[1])
+        message = "RSA with big primes"
+        self.assertEqual(message, rsa.decrypt(private, rsa.encrypt(public, message)))
+
+    def test_generate_prime(self):
+        for bits in (8, 64, 256):
+            with self.subTest(bits=bits):
+                prime = rsa.generate_prime(bits)
+                self.assertEqual(bits, prime.bit_length())
+                self.assertTrue(rsa.is_prime(prime))
+
+    def test_encrypt_bytes(self):
+        public, private = rsa.generate_keypair(bits=256)
+        size = rsa.block_size(public[1])
+        width = 256 // 8
+        for length in (0, 1, size - 1, size, size + 1, 10 * size + 3):
+            with self.subTest(length=length):
+                plaintext = b"\x00\x00" + bytes(random.getrandbits(8) for _ in range(length))
+                ciphertext = rsa.encrypt_bytes(public, plaintext)
+                blocks = -(-len(plaintext) // size)
+                self.assertEqual(blocks * width, len(ciphertext))
+                self.assertEqual(plaintext, rsa.decrypt_bytes(private, ciphertext))
+
+    def test_decrypt_bytes_with_wrong_length(self):
+        public, private = rsa.generate_keypair(bits=256)
+        with self.assertRaises(ValueError):
+            rsa.decrypt_bytes(private, b"\x00" * 31)
+
+    def test_block_size_of_toy_key(self):
+        with self.assertRaises(ValueError):
+            rsa.block_size(323)
+
+    def test_private_key_uses_crt(self):
+        public, private = rsa.generate_keypair(bits=512)
+        self.assertIsInstance(private, rsa.PrivateKey)
+        self.assertEqual(private.n, private.p * private.q)
+        plaintext = bytes(range(256)) * 3
+        ciphertext = rsa.encrypt_bytes(public, plaintext)
+        self.assertEqual(plaintext, rsa.decrypt_bytes(private, ciphertext))
+        self.assertEqual(plaintext, rsa.decrypt_bytes(tuple(private), ciphertext))
+        self.assertEqual("Hi!", rsa.decrypt(private, rsa.encrypt(public, "Hi!")))
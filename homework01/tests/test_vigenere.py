@@ -2,6 +2,7 @@ import random
 import string
 import unittest
 
+import caesar
 import vigenere
 
 
@@ -34,9 +35,38 @@ class VigenereTestCase(unittest.TestCase):
             ):
                 self.assertEqual(plaintext, vigenere.decrypt_vigenere(chiphertext, keyword))
 
+    def test_non_ascii_text(self):
+        plaintext = "Привет, World! ATTACK"
+        ciphertext = vigenere.encrypt_vigenere(plaintext, "LEMON")
+        self.assertEqual("Привет, Kbcpp! LXFOPV", ciphertext)
+        self.assertEqual(plaintext, vigenere.decrypt_vigenere(ciphertext, "LEMON"))
+
+    def test_non_letter_keyword_characters_skip_text(self):
+        self.assertEqual("lxmqx e rnhr", vigenere.encrypt_vigenere("attack at dawn", "le-mon"))
+        self.assertEqual("ppoox w pnlj", vigenere.decrypt_vigenere("attack at dawn", "le-mon"))
+
     def test_randomized(self):
         kwlen = random.randint(4, 24)
         keyword = ''.join(random.choice(string.ascii_letters) for _ in range(kwlen))
         plaintext = ''.join(random.choice(string.ascii_letters + ' -,') for _ in range(64))
         ciphertext = vigenere.encrypt_vigenere(plaintext, keyword)
         self.assertEqual(plaintext, vigenere.decrypt_vigenere(ciphertext, keyword))
+
+    def test_stream_matches_whole_text(self):
+        keyword = "LeMoN"
+        plaintext = "".join(random.choice(string.ascii_letters + " -,") for _ in range(1000))
+        chunks = [plaintext[i : i + 37] for i in range(0, len(plaintext), 37)]
+        ciphertext = "".join(vigenere.iter_encrypt_vigenere(chunks, keyword))
+        self.assertEqual(vigenere.encrypt_vigenere(plaintext, keyword), ciphertext)
+        chunks = [ciphertext[i : i + 50] for i in range(0, len(ciphertext), 50)]
+        self.assertEqual(plaintext, "".join(vigenere.iter_decrypt_vigenere(chunks, keyword)))
+
+    def test_break_vigenere(self):
+        rnd = random.Random(2021)
+        weights = list(caesar.ENGLISH_FREQUENCIES)
+        plaintext = "".join(rnd.choices(string.ascii_lowercase, weights=weights, k=5000))
+        for kwlen in (1, 3, 7, 12):
+            keyword = "".join(rnd.choice(string.ascii_uppercase) for _ in range(kwlen))
+            with self.subTest(keyword=keyword):
+                ciphertext = vigenere.encrypt_vigenere(plaintext, keyword)
+                self.assertEqual(keyword, vigenere.break_vigenere(ciphertext, max_key_len=20))
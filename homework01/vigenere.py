@@ -1,3 +1,91 @@
+import typing as tp
+
+import numpy as np  # type: ignore
+
+from caesar import ENGLISH_FREQUENCIES
+
+_UPPER_A, _UPPER_Z, _LOWER_A, _LOWER_Z = ord("A"), ord("Z"), ord("a"), ord("z")
+_BLOCK_SIZE = 1 << 22
+
+
+def _key_shifts(keyword: str) -> np.ndarray:
+    """
+    Converts a keyword into an array of shifts; non-letter characters get -1.
+    """
+    codes = np.array([ord(c) for c in keyword], dtype=np.int64)
+    shifts = np.full(len(codes), -1, dtype=np.int64)
+    upper = (codes >= _UPPER_A) & (codes <= _UPPER_Z)
+    lower = (codes >= _LOWER_A) & (codes <= _LOWER_Z)
+    shifts[upper] = codes[upper] - _UPPER_A
+    shifts[lower] = codes[lower] - _LOWER_A
+    return shifts
+
+
+def _key_positions(size: int, key: np.ndarray, offset: int) -> np.ndarray:
+    """
+    Index of the key character applied to each of `size` codes, starting at `offset`.
+    """
+    return (np.arange(offset, offset + size, dtype=np.int64)) % len(key)
+
+
+def _shift_codes(codes: np.ndarray, key: np.ndarray, sign: int, offset: int = 0) -> np.ndarray:
+    """
+    Applies the key cyclically to an array of character codes of any width.
+
+    `offset` is the position of the first code in the whole message, so the key
+    stays aligned when a message is processed piece by piece. Codes under a
+    non-letter key character are dropped, as the character-wise cipher does.
+    """
+    codes = codes.astype(np.int64)
+    shifts = key[_key_positions(len(codes), key, offset)]
+    upper = (codes >= _UPPER_A) & (codes <= _UPPER_Z)
+    lower = (codes >= _LOWER_A) & (codes <= _LOWER_Z)
+    base = np.where(upper, _UPPER_A, _LOWER_A)
+    shifted = (codes - base + sign * shifts) % 26 + base
+    result = np.where(upper | lower, shifted, codes)
+    keep = shifts >= 0
+    if not keep.all():
+        result = result[keep]
+    return result
+
+
+def _shift_bytes(codes: np.ndarray, key: np.ndarray, sign: int, offset: int = 0) -> np.ndarray:
+    """
+    Same as `_shift_codes` for uint8 codes, but through a (len(key), 256) lookup table.
+    """
+    alphabet = np.arange(26, dtype=np.int64)
+    table = np.tile(np.arange(256, dtype=np.uint8), (len(key), 1))
+    rotated = ((alphabet[None, :] + sign * key[:, None]) % 26).astype(np.uint8)
+    table[:, _UPPER_A : _UPPER_Z + 1] = rotated + _UPPER_A
+    table[:, _LOWER_A : _LOWER_Z + 1] = rotated + _LOWER_A
+    positions = _key_positions(len(codes), key, offset)
+    result = table.ravel()[positions * 256 + codes]
+    if (key < 0).any():
+        result = result[key[positions] >= 0]
+    return result
+
+
+def _vigenere(text: str, keyword: str, sign: int, offset: int = 0) -> str:
+    if not text:
+        return ""
+    if not keyword:
+        raise ValueError("Keyword must not be empty")
+    key = _key_shifts(keyword)
+    if text.isascii():
+        codes = np.frombuffer(text.encode("ascii"), dtype=np.uint8)
+        shift, encoding = _shift_bytes, "ascii"
+    else:
+        codes = np.frombuffer(text.encode("utf-32-le"), dtype=np.uint32)
+        shift, encoding = _shift_codes, "utf-32-le"
+    # Long texts go in blocks to bound the size of the int64 temporaries;
+    # each block is cast back to the width of the codes it was read from
+    parts = []
+    for start in range(0, len(codes), _BLOCK_SIZE):
+        block = codes[start : start + _BLOCK_SIZE]
+        parts.append(shift(block, key, sign, offset + start).astype(codes.dtype).tobytes())
+    return b"".join(parts).decode(encoding)
+
+
 def encrypt_vigenere(plaintext: str, keyword: str) -> str:
     """
     Encrypts plaintext using a Vigenere cipher.
@@ -9,30 +97,7 @@ def encrypt_vigenere(plaintext: str, keyword: str) -> str:
     >>> encrypt_vigenere("ATTACKATDAWN", "LEMON")
     'LXFOPVEFRNHR'
     """
-    ciphertext = ""
-
-    for i in range(len(plaintext)):   
-        c = i % len(keyword)
-        if ord('A') <= ord(keyword[c]) <= ord('Z'):
-            shift = ord(keyword[c]) - ord('A') 
-        elif ord('a') <= ord(keyword[c]) <= ord('z'):
-            shift = ord(keyword[c]) - ord('a')
-        else: continue
-
-        if ord('A') <= ord(plaintext[i]) <= ord('Z'):
-            if ord('Z') - ord(plaintext[i]) < shift:
-               ciphertext += chr(ord('A') - 1 + (shift - ord('Z') + ord(plaintext[i])))
-            else:
-                ciphertext += chr(ord(plaintext[i]) + shift)
-
-        elif ord('a') <= ord(plaintext[i]) <= ord('z'):
-            if ord('z') - ord(plaintext[i]) < shift:
-               ciphertext += chr(ord('a') - 1 + (shift-ord('z') + ord(plaintext[i])))
-            else:
-                ciphertext += chr(ord(plaintext[i]) + shift)
-        else:
-            ciphertext += plaintext[i]
-    return ciphertext
+    return _vigenere(plaintext, keyword, 1)
 
 
 def decrypt_vigenere(ciphertext: str, keyword: str) -> str:
@@ -46,27 +111,117 @@ def decrypt_vigenere(ciphertext: str, keyword: str) -> str:
     >>> decrypt_vigenere("LXFOPVEFRNHR", "LEMON")
     'ATTACKATDAWN'
     """
-    plaintext = ""
-
-    for i in range (len(ciphertext)):
-        c = i % len(keyword)
-        if ord('A') <= ord(keyword[c]) <= ord('Z'):
-            shift = ord(keyword[c]) - ord('A') 
-        elif ord('a') <= ord(keyword[c]) <= ord('z'):
-            shift = ord(keyword[c]) - ord('a')
-        else: continue
-            
-        if ord('A') <=ord (ciphertext[i]) <= ord('Z'):
-            if ord(ciphertext[i]) - shift < ord('A'):
-                plaintext += chr(ord('Z') + 1 - (shift - (ord(ciphertext[i]) - ord('A'))))
-            else:
-                 plaintext += chr(ord(ciphertext[i]) - shift)
-    
-        elif ord('a') <= ord(ciphertext[i]) <= ord('z'):
-            if ord(ciphertext[i]) - shift < ord('a'):
-                plaintext += chr(ord('z') + 1 - (shift - (ord(ciphertext[i]) - ord('a'))))
-            else:
-                 plaintext += chr(ord(ciphertext[i]) - shift)
-        else:
-            plaintext += ciphertext[i]
-    return plaintext
\ No newline at end of file
+    return _vigenere(ciphertext, keyword, -1)
+
+
+def _iter_vigenere(chunks: tp.Iterable[str], keyword: str, sign: int) -> tp.Iterator[str]:
+    offset = 0
+    for chunk in chunks:
+        yield _vigenere(chunk, keyword, sign, offset)
+        offset = (offset + len(chunk)) % len(keyword)
+
+
+def iter_encrypt_vigenere(chunks: tp.Iterable[str], keyword: str) -> tp.Iterator[str]:
+    """
+    Encrypts a stream of text chunks using a Vigenere cipher.
+
+    The key position is carried across chunk boundaries, so the joined output
+    is the same as encrypting the joined input at once.
+
+    >>> list(iter_encrypt_vigenere(["ATTA", "CKATDAWN"], "LEMON"))
+    ['LXFO', 'PVEFRNHR']
+    """
+    return _iter_vigenere(chunks, keyword, 1)
+
+
+def iter_decrypt_vigenere(chunks: tp.Iterable[str], keyword: str) -> tp.Iterator[str]:
+    """
+    Decrypts a stream of text chunks using a Vigenere cipher.
+
+    >>> list(iter_decrypt_vigenere(["LXFO", "PVEFRNHR"], "LEMON"))
+    ['ATTA', 'CKATDAWN']
+    """
+    return _iter_vigenere(chunks, keyword, -1)
+
+
+def _letters_with_positions(text: str) -> tp.Tuple[np.ndarray, np.ndarray]:
+    """
+    Returns the letters of text as numbers 0..25 and their positions in text.
+    """
+    if text.isascii():
+        codes = np.frombuffer(text.encode("ascii"), dtype=np.uint8).astype(np.int64)
+    else:
+        codes = np.frombuffer(text.encode("utf-32-le"), dtype=np.uint32).astype(np.int64)
+    upper = (codes >= _UPPER_A) & (codes <= _UPPER_Z)
+    lower = (codes >= _LOWER_A) & (codes <= _LOWER_Z)
+    positions = np.flatnonzero(upper | lower)
+    letters = np.where(upper, codes - _UPPER_A, codes - _LOWER_A)[positions]
+    return letters, positions
+
+
+def _column_histograms(letters: np.ndarray, positions: np.ndarray, key_len: int) -> np.ndarray:
+    """
+    Letter histograms of the key_len columns of the text: an array of shape (key_len, 26).
+    """
+    columns = positions % key_len
+    counts = np.bincount(columns * 26 + letters, minlength=key_len * 26)
+    return counts.reshape(key_len, 26)
+
+
+def index_of_coincidence(histograms: np.ndarray) -> float:
+    """
+    Mean index of coincidence over the rows of a (columns, 26) histogram array.
+    """
+    sizes = histograms.sum(axis=1)
+    usable = sizes > 1
+    if not usable.any():
+        return 0.0
+    pairs = (histograms * (histograms - 1)).sum(axis=1)[usable]
+    return float((pairs / (sizes[usable] * (sizes[usable] - 1))).mean())
+
+
+def _best_shifts(histograms: np.ndarray) -> np.ndarray:
+    """
+    For every column picks the shift whose decryption is closest to English (chi-squared).
+    """
+    shifts = np.arange(26)
+    observed = histograms[:, (shifts[:, None] + shifts[None, :]) % 26]
+    expected = histograms.sum(axis=1)[:, None, None] * ENGLISH_FREQUENCIES + 1e-9
+    chi_squared = ((observed - expected) ** 2 / expected).sum(axis=2)
+    return chi_squared.argmin(axis=1)
+
+
+def break_vigenere(ciphertext: str, max_key_len: int = 20) -> str:
+    """
+    Recovers the keyword of a Vigenere ciphertext.
+
+    The key length is the shortest one whose columns have an index of
+    coincidence close to the best found (multiples of the true length score
+    about the same), then every key letter is found by frequency analysis.
+
+    >>> plaintext = (
+    ...     "it is a truth universally acknowledged that a single man in possession of a good "
+    ...     "fortune must be in want of a wife however little known the feelings or views of such "
+    ...     "a man may be on his first entering a neighbourhood this truth is so well fixed in the "
+    ...     "minds of the surrounding families that he is considered as the rightful property of "
+    ...     "some one or other of their daughters"
+    ... )
+    >>> break_vigenere(encrypt_vigenere(plaintext, "LEMON"))
+    'LEMON'
+    """
+    letters, positions = _letters_with_positions(ciphertext)
+    if not len(letters):
+        return ""
+
+    scores = []
+    for key_len in range(1, max_key_len + 1):
+        scores.append(index_of_coincidence(_column_histograms(letters, positions, key_len)))
+    best = max(scores)
+    key_len = next(i for i, score in enumerate(scores, 1) if score >= 0.9 * best)
+
+    shifts = _best_shifts(_column_histograms(letters, positions, key_len))
+    key = "".join(chr(_UPPER_A + shift) for shift in shifts)
+    for period in range(1, key_len):
+        if key_len % period == 0 and key == key[:period] * (key_len // period):
+            return key[:period]
+    return key
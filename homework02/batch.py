@@ -0,0 +1,300 @@
+"""
+Пакетное решение Судоку: по одному пазлу в строке, 81 символ
+(цифры 1-9, пустые клетки - '.' или '0').
+
+    $ python batch.py puzzles.txt -o solutions.txt --workers 4
+    $ cat puzzles.txt | python batch.py > solutions.txt
+
+Пазлы читаются потоком и решаются порциями в пуле процессов, решения выводятся
+в том же порядке (для пазла без решения - строка 'unsolvable', для строки
+неверного формата - 'invalid'). Сводка по скорости печатается в stderr,
+с --stats к ней добавляется статистика перебора (см. solver.SolverStats).
+"""
+
+import argparse
+import collections
+import concurrent.futures
+import itertools
+import math
+import os
+import sys
+import time
+from typing import Deque, Dict, Iterable, Iterator, List, Optional, TextIO, Tuple
+
+import solver
+
+UNSOLVABLE = "unsolvable"
+INVALID = "invalid"
+
+# Таблица состояний перебора этого процесса (у каждого процесса пула - своя)
+_cache: Optional[solver.TranspositionTable] = None
+
+ChunkResult = Tuple[
+    List[Tuple[str, float]],
+    Optional[solver.SolverStats],
+    Optional[Tuple[int, solver.CacheInfo]],
+]
+
+
+def parse_line(line: str) -> Optional[List[int]]:
+    """
+    >>> parse_line('.' * 80 + '9')[-2:]
+    [0, 9]
+    >>> parse_line('123') is None
+    True
+    """
+    if len(line) != 81:
+        return None
+    values = []
+    for char in line:
+        if char in ".0":
+            values.append(0)
+        elif "1" <= char <= "9":
+            values.append(ord(char) - ord("0"))
+        else:
+            return None
+    return values
+
+
+def solve_line(
+    line: str,
+    stats: Optional[solver.SolverStats] = None,
+    cache: Optional[solver.TranspositionTable] = None,
+) -> str:
+    values = parse_line(line)
+    if values is None:
+        return INVALID
+    solution = solver.solve_values(values, stats=stats, cache=cache)
+    if solution is None:
+        return UNSOLVABLE
+    return "".join(map(str, solution))
+
+
+def _init_cache(size: int) -> None:
+    global _cache
+    _cache = solver.TranspositionTable(size) if size > 0 else None
+
+
+def _solve_chunk(lines: List[str], collect_stats: bool = False) -> ChunkResult:
+    """
+    Решает порцию пазлов; кроме решений возвращает статистику перебора порции
+    и накопленное состояние таблицы этого процесса вместе с его pid.
+    """
+    stats = solver.SolverStats() if collect_stats else None
+    results = []
+    for line in lines:
+        started = time.perf_counter()
+        solution = solve_line(line, stats, _cache)
+        results.append((solution, time.perf_counter() - started))
+    cache_info = None if _cache is None else (os.getpid(), _cache.info())
+    return results, stats, cache_info
+
+
+def total_cache_info(infos: Iterable[solver.CacheInfo]) -> solver.CacheInfo:
+    """Сводка по таблицам всех процессов"""
+    totals = [0] * len(solver.CacheInfo._fields)
+    for info in infos:
+        totals = [total + value for total, value in zip(totals, info)]
+    return solver.CacheInfo(*totals)
+
+
+class LatencyHistogram:
+    """
+    Гистограмма времени решения с корзинами по степеням двойки микросекунд:
+    корзина k содержит времена из [2**(k-1), 2**k) мкс.
+    """
+
+    def __init__(self) -> None:
+        self.buckets: List[int] = []
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def add(self, seconds: float) -> None:
+        bucket = max(0, math.ceil(math.log2(seconds * 1e6))) if seconds > 0 else 0
+        while len(self.buckets) <= bucket:
+            self.buckets.append(0)
+        self.buckets[bucket] += 1
+        self.count += 1
+        self.total += seconds
+        self.max = max(self.max, seconds)
+
+    def percentile(self, q: float) -> float:
+        """Верхняя граница корзины, в которую попадает q-й перцентиль, в секундах"""
+        rank = max(1, math.ceil(q / 100 * self.count))
+        seen = 0
+        for bucket, count in enumerate(self.buckets):
+            seen += count
+            if seen >= rank:
+                return min(2**bucket / 1e6, self.max)
+        return self.max
+
+    def format(self, width: int = 40) -> str:
+        lines = []
+        peak = max(self.buckets, default=0)
+        for bucket, count in enumerate(self.buckets):
+            if not count:
+                continue
+            bar = "#" * max(1, round(width * count / peak))
+            lines.append(f"  <= {_format_seconds(2 ** bucket / 1e6):>9} {count:>10} {bar}")
+        return "\n".join(lines)
+
+
+def _format_seconds(seconds: float) -> str:
+    if seconds < 1e-3:
+        return f"{seconds * 1e6:.0f} us"
+    if seconds < 1:
+        return f"{seconds * 1e3:.1f} ms"
+    return f"{seconds:.2f} s"
+
+
+def _chunks(lines: Iterable[str], size: int) -> Iterator[List[str]]:
+    iterator = iter(lines)
+    while True:
+        chunk = list(itertools.islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def solve_stream(
+    lines: Iterable[str],
+    workers: int = 1,
+    chunk_size: int = 256,
+    max_pending: int = 0,
+    stats: Optional[solver.SolverStats] = None,
+    cache_size: int = 0,
+    caches: Optional[Dict[int, solver.CacheInfo]] = None,
+) -> Iterator[Tuple[str, float]]:
+    """
+    Решает пазлы из lines, возвращая пары (решение, время решения) в исходном порядке.
+    Пустые строки пропускаются. В работе одновременно не больше max_pending порций
+    (по умолчанию 4 на процесс), поэтому память не зависит от длины входа.
+    Если передан stats, в него добавляется статистика перебора всех пазлов.
+
+    С cache_size > 0 каждый процесс хранит LRU-таблицу из cache_size состояний
+    перебора (solver.TranspositionTable) на всё время работы; в caches
+    записывается последнее состояние таблицы каждого процесса по его pid.
+    """
+    puzzles = (line.strip() for line in lines)
+    chunks = _chunks((line for line in puzzles if line), chunk_size)
+    collect_stats = stats is not None
+
+    def results(chunk: ChunkResult) -> List[Tuple[str, float]]:
+        solutions, chunk_stats, cache_info = chunk
+        if stats is not None and chunk_stats is not None:
+            stats.merge(chunk_stats)
+        if caches is not None and cache_info is not None:
+            caches[cache_info[0]] = cache_info[1]
+        return solutions
+
+    if workers <= 1:
+        _init_cache(cache_size)
+        try:
+            for chunk in chunks:
+                yield from results(_solve_chunk(chunk, collect_stats))
+        finally:
+            _init_cache(0)
+        return
+
+    max_pending = max_pending or 4 * workers
+    with concurrent.futures.ProcessPoolExecutor(
+        max_workers=workers, initializer=_init_cache, initargs=(cache_size,)
+    ) as pool:
+        pending: Deque[concurrent.futures.Future] = collections.deque()
+        for chunk in chunks:
+            pending.append(pool.submit(_solve_chunk, chunk, collect_stats))
+            if len(pending) >= max_pending:
+                yield from results(pending.popleft().result())
+        while pending:
+            yield from results(pending.popleft().result())
+
+
+def run(
+    src: TextIO,
+    dst: TextIO,
+    workers: int = 1,
+    chunk_size: int = 256,
+    stats: Optional[solver.SolverStats] = None,
+    cache_size: int = 0,
+    caches: Optional[Dict[int, solver.CacheInfo]] = None,
+) -> Tuple[LatencyHistogram, float]:
+    """Решает все пазлы из src, пишет решения в dst; возвращает гистограмму и общее время"""
+    histogram = LatencyHistogram()
+    started = time.perf_counter()
+    solutions = solve_stream(
+        src,
+        workers=workers,
+        chunk_size=chunk_size,
+        stats=stats,
+        cache_size=cache_size,
+        caches=caches,
+    )
+    for solution, seconds in solutions:
+        dst.write(solution)
+        dst.write("\n")
+        histogram.add(seconds)
+    return histogram, time.perf_counter() - started
+
+
+def report(histogram: LatencyHistogram, elapsed: float) -> str:
+    rate = histogram.count / elapsed if elapsed > 0 else 0.0
+    lines = [
+        f"Solved {histogram.count} puzzles in {elapsed:.2f} s ({rate:.1f} puzzles/s)",
+        "Latency: "
+        + ", ".join(f"p{q} {_format_seconds(histogram.percentile(q))}" for q in (50, 90, 99))
+        + f", max {_format_seconds(histogram.max)}",
+    ]
+    if histogram.count:
+        lines.append(histogram.format())
+    return "\n".join(lines)
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Solve sudoku puzzles, one per line.")
+    parser.add_argument("input", nargs="?", help="Puzzle file (default: stdin)")
+    parser.add_argument("-o", "--output", help="Solution file (default: stdout)")
+    parser.add_argument(
+        "-w", "--workers", type=int, default=1, help="Worker processes (default: 1)"
+    )
+    parser.add_argument(
+        "--chunk-size", type=int, default=256, help="Puzzles per task (default: 256)"
+    )
+    parser.add_argument("--stats", action="store_true", help="Collect and print search statistics")
+    parser.add_argument(
+        "--cache",
+        type=int,
+        default=0,
+        metavar="ENTRIES",
+        help="Size of the per-process transposition table (default: 0, disabled)",
+    )
+    args = parser.parse_args(argv)
+    stats = solver.SolverStats() if args.stats else None
+    caches: Dict[int, solver.CacheInfo] = {}
+
+    src = open(args.input) if args.input else sys.stdin
+    dst = open(args.output, "w") if args.output else sys.stdout
+    try:
+        histogram, elapsed = run(
+            src,
+            dst,
+            workers=args.workers,
+            chunk_size=args.chunk_size,
+            stats=stats,
+            cache_size=args.cache,
+            caches=caches,
+        )
+    finally:
+        if args.input:
+            src.close()
+        if args.output:
+            dst.close()
+    print(report(histogram, elapsed), file=sys.stderr)
+    if stats is not None:
+        print(stats.format(), file=sys.stderr)
+    if caches:
+        print(total_cache_info(caches.values()).format(), file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
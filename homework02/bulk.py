@@ -0,0 +1,126 @@
+"""
+Массовая проверка решений Судоку на NumPy.
+
+Пачка полей - массив (N, 9, 9) типа uint8 (0 - пустая клетка).
+
+    $ python bulk.py solutions.txt
+    10000 solutions, 10000 valid
+
+    >>> parse_puzzles(b'53..7....')
+    Traceback (most recent call last):
+    ...
+    ValueError: Line 1 has 9 characters, expected 81
+    >>> batch = parse_puzzles(b'.' * 81 + b'\\n\\n' + b'123456789' * 9)
+    >>> batch.shape
+    (2, 9, 9)
+    >>> check_solutions(batch).tolist()
+    [False, False]
+"""
+
+import argparse
+from typing import List, Optional
+
+import numpy as np  # type: ignore
+
+# Цифра каждого байта строки; 255 - недопустимый символ
+_DIGIT_OF_BYTE = np.full(256, 255, dtype=np.uint8)
+_DIGIT_OF_BYTE[ord(".")] = 0
+_DIGIT_OF_BYTE[ord("0") : ord("9") + 1] = np.arange(10, dtype=np.uint8)
+# Маска единиц по цифрам 1..9, 0 и всё, что больше 9, дают 0
+_BIT_OF_DIGIT = np.zeros(256, dtype=np.uint16)
+_BIT_OF_DIGIT[1:10] = 1 << np.arange(1, 10, dtype=np.uint16)
+ALL_DIGITS = 0x3FE
+_CHUNK = 1 << 14
+
+
+def parse_puzzles(data: bytes) -> np.ndarray:
+    """
+    Разбирает текст из строк по 81 символу (цифры, '.' или '0') в массив (N, 9, 9).
+    Пустые строки пропускаются, строка другой длины или с посторонним символом -
+    ValueError. Строки ищутся и переводятся в цифры целиком средствами NumPy.
+    """
+    raw = np.frombuffer(data, dtype=np.uint8)
+    raw = raw[raw != ord("\r")]
+    ends = np.flatnonzero(raw == ord("\n"))
+    if len(raw) and raw[-1] != ord("\n"):
+        ends = np.append(ends, len(raw))
+    starts = np.concatenate(([0], ends[:-1] + 1))
+    lengths = ends - starts
+    bad = np.flatnonzero((lengths != 0) & (lengths != 81))
+    if len(bad):
+        line = int(bad[0])
+        raise ValueError(f"Line {line + 1} has {lengths[line]} characters, expected 81")
+
+    starts = starts[lengths == 81]
+    cells = np.empty((len(starts), 81), dtype=np.uint8)
+    # Индексы байтов строятся порциями, чтобы не держать массив (N, 81) int64
+    offsets = np.arange(81)
+    for start in range(0, len(starts), _CHUNK):
+        chunk = starts[start : start + _CHUNK]
+        cells[start : start + len(chunk)] = _DIGIT_OF_BYTE[raw[chunk[:, None] + offsets]]
+    bad = np.flatnonzero((cells == 255).any(axis=1))
+    if len(bad):
+        raise ValueError(f"Puzzle {int(bad[0]) + 1} contains an unexpected character")
+    return cells.reshape(-1, 9, 9)
+
+
+def load_puzzles(filename: str) -> np.ndarray:
+    """Читает файл с пазлами или решениями (по одному в строке) в массив (N, 9, 9)"""
+    with open(filename, "rb") as f:
+        return parse_puzzles(f.read())
+
+
+def check_solutions(batch: np.ndarray) -> np.ndarray:
+    """
+    Проверяет все решения пачки (N, 9, 9) сразу: в каждой строке, столбце и
+    квадрате должны встретиться все цифры 1..9. Возвращает булев массив длины N.
+
+    Каждая цифра d заменяется битом 1 << d, и OR девяти клеток группы равен
+    0b1111111110 только тогда, когда все цифры разные и пустых клеток нет.
+    """
+    batch = np.asarray(batch)
+    if batch.ndim != 3 or batch.shape[1:] != (9, 9):
+        raise ValueError(f"Expected an (N, 9, 9) array, got shape {batch.shape}")
+    if not np.issubdtype(batch.dtype, np.integer):
+        raise ValueError(f"Expected an integer array, got {batch.dtype}")
+    valid = np.empty(len(batch), dtype=bool)
+    # Порциями, чтобы промежуточные массивы помещались в кэш процессора
+    for start in range(0, len(batch), _CHUNK):
+        valid[start : start + _CHUNK] = _check_chunk(batch[start : start + _CHUNK])
+    return valid
+
+
+def _check_chunk(batch: np.ndarray) -> np.ndarray:
+    if batch.dtype != np.uint8:
+        # Приведение к uint8 обернуло бы 257 в 1: значения вне 0..9 заменяются пустой клеткой
+        batch = np.where((batch >= 0) & (batch <= 9), batch, 0).astype(np.uint8)
+    bits = _BIT_OF_DIGIT[batch]
+    boxes = bits.reshape(-1, 3, 3, 3, 3)
+    rows = bits[:, :, 0].copy()
+    cols = bits[:, 0, :].copy()
+    squares = boxes[:, :, 0, :, 0].copy()
+    for k in range(1, 9):
+        rows |= bits[:, :, k]
+        cols |= bits[:, k, :]
+        squares |= boxes[:, :, k // 3, :, k % 3]
+    return (
+        (rows == ALL_DIGITS).all(axis=1)
+        & (cols == ALL_DIGITS).all(axis=1)
+        & (squares == ALL_DIGITS).all(axis=(1, 2))
+    )
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Check sudoku solutions, one per line.")
+    parser.add_argument("solutions", help="Solution file")
+    args = parser.parse_args(argv)
+
+    valid = check_solutions(load_puzzles(args.solutions))
+    print(f"{len(valid)} solutions, {int(valid.sum())} valid")
+    for index in np.flatnonzero(~valid)[:10]:
+        print(f"  invalid: solution {index + 1}")
+    return 0 if valid.all() else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
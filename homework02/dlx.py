@@ -0,0 +1,224 @@
+"""
+Судоку как задача точного покрытия: алгоритм X Кнута на танцующих ссылках (DLX).
+
+Работает с полями любого размера N x N, где N = n * n (4 x 4, 9 x 9, 16 x 16, 25 x 25).
+Цифры записываются символами из SYMBOLS, пустые клетки - '.' или '0'.
+
+    >>> grid = [list(row) for row in ["12..", "..1.", ".1.3", "4..1"]]
+    >>> count_solutions(grid)
+    1
+    >>> solve_all(grid)
+    [[['1', '2', '3', '4'], ['3', '4', '1', '2'], ['2', '1', '4', '3'], ['4', '3', '2', '1']]]
+    >>> count_solutions([['.'] * 4 for _ in range(4)])
+    288
+"""
+
+import math
+from typing import Dict, Iterator, List, Optional, Set, Tuple
+
+SYMBOLS = "123456789ABCDEFGHIJKLMNOP"
+EMPTY = frozenset(".0")
+
+
+class ExactCover:
+    """
+    Матрица точного покрытия на массивах: узел i связан с соседями L[i], R[i], U[i], D[i],
+    C[i] - заголовок столбца узла, ROW[i] - номер строки матрицы. Узел 0 - корень,
+    узлы 1..columns - заголовки столбцов, S[c] - число узлов в столбце c.
+    """
+
+    def __init__(self, columns: int) -> None:
+        self.L = [i - 1 for i in range(columns + 1)]
+        self.R = [i + 1 for i in range(columns + 1)]
+        self.L[0], self.R[columns] = columns, 0
+        self.U = list(range(columns + 1))
+        self.D = list(range(columns + 1))
+        self.C = list(range(columns + 1))
+        self.ROW = [-1] * (columns + 1)
+        self.S = [0] * (columns + 1)
+
+    def add_row(self, row: int, columns: List[int]) -> None:
+        """Добавляет строку матрицы с единицами в столбцах columns (нумерация с 1)"""
+        L, R, U, D, C = self.L, self.R, self.U, self.D, self.C
+        first = len(L)
+        for k, col in enumerate(columns):
+            node = first + k
+            L.append(node - 1 if k else first + len(columns) - 1)
+            R.append(node + 1 if k < len(columns) - 1 else first)
+            U.append(U[col])
+            D.append(col)
+            C.append(col)
+            self.ROW.append(row)
+            D[U[col]] = node
+            U[col] = node
+            self.S[col] += 1
+
+    def cover(self, col: int) -> None:
+        L, R, U, D, C, S = self.L, self.R, self.U, self.D, self.C, self.S
+        R[L[col]] = R[col]
+        L[R[col]] = L[col]
+        i = D[col]
+        while i != col:
+            j = R[i]
+            while j != i:
+                D[U[j]] = D[j]
+                U[D[j]] = U[j]
+                S[C[j]] -= 1
+                j = R[j]
+            i = D[i]
+
+    def uncover(self, col: int) -> None:
+        L, R, U, D, C, S = self.L, self.R, self.U, self.D, self.C, self.S
+        i = U[col]
+        while i != col:
+            j = L[i]
+            while j != i:
+                S[C[j]] += 1
+                D[U[j]] = j
+                U[D[j]] = j
+                j = L[j]
+            i = U[i]
+        R[L[col]] = col
+        L[R[col]] = col
+
+    def select(self, node: int) -> None:
+        """Выбирает строку узла node: закрывает все её столбцы, кроме столбца node"""
+        j = self.R[node]
+        while j != node:
+            self.cover(self.C[j])
+            j = self.R[j]
+
+    def unselect(self, node: int) -> None:
+        j = self.L[node]
+        while j != node:
+            self.uncover(self.C[j])
+            j = self.L[j]
+
+    def solutions(self) -> Iterator[List[int]]:
+        """
+        Перебирает все точные покрытия (без рекурсии), возвращая номера выбранных строк.
+        """
+        R, D, C, S = self.R, self.D, self.C, self.S
+        stack: List[int] = []
+        while True:
+            if R[0] == 0:
+                yield [self.ROW[node] for node in stack]
+                node = -1
+            else:
+                # Столбец с наименьшим числом единиц
+                col, j = R[0], R[R[0]]
+                while j != 0:
+                    if S[j] < S[col]:
+                        col = j
+                    j = R[j]
+                self.cover(col)
+                node = D[col]
+                if node == col:
+                    self.uncover(col)
+                    node = -1
+                else:
+                    stack.append(node)
+                    self.select(node)
+                    continue
+
+            # Возврат: берём следующую строку в столбце последнего выбора
+            while stack:
+                node = stack.pop()
+                self.unselect(node)
+                col = C[node]
+                node = D[node]
+                if node != col:
+                    stack.append(node)
+                    self.select(node)
+                    break
+                self.uncover(col)
+            else:
+                return
+
+
+def _build(grid: List[List[str]]) -> Tuple[ExactCover, str, bool]:
+    size = len(grid)
+    box = math.isqrt(size)
+    if box * box != size or any(len(row) != size for row in grid):
+        raise ValueError(f"A sudoku must be N x N with N a perfect square, got {size} rows")
+    symbols = SYMBOLS[:size]
+    digits: Dict[str, int] = {symbol: digit for digit, symbol in enumerate(symbols)}
+    cells = size * size
+
+    def columns(r: int, c: int, d: int) -> List[int]:
+        b = (r // box) * box + c // box
+        return [
+            1 + r * size + c,
+            1 + cells + r * size + d,
+            1 + 2 * cells + c * size + d,
+            1 + 3 * cells + b * size + d,
+        ]
+
+    # Требования, которые закрывают заданные цифры; повтор требования - решений нет
+    consistent = True
+    covered: Set[int] = set()
+    for r in range(size):
+        for c in range(size):
+            value = grid[r][c]
+            if value in EMPTY:
+                continue
+            if value not in digits:
+                raise ValueError(f"Unexpected symbol {value!r} for a {size}x{size} sudoku")
+            given = columns(r, c, digits[value])
+            if covered.intersection(given):
+                consistent = False
+            covered.update(given)
+
+    # В матрицу попадают только ходы, совместимые с заданными цифрами
+    matrix = ExactCover(4 * cells)
+    for r in range(size):
+        for c in range(size):
+            if grid[r][c] not in EMPTY:
+                continue
+            for d in range(size):
+                candidate = columns(r, c, d)
+                if not covered.intersection(candidate):
+                    matrix.add_row((r * size + c) * size + d, candidate)
+    for col in covered:
+        matrix.cover(col)
+    return matrix, symbols, consistent
+
+
+def iter_solutions(grid: List[List[str]]) -> Iterator[List[List[str]]]:
+    """Перебирает все решения пазла, не изменяя grid"""
+    matrix, symbols, consistent = _build(grid)
+    if not consistent:
+        return
+    size = len(grid)
+    for rows in matrix.solutions():
+        solution = [row[:] for row in grid]
+        for row in rows:
+            cell, digit = divmod(row, size)
+            solution[cell // size][cell % size] = symbols[digit]
+        yield solution
+
+
+def solve_all(grid: List[List[str]], limit: Optional[int] = None) -> List[List[List[str]]]:
+    """Возвращает все решения пазла, но не больше limit"""
+    solutions = []
+    for solution in iter_solutions(grid):
+        solutions.append(solution)
+        if limit is not None and len(solutions) >= limit:
+            break
+    return solutions
+
+
+def count_solutions(grid: List[List[str]], limit: Optional[int] = None) -> int:
+    """
+    Считает решения пазла; с limit останавливается, как только их найдено limit.
+    count_solutions(grid, limit=2) == 1 - проверка единственности решения.
+    """
+    matrix, _, consistent = _build(grid)
+    if not consistent:
+        return 0
+    count = 0
+    for _ in matrix.solutions():
+        count += 1
+        if limit is not None and count >= limit:
+            break
+    return count
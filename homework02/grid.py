@@ -0,0 +1,123 @@
+"""
+Компактное поле Судоку 9 x 9: 81 клетка в одном bytearray (0 - пустая клетка).
+
+    >>> from sudoku import read_sudoku
+    >>> grid = Grid.from_rows(read_sudoku('puzzle1.txt'))
+    >>> bytes(grid.row(0))
+    b'\\x05\\x03\\x00\\x00\\x07\\x00\\x00\\x00\\x00'
+    >>> list(grid.col(0))
+    [5, 6, 0, 8, 4, 7, 0, 0, 0]
+    >>> list(grid.block(0, 1))
+    [5, 3, 0, 6, 0, 0, 0, 9, 8]
+    >>> grid.empty_positions()[:3]
+    [(0, 2), (0, 3), (0, 5)]
+    >>> grid.to_rows() == read_sudoku('puzzle1.txt')
+    True
+"""
+
+from typing import Iterable, List, Optional, Sequence, Set, Tuple
+
+ROW_OF = tuple(i // 9 for i in range(81))
+COL_OF = tuple(i % 9 for i in range(81))
+BOX_OF = tuple((i // 27) * 3 + (i % 9) // 3 for i in range(81))
+ROWS = tuple(tuple(i for i in range(81) if ROW_OF[i] == k) for k in range(9))
+COLS = tuple(tuple(i for i in range(81) if COL_OF[i] == k) for k in range(9))
+BOXES = tuple(tuple(i for i in range(81) if BOX_OF[i] == k) for k in range(9))
+UNITS = ROWS + COLS + BOXES
+# 20 клеток, которые делят с клеткой строку, столбец или квадрат
+PEERS = tuple(
+    tuple(sorted(set(ROWS[ROW_OF[i]] + COLS[COL_OF[i]] + BOXES[BOX_OF[i]]) - {i}))
+    for i in range(81)
+)
+
+_FROM_TEXT = bytes.maketrans(b".0123456789", bytes([0, 0, 1, 2, 3, 4, 5, 6, 7, 8, 9]))
+_TO_TEXT = bytes.maketrans(bytes(range(10)), b".123456789")
+
+
+class Grid:
+    """
+    Поле Судоку поверх bytearray из 81 клетки.
+
+    row/col возвращают memoryview без копирования, block - 9 клеток по готовой
+    таблице индексов. Список пустых клеток кэшируется до следующей записи
+    через grid[r, c] = value (при записи напрямую в cells кэш не сбрасывается).
+    """
+
+    __slots__ = ("cells", "_empty")
+
+    def __init__(self, cells: Optional[Iterable[int]] = None) -> None:
+        self.cells = bytearray(81) if cells is None else bytearray(cells)
+        if len(self.cells) != 81:
+            raise ValueError("A sudoku must have exactly 81 cells")
+        self._empty: Optional[Tuple[int, ...]] = None
+
+    @classmethod
+    def from_rows(cls, rows: Sequence[Sequence[str]]) -> "Grid":
+        """Из списка списков строк ('1'..'9', '.')"""
+        return cls(0 if value == "." else int(value) for row in rows for value in row)
+
+    @classmethod
+    def from_string(cls, line: str) -> "Grid":
+        """Из строки в 81 символ (цифры, '.' или '0' для пустых клеток)
+
+        >>> Grid.from_string('12' + '.' * 79)[0, 1]
+        2
+        """
+        if len(line) != 81:
+            raise ValueError("A sudoku line must have exactly 81 characters")
+        data = line.encode("ascii")
+        if data.translate(None, b".0123456789"):
+            raise ValueError("A sudoku line may contain only digits and '.'")
+        return cls(data.translate(_FROM_TEXT))
+
+    def to_rows(self) -> List[List[str]]:
+        """В список списков строк, с которым работает sudoku.py"""
+        text = self.to_string()
+        return [list(text[i : i + 9]) for i in range(0, 81, 9)]
+
+    def to_string(self) -> str:
+        """В строку из 81 символа, как в файлах для batch.py"""
+        return self.cells.translate(_TO_TEXT).decode("ascii")
+
+    def copy(self) -> "Grid":
+        """Копия поля - одно копирование буфера"""
+        return Grid(self.cells)
+
+    def __getitem__(self, pos: Tuple[int, int]) -> int:
+        return self.cells[pos[0] * 9 + pos[1]]
+
+    def __setitem__(self, pos: Tuple[int, int], value: int) -> None:
+        self.cells[pos[0] * 9 + pos[1]] = value
+        self._empty = None
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Grid):
+            return NotImplemented
+        return self.cells == other.cells
+
+    def __repr__(self) -> str:
+        return f"Grid.from_string({self.to_string()!r})"
+
+    def row(self, r: int) -> memoryview:
+        return memoryview(self.cells)[r * 9 : r * 9 + 9]
+
+    def col(self, c: int) -> memoryview:
+        return memoryview(self.cells)[c::9]
+
+    def block(self, r: int, c: int) -> bytes:
+        """Квадрат, в который попадает клетка (r, c)"""
+        cells = self.cells
+        return bytes(cells[i] for i in BOXES[BOX_OF[r * 9 + c]])
+
+    def empty_cells(self) -> Tuple[int, ...]:
+        """Индексы пустых клеток в cells (кортеж, чтобы кэш нельзя было испортить снаружи)"""
+        if self._empty is None:
+            self._empty = tuple(i for i, value in enumerate(self.cells) if not value)
+        return self._empty
+
+    def empty_positions(self) -> List[Tuple[int, int]]:
+        return [(ROW_OF[i], COL_OF[i]) for i in self.empty_cells()]
+
+    def possible_values(self, r: int, c: int) -> Set[int]:
+        cells = self.cells
+        return set(range(1, 10)) - {cells[i] for i in PEERS[r * 9 + c]}
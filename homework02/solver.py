@@ -0,0 +1,417 @@
+"""
+Решатель Судоку на битовых масках.
+
+Поле хранится как bytearray из 81 байта (0 - пустая клетка, 1..9 - цифра),
+поэтому копирование клеток при переборе - одно копирование буфера.
+Для каждой строки, столбца и квадрата хранится маска занятых цифр
+(бит d-1 соответствует цифре d), поэтому множество кандидатов клетки
+вычисляется за три операции OR без построения списков.
+"""
+
+import collections
+import random
+import sys
+import time
+from typing import Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+from grid import BOX_OF, COL_OF, ROW_OF, UNITS, Grid
+
+ALL_DIGITS = 0x1FF
+DIGIT_OF_BIT = {1 << d: d + 1 for d in range(9)}
+BIT_COUNT = tuple(bin(mask).count("1") for mask in range(ALL_DIGITS + 1))
+
+
+class SolverStats:
+    """
+    Статистика перебора: число узлов дерева поиска, возвратов (ветвей, не
+    приведших к решению), клеток, заполненных распространением ограничений,
+    наибольшая глубина и время по фазам (в секундах). Собирается только если
+    передать объект в solve_values/solve_grid, иначе решатель идет по пути
+    без счетчиков.
+    """
+
+    PHASES = ("setup", "propagate", "branch")
+
+    def __init__(self) -> None:
+        self.puzzles = 0
+        self.nodes = 0
+        self.backtracks = 0
+        self.propagations = 0
+        self.max_depth = 0
+        self.times: Dict[str, float] = dict.fromkeys(self.PHASES, 0.0)
+
+    def merge(self, other: "SolverStats") -> None:
+        """Добавляет статистику other (например, посчитанную в другом процессе)"""
+        self.puzzles += other.puzzles
+        self.nodes += other.nodes
+        self.backtracks += other.backtracks
+        self.propagations += other.propagations
+        self.max_depth = max(self.max_depth, other.max_depth)
+        for phase, seconds in other.times.items():
+            self.times[phase] = self.times.get(phase, 0.0) + seconds
+
+    def format(self) -> str:
+        """
+        >>> print(SolverStats().format())
+        Search: 0 nodes, 0 backtracks, 0 cells propagated, max depth 0
+        Time: setup 0.000 s, propagate 0.000 s, branch 0.000 s
+        """
+        per_puzzle = ""
+        if self.puzzles > 1:
+            per_puzzle = (
+                f" ({self.nodes / self.puzzles:.1f} nodes,"
+                f" {self.backtracks / self.puzzles:.1f} backtracks per puzzle)"
+            )
+        times = ", ".join(f"{phase} {seconds:.3f} s" for phase, seconds in self.times.items())
+        return (
+            f"Search: {self.nodes} nodes, {self.backtracks} backtracks, "
+            f"{self.propagations} cells propagated, max depth {self.max_depth}{per_puzzle}\n"
+            f"Time: {times}"
+        )
+
+
+class CacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    evictions: int
+    size: int
+    maxsize: int
+    memory: int
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def format(self) -> str:
+        """
+        >>> print(CacheInfo(1, 3, 0, 2, 10, 1 << 20).format())
+        Cache: 1 hits / 4 lookups (25.0%), 2/10 entries, 1.0 MB, 0 evictions
+        """
+        return (
+            f"Cache: {self.hits} hits / {self.hits + self.misses} lookups "
+            f"({self.hit_rate:.1%}), {self.size}/{self.maxsize} entries, "
+            f"{self.memory / (1 << 20):.1f} MB, {self.evictions} evictions"
+        )
+
+
+class TranspositionTable:
+    """
+    Ограниченная LRU-таблица уже разобранных состояний перебора.
+
+    Ключ - поле после распространения ограничений (81 байт): из него однозначно
+    получаются маски кандидатов, а разные пути к одному состоянию дают один
+    ключ. Значение - решение или отметка, что решения нет. При переполнении
+    вытесняется давно не использованная запись, так что память ограничена maxsize.
+    """
+
+    # Примерный размер записи OrderedDict без ключа и значения
+    _ENTRY_OVERHEAD = 100
+    _UNSOLVABLE = b""
+
+    def __init__(self, maxsize: int = 100_000) -> None:
+        if maxsize < 1:
+            raise ValueError("maxsize must be positive")
+        self.maxsize = maxsize
+        self.hits = self.misses = self.evictions = 0
+        self.memory = 0
+        self._entries: "collections.OrderedDict[bytes, bytes]" = collections.OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: bytes) -> Optional[bytes]:
+        """Решение для состояния key, b'' - решения нет, None - состояния нет в таблице"""
+        solution = self._entries.get(key)
+        if solution is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._entries.move_to_end(key)
+        return solution
+
+    def put(self, key: bytes, solution: Optional[bytes]) -> None:
+        value = self._UNSOLVABLE if solution is None else solution
+        if key in self._entries:
+            self._entries.move_to_end(key)
+            return
+        self._entries[key] = value
+        self.memory += self._entry_size(key, value)
+        while len(self._entries) > self.maxsize:
+            old_key, old_value = self._entries.popitem(last=False)
+            self.memory -= self._entry_size(old_key, old_value)
+            self.evictions += 1
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self.memory = 0
+
+    def info(self) -> CacheInfo:
+        return CacheInfo(
+            self.hits, self.misses, self.evictions, len(self._entries), self.maxsize, self.memory
+        )
+
+    def _entry_size(self, key: bytes, value: bytes) -> int:
+        return sys.getsizeof(key) + sys.getsizeof(value) + self._ENTRY_OVERHEAD
+
+
+class _State:
+    """Клетки поля и маски занятых цифр строк, столбцов и квадратов"""
+
+    __slots__ = ("values", "rows", "cols", "boxes")
+
+    def __init__(
+        self, values: bytearray, rows: List[int], cols: List[int], boxes: List[int]
+    ) -> None:
+        self.values = values
+        self.rows = rows
+        self.cols = cols
+        self.boxes = boxes
+
+    def copy(self) -> "_State":
+        return _State(self.values[:], self.rows[:], self.cols[:], self.boxes[:])
+
+    def candidates(self, i: int) -> int:
+        return ALL_DIGITS & ~(self.rows[ROW_OF[i]] | self.cols[COL_OF[i]] | self.boxes[BOX_OF[i]])
+
+    def place(self, i: int, bit: int) -> None:
+        self.values[i] = DIGIT_OF_BIT[bit]
+        self.rows[ROW_OF[i]] |= bit
+        self.cols[COL_OF[i]] |= bit
+        self.boxes[BOX_OF[i]] |= bit
+
+
+def _initial_state(values: Sequence[int]) -> Tuple[_State, bool]:
+    """Строит маски по заданным цифрам; второй результат - нет ли в них повторов"""
+    state = _State(bytearray(values), [0] * 9, [0] * 9, [0] * 9)
+    consistent = True
+    for i, digit in enumerate(values):
+        if digit:
+            bit = 1 << (digit - 1)
+            if (state.rows[ROW_OF[i]] | state.cols[COL_OF[i]] | state.boxes[BOX_OF[i]]) & bit:
+                consistent = False
+            state.place(i, bit)
+    return state, consistent
+
+
+def _propagate(state: _State, strict: bool) -> bool:
+    """
+    Расставляет единственных кандидатов (naked single) и цифры, которым
+    в строке/столбце/квадрате подходит только одна клетка (hidden single).
+    Возвращает False, если найдено противоречие.
+
+    Если в исходных цифрах есть повторы, часть цифр заведомо некуда поставить,
+    поэтому с strict=False отсутствие места для цифры противоречием не считается.
+    """
+    values = state.values
+    while True:
+        changed = False
+        for i in range(81):
+            if values[i]:
+                continue
+            cand = state.candidates(i)
+            if not cand:
+                return False
+            if not cand & (cand - 1):
+                state.place(i, cand)
+                changed = True
+        if changed:
+            continue
+
+        for unit in UNITS:
+            once = twice = used = 0
+            for i in unit:
+                if values[i]:
+                    used |= 1 << (values[i] - 1)
+                else:
+                    cand = state.candidates(i)
+                    twice |= once & cand
+                    once |= cand
+            if strict and ALL_DIGITS & ~used & ~once:
+                return False
+            singles = once & ~twice & ~used
+            while singles:
+                bit = singles & -singles
+                singles ^= bit
+                for i in unit:
+                    if not values[i] and state.candidates(i) & bit:
+                        state.place(i, bit)
+                        break
+                else:
+                    return False
+                changed = True
+        if not changed:
+            return True
+
+
+def _choose_cell(state: _State) -> int:
+    """Клетка с наименьшим числом кандидатов (MRV); -1, если пустых клеток нет"""
+    best, best_count = -1, 10
+    for i in range(81):
+        if not state.values[i]:
+            count = BIT_COUNT[state.candidates(i)]
+            if count < best_count:
+                best, best_count = i, count
+                if count == 2:
+                    break
+    return best
+
+
+def _bits(mask: int, rng: Optional[random.Random] = None) -> List[int]:
+    bits = []
+    while mask:
+        bit = mask & -mask
+        mask ^= bit
+        bits.append(bit)
+    if rng is not None:
+        rng.shuffle(bits)
+    return bits
+
+
+def _search(
+    state: _State, strict: bool, rng: Optional[random.Random] = None
+) -> Optional[bytearray]:
+    if not _propagate(state, strict):
+        return None
+    best = _choose_cell(state)
+    if best < 0:
+        return state.values
+
+    for bit in _bits(state.candidates(best), rng):
+        child = state.copy()
+        child.place(best, bit)
+        solution = _search(child, strict, rng)
+        if solution is not None:
+            return solution
+    return None
+
+
+def _search_with_stats(
+    state: _State,
+    strict: bool,
+    rng: Optional[random.Random],
+    stats: SolverStats,
+    depth: int,
+    table: Optional[TranspositionTable] = None,
+) -> Optional[bytearray]:
+    """То же, что _search, но со счетчиками, замером времени фаз и таблицей состояний"""
+    stats.nodes += 1
+    stats.max_depth = max(stats.max_depth, depth)
+    started = time.perf_counter()
+    empty = state.values.count(0)
+    consistent = _propagate(state, strict)
+    stats.propagations += empty - state.values.count(0)
+    propagated = time.perf_counter()
+    stats.times["propagate"] += propagated - started
+    if not consistent:
+        return None
+    best = _choose_cell(state)
+    stats.times["branch"] += time.perf_counter() - propagated
+    if best < 0:
+        return state.values
+
+    key = b""
+    if table is not None:
+        key = bytes(state.values)
+        cached = table.get(key)
+        if cached is not None:
+            return bytearray(cached) if cached else None
+
+    solution = None
+    for bit in _bits(state.candidates(best), rng):
+        child = state.copy()
+        child.place(best, bit)
+        solution = _search_with_stats(child, strict, rng, stats, depth + 1, table)
+        if solution is not None:
+            break
+        stats.backtracks += 1
+    if table is not None:
+        table.put(key, None if solution is None else bytes(solution))
+    return solution
+
+
+def _solve(
+    values: Sequence[int],
+    rng: Optional[random.Random],
+    stats: Optional[SolverStats],
+    cache: Optional[TranspositionTable],
+) -> Optional[bytearray]:
+    if stats is None and cache is None:
+        state, consistent = _initial_state(values)
+        return _search(state, consistent, rng)
+    stats = stats if stats is not None else SolverStats()
+    started = time.perf_counter()
+    state, consistent = _initial_state(values)
+    stats.times["setup"] += time.perf_counter() - started
+    stats.puzzles += 1
+    # Случайный перебор и поля с повторами в подсказках в таблицу не попадают
+    table = cache if rng is None and consistent else None
+    return _search_with_stats(state, consistent, rng, stats, 0, table)
+
+
+def _count(state: _State, limit: int) -> int:
+    if not _propagate(state, True):
+        return 0
+    best = _choose_cell(state)
+    if best < 0:
+        return 1
+
+    count = 0
+    for bit in _bits(state.candidates(best)):
+        child = state.copy()
+        child.place(best, bit)
+        count += _count(child, limit - count)
+        if count >= limit:
+            break
+    return count
+
+
+def solve_values(
+    values: Sequence[int],
+    rng: Optional[random.Random] = None,
+    stats: Optional[SolverStats] = None,
+    cache: Optional[TranspositionTable] = None,
+) -> Optional[List[int]]:
+    """
+    Решает пазл, заданный списком из 81 числа (0 - пустая клетка).
+    Возвращает заполненный список или None, если решения нет.
+    С rng кандидаты перебираются в случайном порядке (для генерации полей),
+    в stats (SolverStats) добавляется статистика перебора. С cache
+    (TranspositionTable) уже разобранные состояния берутся из таблицы,
+    её можно переиспользовать между пазлами.
+
+    >>> puzzle = [int(c) if c != '.' else 0 for c in open('puzzle1.txt').read() if c in '.123456789']
+    >>> solve_values(puzzle)[:9]
+    [5, 3, 4, 6, 7, 8, 9, 1, 2]
+    """
+    if len(values) != 81:
+        raise ValueError("A sudoku must have exactly 81 cells")
+    solution = _solve(values, rng, stats, cache)
+    return None if solution is None else list(solution)
+
+
+def solve_grid(
+    grid: Grid,
+    rng: Optional[random.Random] = None,
+    stats: Optional[SolverStats] = None,
+    cache: Optional[TranspositionTable] = None,
+) -> Optional[Grid]:
+    """Решает пазл, заданный Grid; исходное поле не изменяется"""
+    solution = _solve(grid.cells, rng, stats, cache)
+    return None if solution is None else Grid(solution)
+
+
+def count_solutions(values: Sequence[int], limit: int = 2) -> int:
+    """
+    Считает решения пазла, останавливаясь на limit; count_solutions(values) == 1
+    означает, что решение единственное.
+
+    >>> count_solutions([0] * 81)
+    2
+    """
+    if len(values) != 81:
+        raise ValueError("A sudoku must have exactly 81 cells")
+    state, consistent = _initial_state(values)
+    if not consistent:
+        return 0
+    return _count(state, limit)
@@ -1,4 +1,8 @@
-from typing import Tuple, List, Set, Optional
+import random
+from typing import Iterator, Tuple, List, Set, Optional, Union
+
+import solver
+from grid import Grid
 
 
 def read_sudoku(filename: str) -> List[List[str]]:
@@ -8,8 +12,10 @@ def read_sudoku(filename: str) -> List[List[str]]:
     return grid
 
 
-def display(grid: List[List[str]]) -> None:
+def display(grid: Union[List[List[str]], Grid]) -> None:
     """Вывод Судоку """
+    if isinstance(grid, Grid):
+        grid = grid.to_rows()
     width = 2
     line = '+'.join(['-' * (width * 3)] * 3)
     for row in range(9):
@@ -28,7 +34,7 @@ def group(values: List[str], n: int) -> List[List[str]]:
     >>> group([1,2,3,4,5,6,7,8,9], 3)
     [[1, 2, 3], [4, 5, 6], [7, 8, 9]]
     """
-    pass
+    return [values[i : i + n] for i in range(0, len(values), n)]
 
 
 def get_row(grid: List[List[str]], pos: Tuple[int, int]) -> List[str]:
@@ -41,7 +47,7 @@ def get_row(grid: List[List[str]], pos: Tuple[int, int]) -> List[str]:
     >>> get_row([['1', '2', '3'], ['4', '5', '6'], ['.', '8', '9']], (2, 0))
     ['.', '8', '9']
     """
-    pass
+    return grid[pos[0]]
 
 
 def get_col(grid: List[List[str]], pos: Tuple[int, int]) -> List[str]:
@@ -54,7 +60,7 @@ def get_col(grid: List[List[str]], pos: Tuple[int, int]) -> List[str]:
     >>> get_col([['1', '2', '3'], ['4', '5', '6'], ['.', '8', '9']], (0, 2))
     ['3', '6', '9']
     """
-    pass
+    return [row[pos[1]] for row in grid]
 
 
 def get_block(grid: List[List[str]], pos: Tuple[int, int]) -> List[str]:
@@ -68,7 +74,8 @@ def get_block(grid: List[List[str]], pos: Tuple[int, int]) -> List[str]:
     >>> get_block(grid, (8, 8))
     ['2', '8', '.', '.', '.', '5', '.', '7', '9']
     """
-    pass
+    row, col = 3 * (pos[0] // 3), 3 * (pos[1] // 3)
+    return [grid[r][c] for r in range(row, row + 3) for c in range(col, col + 3)]
 
 
 def find_empty_positions(grid: List[List[str]]) -> Optional[Tuple[int, int]]:
@@ -81,7 +88,11 @@ def find_empty_positions(grid: List[List[str]]) -> Optional[Tuple[int, int]]:
     >>> find_empty_positions([['1', '2', '3'], ['4', '5', '6'], ['.', '8', '9']])
     (2, 0)
     """
-    pass
+    for row, values in enumerate(grid):
+        for col, value in enumerate(values):
+            if value == '.':
+                return row, col
+    return None
 
 
 def find_possible_values(grid: List[List[str]], pos: Tuple[int, int]) -> Set[str]:
@@ -95,10 +106,13 @@ def find_possible_values(grid: List[List[str]], pos: Tuple[int, int]) -> Set[str
     >>> values == {'2', '5', '9'}
     True
     """
-    pass
+    used = set(get_row(grid, pos)) | set(get_col(grid, pos)) | set(get_block(grid, pos))
+    return set('123456789') - used
 
 
-def solve(grid: List[List[str]]) -> Optional[List[List[str]]]:
+def solve(
+    grid: Union[List[List[str]], Grid], stats: Optional[solver.SolverStats] = None
+) -> Optional[Union[List[List[str]], Grid]]:
     """ Решение пазла, заданного в grid """
     """ Как решать Судоку?
         1. Найти свободную позицию
@@ -110,18 +124,64 @@ def solve(grid: List[List[str]]) -> Optional[List[List[str]]]:
     >>> grid = read_sudoku('puzzle1.txt')
     >>> solve(grid)
     [['5', '3', '4', '6', '7', '8', '9', '1', '2'], ['6', '7', '2', '1', '9', '5', '3', '4', '8'], ['1', '9', '8', '3', '4', '2', '5', '6', '7'], ['8', '5', '9', '7', '6', '1', '4', '2', '3'], ['4', '2', '6', '8', '5', '3', '7', '9', '1'], ['7', '1', '3', '9', '2', '4', '8', '5', '6'], ['9', '6', '1', '5', '3', '7', '2', '8', '4'], ['2', '8', '7', '4', '1', '9', '6', '3', '5'], ['3', '4', '5', '2', '8', '6', '1', '7', '9']]
+
+    Сам перебор выполняет solver.solve_grid на битовых масках кандидатов,
+    здесь поле только переводится из списка строк в Grid и обратно.
+    Если передан Grid, то и решение возвращается в виде Grid.
+    В stats (solver.SolverStats) можно собрать статистику перебора.
     """
-    pass
+    if isinstance(grid, Grid):
+        return solver.solve_grid(grid, stats=stats)
+    solution = solver.solve_grid(Grid.from_rows(grid), stats=stats)
+    if solution is None:
+        return None
+    return solution.to_rows()
 
 
-def check_solution(solution: List[List[str]]) -> bool:
+def check_solution(solution: Union[List[List[str]], Grid]) -> bool:
     """ Если решение solution верно, то вернуть True, в противном случае False """
     # TODO: Add doctests with bad puzzles
-    pass
+    if isinstance(solution, Grid):
+        solution = solution.to_rows()
+    digits = set('123456789')
+    for i in range(9):
+        if set(get_row(solution, (i, 0))) != digits:
+            return False
+        if set(get_col(solution, (0, i))) != digits:
+            return False
+        if set(get_block(solution, (3 * (i // 3), 3 * (i % 3)))) != digits:
+            return False
+    return True
+
+
+# Число подсказок для уровней сложности
+DIFFICULTY_CLUES = {'easy': 40, 'medium': 32, 'hard': 28, 'expert': 24}
+# Меньше 17 подсказок единственного решения не бывает
+MIN_UNIQUE_CLUES = 17
+
+
+def _remove_clues(values: List[int], N: int, rng: random.Random, unique: bool) -> List[int]:
+    """ Стирает клетки в случайном порядке, пока не останется N подсказок """
+    values = values[:]
+    filled = 81
+    for i in rng.sample(range(81), 81):
+        if filled <= N:
+            break
+        digit, values[i] = values[i], 0
+        if unique and solver.count_solutions(values, limit=2) != 1:
+            values[i] = digit
+        else:
+            filled -= 1
+    return values
 
 
-def generate_sudoku(N: int) -> List[List[str]]:
-    """ Генерация судоку заполненного на N элементов
+def generate_sudoku(
+    N: int,
+    difficulty: Optional[str] = None,
+    rng: Optional[random.Random] = None,
+    attempts: int = 20,
+) -> List[List[str]]:
+    """Генерация судоку заполненного на N элементов
 
     >>> grid = generate_sudoku(40)
     >>> sum(1 for row in grid for e in row if e == '.')
@@ -141,8 +201,55 @@ def generate_sudoku(N: int) -> List[List[str]]:
     >>> solution = solve(grid)
     >>> check_solution(solution)
     True
+
+    Сначала случайным перебором строится заполненное поле, затем из него
+    стираются клетки, пока решение остается единственным (проверка считает
+    решения только до двух). При N >= 17 пазл всегда имеет единственное
+    решение: если за attempts попыток до N подсказок дойти не удалось,
+    возвращается пазл с наименьшим найденным числом подсказок (больше N).
+    Случайным стиранием обычно удается дойти до 24-25 подсказок; чем меньше N,
+    тем больше нужно попыток. При N < 17 единственного решения не бывает,
+    и лишние клетки стираются без проверки.
+    Вместо N можно указать difficulty: 'easy', 'medium', 'hard' или 'expert'.
+    """
+    if difficulty is not None:
+        N = DIFFICULTY_CLUES[difficulty]
+    N = max(0, min(N, 81))
+    rng = rng or random.Random()
+
+    best: List[int] = []
+    best_clues = 82
+    for _ in range(max(1, attempts) if N >= MIN_UNIQUE_CLUES else 1):
+        solution = solver.solve_values([0] * 81, rng=rng)
+        assert solution is not None
+        puzzle = _remove_clues(solution, N, rng, unique=True)
+        clues = sum(1 for value in puzzle if value)
+        if clues < best_clues:
+            best, best_clues = puzzle, clues
+        if clues == N:
+            break
+    if N < MIN_UNIQUE_CLUES:
+        best = _remove_clues(best, N, rng, unique=False)
+    return group([str(value) if value else '.' for value in best], 9)
+
+
+def iter_generate_sudoku(
+    N: int,
+    count: Optional[int] = None,
+    difficulty: Optional[str] = None,
+    seed: Optional[int] = None,
+) -> Iterator[List[List[str]]]:
+    """Генерирует count пазлов (без count - бесконечно), см. generate_sudoku
+
+    >>> puzzles = list(iter_generate_sudoku(30, count=2, seed=1))
+    >>> [sum(1 for row in grid for e in row if e != '.') for grid in puzzles]
+    [30, 30]
     """
-    pass
+    rng = random.Random(seed)
+    generated = 0
+    while count is None or generated < count:
+        yield generate_sudoku(N, difficulty=difficulty, rng=rng)
+        generated += 1
 
 
 if __name__ == '__main__':
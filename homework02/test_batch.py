@@ -0,0 +1,85 @@
+import io
+import unittest
+
+import batch
+import sudoku
+
+
+def read_line(filename):
+    return "".join(c for c in open(filename).read() if c in "123456789.")
+
+
+class BatchTestCase(unittest.TestCase):
+    def setUp(self):
+        self.puzzles = [read_line(f) for f in ["puzzle1.txt", "puzzle2.txt", "puzzle3.txt"]]
+        self.solutions = [
+            "".join("".join(row) for row in sudoku.solve(sudoku.read_sudoku(f)))
+            for f in ["puzzle1.txt", "puzzle2.txt", "puzzle3.txt"]
+        ]
+
+    def test_serial_and_parallel_keep_order(self):
+        lines = [self.puzzles[i % 3] + "\n" for i in range(30)]
+        expected = [self.solutions[i % 3] for i in range(30)]
+        for workers in (1, 2):
+            with self.subTest(workers=workers):
+                results = list(batch.solve_stream(lines, workers=workers, chunk_size=4))
+                self.assertEqual(expected, [solution for solution, _ in results])
+                self.assertTrue(all(seconds >= 0 for _, seconds in results))
+
+    def test_bad_lines(self):
+        # The top left empty cell of puzzle1 can only be 1, 2 or 4; put them all below it
+        unsolvable = list(self.puzzles[0].replace(".", "0"))
+        unsolvable[9 * 6 + 2], unsolvable[9 * 7 + 2], unsolvable[9 * 8 + 2] = "1", "2", "4"
+        lines = ["123\n", "\n", "".join(unsolvable) + "\n", self.puzzles[0]]
+        results = [solution for solution, _ in batch.solve_stream(lines)]
+        self.assertEqual([batch.INVALID, batch.UNSOLVABLE, self.solutions[0]], results)
+
+    def test_run_reports(self):
+        src = io.StringIO("\n".join(self.puzzles) + "\n")
+        dst = io.StringIO()
+        histogram, elapsed = batch.run(src, dst)
+        self.assertEqual("\n".join(self.solutions) + "\n", dst.getvalue())
+        self.assertEqual(3, histogram.count)
+        self.assertIn("Solved 3 puzzles", batch.report(histogram, elapsed))
+
+    def test_stats_match_between_serial_and_parallel(self):
+        lines = [self.puzzles[i % 3] + "\n" for i in range(12)]
+        collected = []
+        for workers in (1, 2):
+            stats = batch.solver.SolverStats()
+            list(batch.solve_stream(lines, workers=workers, chunk_size=4, stats=stats))
+            collected.append(stats)
+        serial, parallel = collected
+        self.assertEqual(12, serial.puzzles)
+        self.assertEqual(
+            (serial.nodes, serial.backtracks, serial.propagations, serial.max_depth),
+            (parallel.nodes, parallel.backtracks, parallel.propagations, parallel.max_depth),
+        )
+
+    def test_cache_keeps_results_and_reports_per_process(self):
+        lines = [self.puzzles[i % 3] + "\n" for i in range(12)]
+        expected = [self.solutions[i % 3] for i in range(12)]
+        for workers in (1, 2):
+            with self.subTest(workers=workers):
+                caches = {}
+                results = batch.solve_stream(
+                    lines, workers=workers, chunk_size=4, cache_size=100, caches=caches
+                )
+                self.assertEqual(expected, [solution for solution, _ in results])
+                self.assertTrue(1 <= len(caches) <= workers)
+                total = batch.total_cache_info(caches.values())
+                # puzzle3 needs a branch, so its repeats are found in the table
+                self.assertGreater(total.hits, 0)
+                self.assertEqual(100 * len(caches), total.maxsize)
+        self.assertIsNone(batch._cache)
+
+    def test_histogram_percentiles(self):
+        histogram = batch.LatencyHistogram()
+        for _ in range(98):
+            histogram.add(100e-6)
+        histogram.add(0.01)
+        histogram.add(0.02)
+        self.assertEqual(100, histogram.count)
+        self.assertAlmostEqual(128e-6, histogram.percentile(50))
+        self.assertAlmostEqual(16384e-6, histogram.percentile(99))
+        self.assertAlmostEqual(0.02, histogram.percentile(100))
@@ -0,0 +1,91 @@
+import os
+import tempfile
+import unittest
+
+import numpy as np
+
+import bulk
+import solver
+import sudoku
+
+
+def solution_line(filename):
+    grid = sudoku.solve(sudoku.read_sudoku(filename))
+    return "".join(value for row in grid for value in row)
+
+
+class BulkTestCase(unittest.TestCase):
+    def setUp(self):
+        self.lines = [solution_line(name) for name in ["puzzle1.txt", "puzzle2.txt", "puzzle3.txt"]]
+
+    def test_parse_matches_legacy_reader(self):
+        batch = bulk.parse_puzzles("\n".join(self.lines).encode())
+        self.assertEqual((3, 9, 9), batch.shape)
+        self.assertEqual(np.uint8, batch.dtype)
+        for line, grid in zip(self.lines, batch):
+            self.assertEqual([int(c) for c in line], grid.ravel().tolist())
+
+    def test_parse_skips_blank_lines_and_crlf(self):
+        data = ("\r\n\r\n".join(self.lines) + "\r\n").encode()
+        self.assertEqual(3, len(bulk.parse_puzzles(data)))
+
+    def test_parse_empty(self):
+        self.assertEqual((0, 9, 9), bulk.parse_puzzles(b"").shape)
+
+    def test_parse_rejects_bad_characters(self):
+        with self.assertRaises(ValueError):
+            bulk.parse_puzzles(b"x" * 81)
+
+    def test_load_puzzles(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "solutions.txt")
+            with open(path, "w") as f:
+                f.write("\n".join(self.lines) + "\n")
+            batch = bulk.load_puzzles(path)
+        self.assertEqual(3, len(batch))
+
+    def test_check_solutions_agrees_with_check_solution(self):
+        rng = np.random.default_rng(0)
+        batch = np.repeat(bulk.parse_puzzles("\n".join(self.lines).encode()), 20, axis=0)
+        # Break some grids: swap two cells, clear a cell or change a digit
+        for k in range(0, len(batch), 3):
+            r, c = rng.integers(0, 9, 2)
+            if k % 2:
+                batch[k, r, c] = 0
+            else:
+                batch[k, r, c] = batch[k, r, c] % 9 + 1
+        batch[1, 0, 0], batch[1, 0, 1] = batch[1, 0, 1], batch[1, 0, 0]
+
+        expected = [
+            sudoku.check_solution([[str(v) for v in row] for row in grid]) for grid in batch
+        ]
+        self.assertEqual(expected, bulk.check_solutions(batch).tolist())
+        self.assertFalse(all(expected))
+        self.assertTrue(any(expected))
+
+    def test_box_check(self):
+        # Every row and column is a permutation, but the boxes are not
+        shifted = np.array([[(r + c) % 9 + 1 for c in range(9)] for r in range(9)], np.uint8)
+        self.assertEqual([False], bulk.check_solutions(shifted[None]).tolist())
+        self.assertEqual(
+            [True],
+            bulk.check_solutions(
+                np.array(solver.solve_values([0] * 81), np.uint8).reshape(1, 9, 9)
+            ).tolist(),
+        )
+
+    def test_wrong_shape(self):
+        with self.assertRaises(ValueError):
+            bulk.check_solutions(np.zeros((2, 81), np.uint8))
+
+    def test_wide_integers_are_range_checked(self):
+        valid = np.array(solver.solve_values([0] * 81), np.int64).reshape(1, 9, 9)
+        wrapped = valid.copy()
+        # 256 + d would become d after a plain cast to uint8
+        wrapped[0, 4, 4] += 256
+        negative = valid.copy()
+        negative[0, 0, 0] -= 256
+        batch = np.concatenate([valid, wrapped, negative])
+        self.assertEqual([True, False, False], bulk.check_solutions(batch).tolist())
+        with self.assertRaises(ValueError):
+            bulk.check_solutions(valid.astype(float))
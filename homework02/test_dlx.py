@@ -0,0 +1,75 @@
+import random
+import unittest
+
+import dlx
+import sudoku
+
+
+def pattern_grid(box):
+    size = box * box
+    return [
+        [dlx.SYMBOLS[(box * (r % box) + r // box + c) % size] for c in range(size)]
+        for r in range(size)
+    ]
+
+
+def is_valid(grid):
+    size = len(grid)
+    box = int(size ** 0.5)
+    symbols = set(dlx.SYMBOLS[:size])
+    rows = [set(row) for row in grid]
+    cols = [set(grid[r][c] for r in range(size)) for c in range(size)]
+    boxes = [
+        set(grid[r][c] for r in range(br, br + box) for c in range(bc, bc + box))
+        for br in range(0, size, box)
+        for bc in range(0, size, box)
+    ]
+    return all(unit == symbols for unit in rows + cols + boxes)
+
+
+class DLXTestCase(unittest.TestCase):
+    def test_puzzles_have_unique_solutions(self):
+        for filename in ["puzzle1.txt", "puzzle2.txt", "puzzle3.txt"]:
+            with self.subTest(filename=filename):
+                grid = sudoku.read_sudoku(filename)
+                self.assertEqual(1, dlx.count_solutions(grid))
+                self.assertEqual([sudoku.solve(grid)], dlx.solve_all(grid))
+
+    def test_count_all_4x4_grids(self):
+        self.assertEqual(288, dlx.count_solutions([["."] * 4 for _ in range(4)]))
+
+    def test_limit(self):
+        empty = [["."] * 9 for _ in range(9)]
+        self.assertEqual(2, dlx.count_solutions(empty, limit=2))
+        solutions = dlx.solve_all(empty, limit=3)
+        self.assertEqual(3, len(solutions))
+        self.assertTrue(all(is_valid(solution) for solution in solutions))
+
+    def test_16x16_and_25x25(self):
+        rnd = random.Random(16)
+        for box, blanks in ((4, 120), (5, 200)):
+            with self.subTest(size=box * box):
+                full = pattern_grid(box)
+                self.assertTrue(is_valid(full))
+                grid = [row[:] for row in full]
+                for cell in rnd.sample(range(box ** 4), blanks):
+                    grid[cell // (box * box)][cell % (box * box)] = "."
+                solutions = dlx.solve_all(grid, limit=1)
+                self.assertEqual(1, len(solutions))
+                self.assertTrue(is_valid(solutions[0]))
+
+    def test_conflicting_givens(self):
+        grid = [["."] * 9 for _ in range(9)]
+        grid[0][0] = grid[0][8] = "5"
+        self.assertEqual(0, dlx.count_solutions(grid))
+        self.assertEqual([], dlx.solve_all(grid))
+
+    def test_bad_size(self):
+        with self.assertRaises(ValueError):
+            dlx.count_solutions([["."] * 5 for _ in range(5)])
+
+    def test_empty_string_is_not_an_empty_cell(self):
+        grid = [["."] * 4 for _ in range(4)]
+        grid[1][2] = ""
+        with self.assertRaises(ValueError):
+            dlx.count_solutions(grid)
@@ -0,0 +1,68 @@
+import unittest
+
+import grid
+import sudoku
+from grid import Grid
+
+
+class GridTestCase(unittest.TestCase):
+    def setUp(self):
+        self.rows = sudoku.read_sudoku("puzzle1.txt")
+        self.grid = Grid.from_rows(self.rows)
+
+    def test_round_trip(self):
+        self.assertEqual(self.rows, self.grid.to_rows())
+        self.assertEqual(self.grid, Grid.from_string(self.grid.to_string()))
+
+    def test_views_match_legacy_helpers(self):
+        for r in range(9):
+            for c in range(9):
+                pos = (r, c)
+                with self.subTest(pos=pos):
+                    row = ["." if v == 0 else str(v) for v in self.grid.row(r)]
+                    col = ["." if v == 0 else str(v) for v in self.grid.col(c)]
+                    block = ["." if v == 0 else str(v) for v in self.grid.block(r, c)]
+                    self.assertEqual(sudoku.get_row(self.rows, pos), row)
+                    self.assertEqual(sudoku.get_col(self.rows, pos), col)
+                    self.assertEqual(sudoku.get_block(self.rows, pos), block)
+
+    def test_row_view_is_not_a_copy(self):
+        view = self.grid.row(0)
+        self.grid[0, 2] = 4
+        self.assertEqual(4, view[2])
+
+    def test_peers(self):
+        for i in range(81):
+            self.assertEqual(20, len(grid.PEERS[i]))
+            self.assertNotIn(i, grid.PEERS[i])
+        self.assertIn(80, grid.PEERS[60])
+        self.assertNotIn(80, grid.PEERS[59])
+
+    def test_empty_positions_are_cached_until_write(self):
+        empty = self.grid.empty_positions()
+        self.assertEqual(sudoku.find_empty_positions(self.rows), empty[0])
+        self.assertIs(self.grid.empty_cells(), self.grid.empty_cells())
+        self.assertIsInstance(self.grid.empty_cells(), tuple)
+        self.grid[0, 2] = 4
+        self.assertEqual(empty[1:], self.grid.empty_positions())
+
+    def test_possible_values(self):
+        self.assertEqual({1, 2, 4}, self.grid.possible_values(0, 2))
+        self.assertEqual({2, 5, 9}, self.grid.possible_values(4, 7))
+
+    def test_copy_is_independent(self):
+        copy = self.grid.copy()
+        copy[0, 2] = 4
+        self.assertEqual(0, self.grid[0, 2])
+
+    def test_solve_grid(self):
+        solution = sudoku.solve(self.grid)
+        self.assertIsInstance(solution, Grid)
+        self.assertTrue(sudoku.check_solution(solution))
+        self.assertEqual(sudoku.solve(self.rows), solution.to_rows())
+
+    def test_invalid_input(self):
+        with self.assertRaises(ValueError):
+            Grid(bytes(80))
+        with self.assertRaises(ValueError):
+            Grid.from_string("x" * 81)
@@ -0,0 +1,95 @@
+import unittest
+
+import solver
+import sudoku
+
+
+def read_values(filename):
+    return [0 if c == "." else int(c) for c in open(filename).read() if c in "123456789."]
+
+
+class SolverTestCase(unittest.TestCase):
+    def test_solves_puzzles(self):
+        for filename in ["puzzle1.txt", "puzzle2.txt", "puzzle3.txt"]:
+            with self.subTest(filename=filename):
+                puzzle = read_values(filename)
+                solution = solver.solve_values(puzzle)
+                self.assertTrue(sudoku.check_solution(sudoku.group([str(v) for v in solution], 9)))
+                for given, value in zip(puzzle, solution):
+                    if given:
+                        self.assertEqual(given, value)
+
+    def test_empty_grid(self):
+        solution = solver.solve_values([0] * 81)
+        self.assertTrue(sudoku.check_solution(sudoku.group([str(v) for v in solution], 9)))
+
+    def test_unsolvable(self):
+        puzzle = read_values("puzzle1.txt")
+        # The top left empty cell can only be 1, 2 or 4; put them all below it
+        puzzle[9 * 6 + 2] = 1
+        puzzle[9 * 7 + 2] = 2
+        puzzle[9 * 8 + 2] = 4
+        self.assertIsNone(solver.solve_values(puzzle))
+
+    def test_stats(self):
+        puzzle = read_values("puzzle3.txt")
+        stats = solver.SolverStats()
+        self.assertEqual(solver.solve_values(puzzle), solver.solve_values(puzzle, stats=stats))
+        self.assertEqual(1, stats.puzzles)
+        self.assertGreaterEqual(stats.nodes, 1)
+        self.assertLess(stats.backtracks, stats.nodes)
+        # Every empty cell is filled either by propagation or by a branch on the solution path
+        self.assertGreaterEqual(stats.propagations + stats.max_depth, puzzle.count(0))
+        self.assertEqual(set(solver.SolverStats.PHASES), set(stats.times))
+        self.assertIn(f"{stats.nodes} nodes", stats.format())
+
+    def test_stats_merge(self):
+        total = solver.SolverStats()
+        for filename in ["puzzle1.txt", "puzzle2.txt"]:
+            stats = solver.SolverStats()
+            solver.solve_values(read_values(filename), stats=stats)
+            total.merge(stats)
+        self.assertEqual(2, total.puzzles)
+        self.assertGreaterEqual(total.nodes, 2)
+
+    def test_transposition_table_reuses_solved_states(self):
+        puzzle = read_values("puzzle3.txt")
+        cache = solver.TranspositionTable(maxsize=10)
+        first, second = solver.SolverStats(), solver.SolverStats()
+        expected = solver.solve_values(puzzle)
+        self.assertEqual(expected, solver.solve_values(puzzle, stats=first, cache=cache))
+        self.assertEqual(expected, solver.solve_values(puzzle, stats=second, cache=cache))
+        self.assertEqual(1, second.nodes)
+        info = cache.info()
+        self.assertEqual(1, info.hits)
+        self.assertGreater(info.memory, 0)
+        self.assertEqual(len(cache), info.size)
+
+    def test_transposition_table_caches_dead_ends(self):
+        puzzle = read_values("puzzle1.txt")
+        puzzle[9 * 6 + 2] = 1
+        puzzle[9 * 7 + 2] = 2
+        puzzle[9 * 8 + 2] = 4
+        cache = solver.TranspositionTable()
+        self.assertIsNone(solver.solve_values(puzzle, cache=cache))
+        self.assertIsNone(solver.solve_values(puzzle, cache=cache))
+
+    def test_transposition_table_eviction(self):
+        cache = solver.TranspositionTable(maxsize=2)
+        for key in (b"a", b"b", b"c"):
+            cache.put(key, key * 81)
+        self.assertEqual(2, len(cache))
+        self.assertEqual(1, cache.evictions)
+        self.assertIsNone(cache.get(b"a"))
+        self.assertEqual(b"c" * 81, cache.get(b"c"))
+        cache.put(b"d", None)
+        self.assertEqual(b"", cache.get(b"d"))
+        self.assertIsNone(cache.get(b"b"))
+        self.assertEqual(
+            cache.memory,
+            sum(cache._entry_size(key, value) for key, value in cache._entries.items()),
+        )
+
+    def test_wrong_size(self):
+        with self.assertRaises(ValueError):
+            solver.solve_values([0] * 80)
@@ -1,5 +1,8 @@
+import random
 import unittest
 
+import dlx
+import solver
 import sudoku
 
 
@@ -240,3 +243,27 @@ class SudokuTestCase(unittest.TestCase):
         solution = sudoku.solve(grid)
         solved = sudoku.check_solution(solution)
         self.assertTrue(solved)
+
+    def test_generated_puzzles_are_unique(self):
+        for N in (40, 30, 25):
+            with self.subTest(N=N):
+                for grid in sudoku.iter_generate_sudoku(N, count=3, seed=N):
+                    self.assertEqual(N, sum(1 for row in grid for e in row if e != "."))
+                    self.assertEqual(1, dlx.count_solutions(grid, limit=2))
+
+    def test_generate_by_difficulty(self):
+        grid = sudoku.generate_sudoku(0, difficulty="hard")
+        self.assertEqual(
+            sudoku.DIFFICULTY_CLUES["hard"], sum(1 for row in grid for e in row if e != ".")
+        )
+
+    def test_few_clues_stay_unique(self):
+        rng = random.Random(22)
+        for N in (22, 24):
+            with self.subTest(N=N):
+                grid = sudoku.generate_sudoku(N, rng=rng, attempts=2)
+                clues = sum(1 for row in grid for e in row if e != ".")
+                self.assertGreaterEqual(clues, N)
+                self.assertEqual(1, dlx.count_solutions(grid, limit=2))
+                values = [0 if e == "." else int(e) for row in grid for e in row]
+                self.assertEqual(1, solver.count_solutions(values, limit=2))
@@ -0,0 +1,127 @@
+"""
+Замеры памяти и скорости реализаций игры «Жизнь».
+
+    $ python benchmark.py memory --size 10000
+    $ python benchmark.py scaling --size 8192 --workers 1 2 4 8
+"""
+
+import argparse
+import os
+import sys
+import time
+import tracemalloc
+from typing import List, Optional
+
+from life_bits import BitBoard
+from life_numpy import NumpyGameOfLife
+from life_parallel import ParallelGameOfLife
+
+
+def _format_bytes(size: float) -> str:
+    for unit in ("B", "KB", "MB", "GB"):
+        if size < 1024 or unit == "GB":
+            return f"{size:.1f} {unit}"
+        size /= 1024
+    return f"{size:.1f} GB"
+
+
+def list_grid_nbytes(rows: int, cols: int) -> int:
+    """
+    Память списка списков rows x cols, как в GameOfLife.create_grid: по указателю
+    на клетку в каждой строке плюс сами списки (объекты int 0 и 1 общие для всех
+    клеток). Строка строится одна, поэтому большие поля замерить можно.
+    """
+    row = [0] * cols
+    return sys.getsizeof([row] * rows) + rows * sys.getsizeof(row)
+
+
+def memory(size: int) -> None:
+    rows = cols = size
+    print(f"Board {rows} x {cols} ({rows * cols:,} cells)")
+    dense = list_grid_nbytes(rows, cols)
+    print(f"  List[List[int]]  {_format_bytes(dense):>10}  {dense / (rows * cols):.2f} B/cell")
+    print(f"  numpy uint8      {_format_bytes(rows * cols):>10}  1.00 B/cell")
+
+    tracemalloc.start()
+    board = BitBoard.random(rows, cols, seed=0)
+    allocated, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(
+        f"  BitBoard         {_format_bytes(board.nbytes):>10}  "
+        f"{board.nbytes * 8 / (rows * cols):.2f} bit/cell "
+        f"({_format_bytes(allocated)} allocated in total)"
+    )
+
+    started = time.perf_counter()
+    board = board.step()
+    elapsed = time.perf_counter() - started
+    print(
+        f"  BitBoard.step    {elapsed * 1000:.1f} ms ({rows * cols / elapsed / 1e6:.0f} Mcells/s)"
+    )
+
+
+def scaling(size: int, workers: List[int], generations: int) -> None:
+    rows = cols = size
+    print(f"Board {rows} x {cols}, {generations} generations, {os.cpu_count()} CPUs")
+    game = NumpyGameOfLife((rows, cols))
+    board = game.curr_generation
+    started = time.perf_counter()
+    for _ in range(generations):
+        game.step()
+    serial = (time.perf_counter() - started) / generations
+    print(f"  numpy      {serial * 1000:8.1f} ms/gen  {rows * cols / serial / 1e6:7.0f} Mcells/s")
+
+    def measure(count: int) -> float:
+        with ParallelGameOfLife((rows, cols), randomize=False, workers=count) as game:
+            game.curr_generation[...] = board
+            # Первый шаг - прогрев: процессы стартуют и подключают общую память
+            game.step()
+            started = time.perf_counter()
+            game.advance(generations)
+            return (time.perf_counter() - started) / generations
+
+    # Ускорение считается относительно настоящего прогона в одном процессе, а
+    # эффективность - относительно числа процессов, которые могут идти одновременно
+    cpus = os.cpu_count() or 1
+    single = measure(1)
+    for count in workers:
+        elapsed = single if count == 1 else measure(count)
+        speedup = single / elapsed
+        print(
+            f"  {count:2d} workers {elapsed * 1000:8.1f} ms/gen  "
+            f"{rows * cols / elapsed / 1e6:7.0f} Mcells/s  "
+            f"x{speedup:.2f} (efficiency {speedup / min(count, cpus):.0%})"
+        )
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Game of Life benchmarks.")
+    commands = parser.add_subparsers(dest="command", required=True)
+    memory_parser = commands.add_parser("memory", help="Memory used by the board representations")
+    memory_parser.add_argument(
+        "--size", type=int, default=10000, help="Board side (default: 10000)"
+    )
+    scaling_parser = commands.add_parser(
+        "scaling", help="Speedup of the parallel backend with the number of workers"
+    )
+    scaling_parser.add_argument("--size", type=int, default=8192, help="Board side (default: 8192)")
+    scaling_parser.add_argument(
+        "--workers",
+        type=int,
+        nargs="+",
+        default=[1, 2, 4, 8],
+        help="Numbers of worker processes (default: 1 2 4 8)",
+    )
+    scaling_parser.add_argument(
+        "--generations", type=int, default=20, help="Generations per measurement (default: 20)"
+    )
+    args = parser.parse_args(argv)
+
+    if args.command == "memory":
+        memory(args.size)
+    elif args.command == "scaling":
+        scaling(args.size, args.workers, args.generations)
+
+
+if __name__ == "__main__":
+    main()
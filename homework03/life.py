@@ -1,11 +1,95 @@
+import collections
 import copy
+import functools
+import importlib
+import operator
 import pathlib
 import random
-from typing import List, Optional, Tuple
+from typing import TYPE_CHECKING, Deque, Dict, List, NamedTuple, Optional, Tuple, Type, Union
+
+if TYPE_CHECKING:
+    import numpy as np
+
+    from life_bits import BitBoard
+    from life_sparse import LiveCells
 
 Cell = Tuple[int, int]
 Cells = List[int]
 Grid = List[Cells]
+# Поколение клеток: список списков или поле реализации (массив NumPy, BitBoard,
+# LiveCells), к клеткам которого обращаются так же, board[i][j]. Модули
+# реализаций здесь нужны только для проверки типов, см. BACKENDS
+Board = Union[Grid, "np.ndarray", "BitBoard", "LiveCells"]
+
+_MASK64 = (1 << 64) - 1
+
+
+def zobrist_key(index: int) -> int:
+    """
+    Случайное 64-битное число клетки номер index (row * cols + col) для хеша Зобриста.
+
+    Числа не хранятся таблицей, а получаются перемешиванием номера (splitmix64),
+    поэтому память под них не нужна даже для огромных полей.
+    """
+    key = (index + 0x9E3779B97F4A7C15) & _MASK64
+    key = ((key ^ (key >> 30)) * 0xBF58476D1CE4E5B9) & _MASK64
+    key = ((key ^ (key >> 27)) * 0x94D049BB133111EB) & _MASK64
+    return key ^ (key >> 31)
+
+
+class Cycle(NamedTuple):
+    """
+    Найденный цикл: поколение start повторяется через каждые period поколений.
+    """
+
+    period: int
+    start: int
+
+
+class CycleDetector:
+    """
+    Поиск циклов с периодом не больше max_period по хешам поколений.
+
+    Хеш поля - XOR zobrist_key живых клеток, поэтому после шага его достаточно
+    обновить XOR ключей изменившихся клеток. Хранятся хеши только последних
+    max_period поколений; совпадение 64-битных хешей разных полей считается
+    невозможным.
+    """
+
+    def __init__(self, max_period: int) -> None:
+        self.max_period = max_period
+        self.hash = 0
+        self._history: Deque[Tuple[int, int]] = collections.deque()
+        # Хеш -> поколение, для хешей из _history
+        self._seen: Dict[int, int] = {}
+
+    def reset(self, board_hash: int, generation: int) -> None:
+        """
+        Начать заново с поколения generation с хешем board_hash.
+        """
+        self.hash = board_hash
+        self._history.clear()
+        self._seen.clear()
+        self._remember(generation)
+
+    def update(self, changes_hash: int, generation: int) -> Optional[Cycle]:
+        """
+        Учесть шаг к поколению generation; вернуть цикл, если поле повторилось.
+        """
+        self.hash ^= changes_hash
+        start = self._seen.get(self.hash)
+        if start is not None:
+            return Cycle(generation - start, start)
+        self._remember(generation)
+        return None
+
+    def _remember(self, generation: int) -> None:
+        self._history.append((self.hash, generation))
+        self._seen[self.hash] = generation
+        if len(self._history) > self.max_period:
+            old_hash, old_generation = self._history.popleft()
+            if self._seen.get(old_hash) == old_generation:
+                del self._seen[old_hash]
 
 
 class GameOfLife:
@@ -25,8 +109,10 @@ class GameOfLife:
         self.max_generations = max_generations
         # Текущее число поколений
         self.generations = 1
+        # Поколение, посчитанное get_next_generation, и XOR ключей изменившихся в нем клеток
+        self._changes: Optional[Tuple[Board, int]] = None
 
-    def create_grid(self, randomize: bool = False) -> Grid:
+    def create_grid(self, randomize: bool = False) -> Board:
 
         if randomize == True:
             return [[random.randint(0, 1) for x in range(self.cols)] for _ in range(self.rows)]
@@ -42,8 +128,9 @@ class GameOfLife:
                     neighbours.append(self.curr_generation[row + i][col + j])
         return neighbours
 
-    def get_next_generation(self) -> Grid:
+    def get_next_generation(self) -> Board:
         new_gen = self.create_grid(False)
+        changes = 0
         for x in range(self.rows):
             for y in range(self.cols):
                 new_ngbrs = self.get_neighbours((x, y)).count(1)
@@ -51,16 +138,70 @@ class GameOfLife:
                     new_gen[x][y] = 1
                 elif self.curr_generation[x][y] == 1 and new_ngbrs in [2, 3]:
                     new_gen[x][y] = 1
+                if new_gen[x][y] != self.curr_generation[x][y]:
+                    changes ^= zobrist_key(x * self.cols + y)
+        self._changes = (new_gen, changes)
         return new_gen
 
     def step(self) -> None:
         """
         Выполнить один шаг игры.
         """
-        self.prev_generation = self.curr_generation[:]
+        self.prev_generation = copy.copy(self.curr_generation)
         self.curr_generation = self.get_next_generation()
         self.generations += 1
 
+    def board_hash(self) -> int:
+        """
+        Хеш Зобриста текущего поколения.
+        """
+        keys = (
+            zobrist_key(row * self.cols + col)
+            for row, values in enumerate(self.curr_generation)
+            for col, value in enumerate(values)
+            if value
+        )
+        return functools.reduce(operator.xor, keys, 0)
+
+    def changes_hash(self) -> int:
+        """
+        XOR ключей клеток, изменившихся за последний шаг: хеш текущего поколения
+        равен хешу предыдущего, сложенному по XOR с этим числом.
+
+        Если текущее поколение посчитано get_next_generation, число уже собрано
+        по ходу шага из перевернувшихся клеток; иначе поколения сравниваются
+        целиком.
+        """
+        if self._changes is not None and self._changes[0] is self.curr_generation:
+            return self._changes[1]
+        result = 0
+        for row, (prev, curr) in enumerate(zip(self.prev_generation, self.curr_generation)):
+            if prev == curr:
+                continue
+            for col, (old, new) in enumerate(zip(prev, curr)):
+                if old != new:
+                    result ^= zobrist_key(row * self.cols + col)
+        return result
+
+    def run(self, max_period: int = 15) -> Optional[Cycle]:
+        """
+        Выполнять шаги без интерфейса, пока не будет достигнуто max_generations
+        или поле не зациклится с периодом не больше max_period (период 1 - поле
+        перестало меняться). Вернуть найденный цикл или None. Если max_generations
+        не задано, а период поля больше max_period, шаги не закончатся.
+
+        По умолчанию max_period = 15, чтобы поймать и пентадекатлон, самый
+        длиннопериодный из частых в случайных полях осцилляторов.
+        """
+        detector = CycleDetector(max_period)
+        detector.reset(self.board_hash(), self.generations)
+        while self.max_generations is None or self.generations < self.max_generations:
+            self.step()
+            cycle = detector.update(self.changes_hash(), self.generations)
+            if cycle is not None:
+                return cycle
+        return None
+
     @property
     def is_max_generations_exceeded(self) -> bool:
         """
@@ -75,16 +216,16 @@ class GameOfLife:
         """
         return self.prev_generation != self.curr_generation
 
-    @staticmethod
-    def from_file(filename: pathlib.Path) -> "GameOfLife":
+    @classmethod
+    def from_file(cls, filename: pathlib.Path) -> "GameOfLife":
         """
         Прочитать состояние клеток из указанного файла.
         """
         with open(filename) as file:
-            grid = [[int(x) for x in list(rw)] for rw in file.readline()]
+            grid = [[int(x) for x in rw.strip()] for rw in file if rw.strip()]
         row, col = len(grid), len(grid[0])
 
-        game = GameOfLife((row, col))
+        game = cls((row, col), randomize=False)
         game.curr_generation = grid
         return game
 
@@ -92,7 +233,30 @@ class GameOfLife:
         """
         Сохранить текущее состояние клеток в указанный файл.
         """
-        with open(filename) as file:
+        with open(filename, "w") as file:
             for row in self.curr_generation:
                 file.write("".join([str(x) for x in row]))
                 file.write("\n")
+
+
+# Реализации игры: имя -> "модуль:класс"; модули импортируются при выборе,
+# чтобы для обычной игры не требовались их зависимости (например, NumPy)
+BACKENDS: Dict[str, str] = {
+    "dense": "life:GameOfLife",
+    "numpy": "life_numpy:NumpyGameOfLife",
+    "bits": "life_bits:BitGameOfLife",
+    "hashlife": "life_hashlife:HashLifeGameOfLife",
+    "sparse": "life_sparse:SparseGameOfLife",
+    "tiles": "life_tiles:TiledGameOfLife",
+    "parallel": "life_parallel:ParallelGameOfLife",
+}
+
+
+def get_backend(name: str) -> Type[GameOfLife]:
+    """
+    Вернуть класс игры для реализации name (см. BACKENDS).
+    """
+    if name not in BACKENDS:
+        raise ValueError(f"Unknown backend {name!r}, expected one of {', '.join(BACKENDS)}")
+    module_name, class_name = BACKENDS[name].split(":")
+    return getattr(importlib.import_module(module_name), class_name)
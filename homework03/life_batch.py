@@ -0,0 +1,288 @@
+"""
+Пакетный прогон игры «Жизнь» на случайных полях без интерфейса.
+
+    $ python life_batch.py --size 128 128 --density 0.35 --seeds 0 1000 \
+        --generations 5000 --workers 4 -o results.csv
+
+Для каждого зерна из диапазона [start, stop) строится случайное поле заданной
+плотности, игра идет до зацикливания (см. GameOfLife.run) или до предела
+поколений. Результаты пишутся потоком в CSV или JSONL (формат выбирается по
+расширению файла или --format) в порядке зерен; поколение 0 - исходное поле.
+Сводка со скоростью в поколениях в секунду печатается в stderr.
+"""
+
+import argparse
+import collections
+import concurrent.futures
+import csv
+import itertools
+import json
+import sys
+import time
+from typing import Any, Deque, Iterable, Iterator, List, NamedTuple, Optional, TextIO, Tuple
+
+import numpy as np
+
+import life
+
+FORMATS = ("csv", "jsonl")
+# HashLife считает неограниченную плоскость, а не поле с мертвыми клетками за
+# краем, и дает на тех же зернах другие поколения и периоды. Parallel запускает
+# свои процессы на каждое поле, а пакет и так делится между процессами (--workers)
+BACKENDS = tuple(sorted(name for name in life.BACKENDS if name not in ("hashlife", "parallel")))
+
+
+class Result(NamedTuple):
+    """
+    Итог одного прогона: stable_at - поколение, с которого поле повторяется
+    с периодом period (None, если цикл не найден до предела поколений).
+    """
+
+    seed: int
+    rows: int
+    cols: int
+    density: float
+    generations: int
+    population: int
+    stable_at: Optional[int]
+    period: Optional[int]
+    seconds: float
+
+
+class Params(NamedTuple):
+    """
+    Параметры прогона, общие для всех зерен.
+    """
+
+    size: Tuple[int, int]
+    density: float
+    max_generations: int
+    max_period: int = 15
+    backend: str = "numpy"
+
+
+def random_board(size: Tuple[int, int], density: float, seed: int) -> np.ndarray:
+    """
+    Случайное поле, в котором каждая клетка жива с вероятностью density.
+    """
+    rng = np.random.default_rng(seed)
+    return (rng.random(size) < density).view(np.uint8)
+
+
+def population(grid: Any) -> int:
+    """
+    Число живых клеток; у BitBoard и LiveCells оно считается без обхода клеток.
+    """
+    count = getattr(grid, "population", None)
+    if count is not None:
+        return int(count() if callable(count) else count)
+    return int(np.count_nonzero(np.asarray(grid)))
+
+
+def simulate(seed: int, params: Params) -> Result:
+    if params.backend not in BACKENDS:
+        raise ValueError(
+            f"Unsupported backend {params.backend!r}, expected one of {', '.join(BACKENDS)}"
+        )
+    started = time.perf_counter()
+    # GameOfLife считает поколения с 1, поэтому max_generations шагов - это предел + 1
+    game = life.get_backend(params.backend)(
+        params.size, randomize=False, max_generations=params.max_generations + 1
+    )
+    board = random_board(params.size, params.density, seed)
+    # Массив NumPy отдается только реализациям, которые сами хранят поле так
+    native = isinstance(game.curr_generation, np.ndarray)
+    game.curr_generation = board if native else board.tolist()
+    try:
+        cycle = game.run(max_period=params.max_period)
+    finally:
+        if hasattr(game, "close"):
+            game.close()
+    rows, cols = params.size
+    return Result(
+        seed=seed,
+        rows=rows,
+        cols=cols,
+        density=params.density,
+        generations=game.generations - 1,
+        population=population(game.curr_generation),
+        stable_at=None if cycle is None else cycle.start - 1,
+        period=None if cycle is None else cycle.period,
+        seconds=time.perf_counter() - started,
+    )
+
+
+def _simulate_chunk(seeds: List[int], params: Params) -> List[Result]:
+    return [simulate(seed, params) for seed in seeds]
+
+
+def _chunks(seeds: Iterable[int], size: int) -> Iterator[List[int]]:
+    iterator = iter(seeds)
+    while True:
+        chunk = list(itertools.islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def simulate_stream(
+    seeds: Iterable[int],
+    params: Params,
+    workers: int = 1,
+    chunk_size: int = 4,
+    max_pending: int = 0,
+) -> Iterator[Result]:
+    """
+    Прогоняет поля для всех seeds, возвращая результаты в порядке зерен.
+    В работе одновременно не больше max_pending порций (по умолчанию 4 на процесс).
+    """
+    chunks = _chunks(seeds, chunk_size)
+    if workers <= 1:
+        for chunk in chunks:
+            yield from _simulate_chunk(chunk, params)
+        return
+
+    max_pending = max_pending or 4 * workers
+    with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as pool:
+        pending: Deque[concurrent.futures.Future] = collections.deque()
+        for chunk in chunks:
+            pending.append(pool.submit(_simulate_chunk, chunk, params))
+            if len(pending) >= max_pending:
+                yield from pending.popleft().result()
+        while pending:
+            yield from pending.popleft().result()
+
+
+class Summary:
+    """
+    Сводка по прогонам: число полей, поколений и найденных периодов.
+    """
+
+    def __init__(self) -> None:
+        self.runs = 0
+        self.generations = 0
+        self.cells = 0
+        self.periods: "collections.Counter[Optional[int]]" = collections.Counter()
+
+    def add(self, result: Result) -> None:
+        self.runs += 1
+        self.generations += result.generations
+        self.cells += result.generations * result.rows * result.cols
+        self.periods[result.period] += 1
+
+    def format(self, elapsed: float) -> str:
+        rate = self.generations / elapsed if elapsed > 0 else 0.0
+        cell_rate = self.cells / elapsed if elapsed > 0 else 0.0
+        periods = ", ".join(
+            f"{'none' if period is None else period}: {count}"
+            for period, count in sorted(
+                self.periods.items(), key=lambda item: (item[0] is None, item[0] or 0)
+            )
+        )
+        return "\n".join(
+            [
+                f"Ran {self.runs} boards, {self.generations} generations in {elapsed:.2f} s",
+                f"Throughput: {rate:.0f} generations/s ({cell_rate / 1e6:.1f} Mcells/s)",
+                f"Periods: {periods or '-'}",
+            ]
+        )
+
+
+def run(
+    dst: TextIO,
+    seeds: Iterable[int],
+    params: Params,
+    output_format: str = "csv",
+    workers: int = 1,
+    chunk_size: int = 4,
+) -> Tuple[Summary, float]:
+    """Прогоняет поля и пишет результаты в dst; возвращает сводку и общее время"""
+    if output_format not in FORMATS:
+        raise ValueError(f"Unknown format {output_format!r}, expected one of {', '.join(FORMATS)}")
+    writer = csv.writer(dst) if output_format == "csv" else None
+    if writer is not None:
+        writer.writerow(Result._fields)
+    summary = Summary()
+    started = time.perf_counter()
+    for result in simulate_stream(seeds, params, workers=workers, chunk_size=chunk_size):
+        if writer is not None:
+            writer.writerow(["" if value is None else value for value in result])
+        else:
+            dst.write(json.dumps(result._asdict()))
+            dst.write("\n")
+        dst.flush()
+        summary.add(result)
+    return summary, time.perf_counter() - started
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Run Game of Life on random boards headlessly.")
+    parser.add_argument(
+        "--size",
+        type=int,
+        nargs=2,
+        default=[64, 64],
+        metavar=("ROWS", "COLS"),
+        help="Board size (default: 64 64)",
+    )
+    parser.add_argument(
+        "--density", type=float, default=0.5, help="Share of live cells (default: 0.5)"
+    )
+    parser.add_argument(
+        "--seeds",
+        type=int,
+        nargs=2,
+        default=[0, 100],
+        metavar=("START", "STOP"),
+        help="Seed range [START, STOP) (default: 0 100)",
+    )
+    parser.add_argument(
+        "--generations", type=int, default=1000, help="Generation cap per board (default: 1000)"
+    )
+    parser.add_argument(
+        "--max-period", type=int, default=15, help="Longest period to detect (default: 15)"
+    )
+    parser.add_argument(
+        "--backend",
+        choices=BACKENDS,
+        default="numpy",
+        help="Game implementation (default: numpy)",
+    )
+    parser.add_argument(
+        "-w", "--workers", type=int, default=1, help="Worker processes (default: 1)"
+    )
+    parser.add_argument("--chunk-size", type=int, default=4, help="Boards per task (default: 4)")
+    parser.add_argument("-o", "--output", help="Result file (default: stdout)")
+    parser.add_argument(
+        "--format", choices=FORMATS, help="Output format (default: by extension, else csv)"
+    )
+    args = parser.parse_args(argv)
+
+    output_format = args.format
+    if output_format is None:
+        output_format = "jsonl" if args.output and args.output.endswith(".jsonl") else "csv"
+    params = Params(
+        size=(args.size[0], args.size[1]),
+        density=args.density,
+        max_generations=args.generations,
+        max_period=args.max_period,
+        backend=args.backend,
+    )
+    dst = open(args.output, "w", newline="") if args.output else sys.stdout
+    try:
+        summary, elapsed = run(
+            dst,
+            range(*args.seeds),
+            params,
+            output_format=output_format,
+            workers=args.workers,
+            chunk_size=args.chunk_size,
+        )
+    finally:
+        if args.output:
+            dst.close()
+    print(summary.format(elapsed), file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,248 @@
+import random
+from typing import Iterator, List, Optional, Tuple, Union, overload
+
+import numpy as np
+
+from life import GameOfLife, Grid
+from life_numpy import zobrist_hash
+
+WORD_BITS = 64
+
+
+class BitRow:
+    """
+    Строка BitBoard, чтобы к клеткам можно было обращаться как board[i][j].
+    """
+
+    __slots__ = ("board", "row")
+
+    def __init__(self, board: "BitBoard", row: int) -> None:
+        self.board = board
+        self.row = row
+
+    def __len__(self) -> int:
+        return self.board.cols
+
+    def __getitem__(self, col: int) -> int:
+        return self.board[self.row, col]
+
+    def __setitem__(self, col: int, value: int) -> None:
+        self.board[self.row, col] = value
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(self.tolist())
+
+    def tolist(self) -> List[int]:
+        bits = np.unpackbits(self.board.words[self.row].view(np.uint8), bitorder="little")
+        return bits[: self.board.cols].tolist()
+
+
+class BitBoard:
+    """
+    Поле rows x cols по одному биту на клетку.
+
+    Строка поля - words слов uint64, клетка (r, c) - бит c % 64 слова c // 64
+    строки r; биты за последним столбцом всегда нулевые. Следующее поколение
+    считается побитовыми сумматорами, так что одна операция над словом
+    обновляет сразу 64 клетки.
+    """
+
+    __slots__ = ("rows", "cols", "words")
+
+    def __init__(self, rows: int, cols: int, words: Optional[np.ndarray] = None) -> None:
+        self.rows = rows
+        self.cols = cols
+        width = (cols + WORD_BITS - 1) // WORD_BITS
+        if words is None:
+            words = np.zeros((rows, width), dtype=np.uint64)
+        elif words.shape != (rows, width) or words.dtype != np.uint64:
+            raise ValueError(f"Expected a ({rows}, {width}) uint64 array, got {words.shape}")
+        self.words = words
+
+    @classmethod
+    def from_grid(cls, grid: Union[Grid, np.ndarray]) -> "BitBoard":
+        """
+        Упаковать поле из списка списков (или массива) нулей и единиц.
+        """
+        cells = np.asarray(grid, dtype=np.uint8)
+        if cells.ndim != 2:
+            raise ValueError("Expected a two-dimensional grid")
+        rows, cols = cells.shape
+        board = cls(rows, cols)
+        packed = np.packbits(cells != 0, axis=1, bitorder="little")
+        board.words.view(np.uint8)[:, : packed.shape[1]] = packed
+        return board
+
+    @classmethod
+    def random(cls, rows: int, cols: int, seed: Optional[int] = None) -> "BitBoard":
+        """
+        Случайное поле, в котором каждая клетка жива с вероятностью 1/2.
+        """
+        board = cls(rows, cols)
+        rng = np.random.default_rng(seed)
+        board.words[...] = rng.integers(0, 2**64, size=board.words.shape, dtype=np.uint64)
+        board._clear_padding()
+        return board
+
+    def to_numpy(self) -> np.ndarray:
+        bits = np.unpackbits(self.words.view(np.uint8), axis=1, bitorder="little")
+        return bits[:, : self.cols]
+
+    def to_grid(self) -> Grid:
+        """
+        Распаковать в список списков, как у GameOfLife.
+        """
+        return self.to_numpy().tolist()
+
+    def copy(self) -> "BitBoard":
+        return BitBoard(self.rows, self.cols, self.words.copy())
+
+    @property
+    def nbytes(self) -> int:
+        return self.words.nbytes
+
+    def population(self) -> int:
+        return int(np.unpackbits(self.words.view(np.uint8)).sum())
+
+    def __len__(self) -> int:
+        return self.rows
+
+    @overload
+    def __getitem__(self, key: int) -> BitRow: ...
+
+    @overload
+    def __getitem__(self, key: Tuple[int, int]) -> int: ...
+
+    def __getitem__(self, key: Union[int, Tuple[int, int]]) -> Union[int, BitRow]:
+        if isinstance(key, tuple):
+            row, col = key
+            return int(self.words[row, col // WORD_BITS] >> np.uint64(col % WORD_BITS)) & 1
+        return BitRow(self, key)
+
+    def __setitem__(self, key: Tuple[int, int], value: int) -> None:
+        row, col = key
+        bit = np.uint64(1) << np.uint64(col % WORD_BITS)
+        if value:
+            self.words[row, col // WORD_BITS] |= bit
+        else:
+            self.words[row, col // WORD_BITS] &= ~bit
+
+    def __iter__(self) -> Iterator[BitRow]:
+        return (BitRow(self, row) for row in range(self.rows))
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, BitBoard):
+            return (self.rows, self.cols) == (other.rows, other.cols) and bool(
+                np.array_equal(self.words, other.words)
+            )
+        if isinstance(other, (list, np.ndarray)):
+            return self.to_grid() == np.asarray(other).tolist()
+        return NotImplemented
+
+    def _clear_padding(self) -> None:
+        tail = self.cols % WORD_BITS
+        if tail:
+            self.words[:, -1] &= np.uint64((1 << tail) - 1)
+
+    def step(self) -> "BitBoard":
+        """
+        Следующее поколение (B3/S23, за краем поля - мертвые клетки).
+
+        Для каждой строки складываются клетка и ее соседи слева и справа
+        (двухбитовая сумма h1 h0), затем суммы трех соседних строк. Полученная
+        сумма квадрата 3 x 3 вместе с самой клеткой сравнивается с 3 и 4, как
+        в life_numpy.
+        """
+        one = np.uint64(1)
+        high = np.uint64(WORD_BITS - 1)
+        x = self.words
+        # Соседи слева и справа: сдвиг на бит с переносом между словами строки
+        west = x << one
+        west[:, 1:] |= x[:, :-1] >> high
+        east = x >> one
+        east[:, :-1] |= x[:, 1:] << high
+
+        h0 = west ^ x ^ east
+        h1 = (west & x) | (east & (west ^ x))
+        del west, east
+
+        def up(plane: np.ndarray) -> np.ndarray:
+            shifted = np.zeros_like(plane)
+            shifted[1:] = plane[:-1]
+            return shifted
+
+        def down(plane: np.ndarray) -> np.ndarray:
+            shifted = np.zeros_like(plane)
+            shifted[:-1] = plane[1:]
+            return shifted
+
+        a0, c0 = up(h0), down(h0)
+        a1, c1 = up(h1), down(h1)
+        # Младший бит суммы трех строк и перенос в следующий разряд
+        s0 = a0 ^ h0 ^ c0
+        k0 = (a0 & h0) | (c0 & (a0 ^ h0))
+        del a0, c0, h0
+        # m = h1 сверху + h1 + h1 снизу + перенос, m от 0 до 4 (биты m2 m1 m0)
+        t0 = a1 ^ h1 ^ c1
+        t1 = (a1 & h1) | (c1 & (a1 ^ h1))
+        del a1, c1, h1
+        m0 = t0 ^ k0
+        carry = t0 & k0
+        m1 = t1 ^ carry
+        m2 = t1 & carry
+        # Сумма 3 (s0 = 1, m = 1) или живая клетка с суммой 4 (s0 = 0, m = 2)
+        few = ~m2 & (m1 ^ m0)
+        born = s0 & m0 & few
+        survive = ~s0 & x & m1 & few
+        board = BitBoard(self.rows, self.cols, born | survive)
+        board._clear_padding()
+        return board
+
+
+class BitGameOfLife(GameOfLife):
+    """
+    Игра «Жизнь» на упакованном поле BitBoard (один бит на клетку).
+
+    curr_generation и prev_generation - объекты BitBoard, к клеткам которых
+    можно обращаться как curr_generation[i][j] (в том числе менять их).
+    Если присвоить curr_generation список списков, он упаковывается при следующем шаге.
+    """
+
+    curr_generation: Union[Grid, BitBoard]
+    prev_generation: BitBoard
+
+    def create_grid(self, randomize: bool = False) -> BitBoard:
+        if randomize:
+            return BitBoard.random(self.rows, self.cols, seed=random.getrandbits(64))
+        return BitBoard(self.rows, self.cols)
+
+    def _board(self) -> BitBoard:
+        if not isinstance(self.curr_generation, BitBoard):
+            self.curr_generation = BitBoard.from_grid(self.curr_generation)
+        return self.curr_generation
+
+    def get_next_generation(self) -> BitBoard:
+        return self._board().step()
+
+    def step(self) -> None:
+        """
+        Выполнить один шаг игры.
+        """
+        self.prev_generation = self._board()
+        self.curr_generation = self.prev_generation.step()
+        self.generations += 1
+
+    def board_hash(self) -> int:
+        return zobrist_hash(self._board().to_numpy())
+
+    def changes_hash(self) -> int:
+        # Изменившиеся клетки - единичные биты XOR слов двух поколений
+        changed = BitBoard(self.rows, self.cols, self.prev_generation.words ^ self._board().words)
+        return zobrist_hash(changed.to_numpy())
+
+    @property
+    def is_changing(self) -> bool:
+        """
+        Изменилось ли состояние клеток с предыдущего шага.
+        """
+        return self.prev_generation != self.curr_generation
@@ -0,0 +1,385 @@
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from life import Cell, GameOfLife, Grid
+
+
+class Node:
+    """
+    Узел квадродерева: квадрат 2**level x 2**level из четырех квадрантов.
+
+    Узлы канонизируются (HashLife.join), поэтому одинаковые квадраты - один и
+    тот же объект, и сравнивать их можно по идентичности. В _next хранятся
+    уже посчитанные результаты: центр узла через 2**j поколений.
+    """
+
+    __slots__ = ("nw", "ne", "sw", "se", "level", "population", "_next")
+
+    def __init__(
+        self,
+        nw: "Node",
+        ne: "Node",
+        sw: "Node",
+        se: "Node",
+        level: int,
+        population: int,
+    ) -> None:
+        self.nw = nw
+        self.ne = ne
+        self.sw = sw
+        self.se = se
+        self.level = level
+        self.population = population
+        self._next: Dict[int, "Node"] = {}
+
+    @classmethod
+    def leaf(cls, population: int) -> "Node":
+        """
+        Клетка - узел уровня 0. Квадрантов у нее нет, и вместо них она ссылается
+        на себя: так у любого узла четыре потомка-узла, а обходы поля все равно
+        останавливаются на уровне 0.
+        """
+        node = cls.__new__(cls)
+        node.nw = node.ne = node.sw = node.se = node
+        node.level = 0
+        node.population = population
+        node._next = {}
+        return node
+
+    def children(self) -> Tuple["Node", "Node", "Node", "Node"]:
+        return self.nw, self.ne, self.sw, self.se
+
+
+DEAD = Node.leaf(0)
+ALIVE = Node.leaf(1)
+
+
+class HashLife:
+    """
+    Неограниченная вселенная «Жизни» по алгоритму HashLife (Госпер).
+
+    Поле - квадродерево из канонических узлов с центром в начале координат:
+    узел уровня k покрывает клетки с координатами от -2**(k-1) до 2**(k-1) - 1.
+    Результаты узлов запоминаются, поэтому повторяющиеся части поля и
+    повторяющиеся моменты времени считаются один раз, а step_pow2(k)
+    продвигает поле сразу на 2**k поколений.
+
+    Таблица узлов ограничена max_nodes: если после шага она больше, из нее
+    удаляются узлы, недостижимые из текущего поля и из pinned, и сбрасываются
+    запомненные результаты.
+    """
+
+    def __init__(self, max_nodes: int = 1_000_000) -> None:
+        self.max_nodes = max_nodes
+        self.generation = 0
+        self.collections = 0
+        self._nodes: Dict[Tuple[Node, Node, Node, Node], Node] = {}
+        self._empty: List[Node] = [DEAD]
+        # Узлы, которые сборка мусора должна сохранить вместе с root
+        self.pinned: List[Node] = []
+        self.root = self.empty(3)
+
+    @property
+    def nodes(self) -> int:
+        return len(self._nodes)
+
+    @property
+    def population(self) -> int:
+        return self.root.population
+
+    def join(self, nw: Node, ne: Node, sw: Node, se: Node) -> Node:
+        key = (nw, ne, sw, se)
+        node = self._nodes.get(key)
+        if node is None:
+            population = nw.population + ne.population + sw.population + se.population
+            node = Node(nw, ne, sw, se, nw.level + 1, population)
+            self._nodes[key] = node
+        return node
+
+    def empty(self, level: int) -> Node:
+        while len(self._empty) <= level:
+            smaller = self._empty[-1]
+            self._empty.append(self.join(smaller, smaller, smaller, smaller))
+        return self._empty[level]
+
+    def centre(self, node: Node) -> Node:
+        """
+        Узел на уровень больше, в центре которого находится node.
+        """
+        border = self.empty(node.level - 1)
+        return self.join(
+            self.join(border, border, border, node.nw),
+            self.join(border, border, node.ne, border),
+            self.join(border, node.sw, border, border),
+            self.join(node.se, border, border, border),
+        )
+
+    # Клетки
+
+    def set_cells(self, cells: Iterable[Cell]) -> None:
+        """
+        Заменить поле: живы ровно клетки cells, заданные как (строка, столбец).
+        """
+        points = list(set(cells))
+        # Узел уровня k покрывает координаты от -2**(k-1) до 2**(k-1) - 1
+        extent = max((x + 1 if x >= 0 else -x for point in points for x in point), default=1)
+        level = 3
+        while 2 ** (level - 1) < extent:
+            level += 1
+        self.root = self._build(level, -(2 ** (level - 1)), -(2 ** (level - 1)), points)
+
+    def _build(self, level: int, top: int, left: int, points: List[Cell]) -> Node:
+        if not points:
+            return self.empty(level)
+        if level == 0:
+            return ALIVE
+        half = 2 ** (level - 1)
+        quadrants: Tuple[List[Cell], ...] = ([], [], [], [])
+        for row, col in points:
+            quadrants[(row >= top + half) * 2 + (col >= left + half)].append((row, col))
+        return self.join(
+            self._build(level - 1, top, left, quadrants[0]),
+            self._build(level - 1, top, left + half, quadrants[1]),
+            self._build(level - 1, top + half, left, quadrants[2]),
+            self._build(level - 1, top + half, left + half, quadrants[3]),
+        )
+
+    def cells(self) -> Set[Cell]:
+        """
+        Координаты всех живых клеток.
+        """
+        result: Set[Cell] = set()
+        half = 2 ** (self.root.level - 1)
+        self._collect(self.root, -half, -half, result)
+        return result
+
+    def _collect(self, node: Node, top: int, left: int, result: Set[Cell]) -> None:
+        if node.population == 0:
+            return
+        if node.level == 0:
+            result.add((top, left))
+            return
+        half = 2 ** (node.level - 1)
+        self._collect(node.nw, top, left, result)
+        self._collect(node.ne, top, left + half, result)
+        self._collect(node.sw, top + half, left, result)
+        self._collect(node.se, top + half, left + half, result)
+
+    @classmethod
+    def from_grid(cls, grid: Grid, max_nodes: int = 1_000_000) -> "HashLife":
+        universe = cls(max_nodes=max_nodes)
+        universe.set_cells(
+            (row, col)
+            for row, values in enumerate(grid)
+            for col, value in enumerate(values)
+            if value
+        )
+        return universe
+
+    def to_grid(self, rows: int, cols: int) -> Grid:
+        """
+        Окно rows x cols с левым верхним углом в клетке (0, 0).
+        """
+        grid = [[0] * cols for _ in range(rows)]
+        for row, col in self.cells():
+            if 0 <= row < rows and 0 <= col < cols:
+                grid[row][col] = 1
+        return grid
+
+    # Поколения
+
+    def _life_4x4(self, node: Node) -> Node:
+        """
+        Центр 2 x 2 квадрата 4 x 4 через одно поколение.
+        """
+        quads = [quad.children() for quad in node.children()]
+        # Клетка (r, c) лежит в квадранте (r // 2, c // 2) на месте (r % 2, c % 2)
+        cells = [
+            [quads[r // 2 * 2 + c // 2][r % 2 * 2 + c % 2].population for c in range(4)]
+            for r in range(4)
+        ]
+        result = []
+        for row in (1, 2):
+            for col in (1, 2):
+                total = sum(
+                    cells[r][c] for r in range(row - 1, row + 2) for c in range(col - 1, col + 2)
+                )
+                alive = total == 3 or (total == 4 and cells[row][col] == 1)
+                result.append(ALIVE if alive else DEAD)
+        return self.join(*result)
+
+    def _successor(self, node: Node, j: int) -> Node:
+        """
+        Центральный квадрант узла через 2**j поколений (j <= node.level - 2).
+        """
+        cached = node._next.get(j)
+        if cached is not None:
+            return cached
+        if node.population == 0:
+            result = node.nw
+        elif node.level == 2:
+            result = self._life_4x4(node)
+        else:
+            nw, ne, sw, se = node.children()
+            join, step = self.join, self._successor
+            # Девять перекрывающихся квадратов на уровень меньше
+            squares = [
+                nw,
+                join(nw.ne, ne.nw, nw.se, ne.sw),
+                ne,
+                join(nw.sw, nw.se, sw.nw, sw.ne),
+                join(nw.se, ne.sw, sw.ne, se.nw),
+                join(ne.sw, ne.se, se.nw, se.ne),
+                sw,
+                join(sw.ne, se.nw, sw.se, se.sw),
+                se,
+            ]
+            if j < node.level - 2:
+                # Каждый из девяти уже продвинут на 2**j - осталось взять их центры
+                c = [step(square, j) for square in squares]
+                result = join(
+                    join(c[0].se, c[1].sw, c[3].ne, c[4].nw),
+                    join(c[1].se, c[2].sw, c[4].ne, c[5].nw),
+                    join(c[3].se, c[4].sw, c[6].ne, c[7].nw),
+                    join(c[4].se, c[5].sw, c[7].ne, c[8].nw),
+                )
+            else:
+                # Два полушага по 2**(j - 1) поколений
+                c = [step(square, j - 1) for square in squares]
+                result = join(
+                    step(join(c[0], c[1], c[3], c[4]), j - 1),
+                    step(join(c[1], c[2], c[4], c[5]), j - 1),
+                    step(join(c[3], c[4], c[6], c[7]), j - 1),
+                    step(join(c[4], c[5], c[7], c[8]), j - 1),
+                )
+        node._next[j] = result
+        return result
+
+    def step_pow2(self, k: int) -> None:
+        """
+        Продвинуть поле на 2**k поколений за один вызов.
+        """
+        root = self.root
+        # Все живые клетки должны лежать в центральной четверти узла ...
+        while root.level < k + 2 or not self._is_padded(root):
+            root = self.centre(root)
+        # ... и еще один уровень, чтобы за 2**k поколений они не вышли за результат
+        root = self.centre(root)
+        self.root = self._successor(root, k)
+        self.generation += 2**k
+        if len(self._nodes) > self.max_nodes:
+            self.collect_garbage()
+
+    @staticmethod
+    def _is_padded(node: Node) -> bool:
+        nw, ne, sw, se = node.children()
+        return (
+            nw.population == nw.se.se.population
+            and ne.population == ne.sw.sw.population
+            and sw.population == sw.ne.ne.population
+            and se.population == se.nw.nw.population
+        )
+
+    def advance(self, generations: int) -> None:
+        """
+        Продвинуть поле на generations поколений (по двоичным разрядам числа).
+        """
+        k = 0
+        while generations:
+            if generations & 1:
+                self.step_pow2(k)
+            generations >>= 1
+            k += 1
+
+    def collect_garbage(self) -> None:
+        """
+        Оставить в таблице только узлы текущего поля, pinned и пустые узлы;
+        запомненные результаты сбрасываются, так как могут ссылаться на удаленные узлы.
+        """
+        alive: Dict[Tuple[Node, Node, Node, Node], Node] = {}
+        stack = [self.root] + self.pinned + self._empty[1:]
+        while stack:
+            node = stack.pop()
+            if node.level == 0:
+                continue
+            key = (node.nw, node.ne, node.sw, node.se)
+            if key in alive:
+                continue
+            alive[key] = node
+            stack.extend(node.children())
+        for node in self._nodes.values():
+            node._next.clear()
+        self._nodes = alive
+        self.collections += 1
+
+
+class HashLifeGameOfLife(GameOfLife):
+    """
+    Игра «Жизнь» на HashLife.
+
+    В отличие от остальных реализаций, поле не ограничено: клетки, ушедшие за
+    край окна rows x cols, продолжают жить, а curr_generation - только окно
+    с левым верхним углом в (0, 0). Это не семантика ограниченного поля
+    GameOfLife (за краем - мертвые клетки): совпадение с обычной игрой
+    гарантировано, только пока узор не доходит до края окна, а потом
+    поколения, is_changing и найденные run() циклы расходятся с остальными
+    реализациями. Поэтому life_batch эту реализацию не предлагает. Если curr_generation
+    заменить или изменить снаружи, вселенная строится заново по окну.
+    advance(n) продвигает игру сразу на n поколений (за O(log n) шагов вселенной).
+    """
+
+    def __init__(
+        self,
+        size: Tuple[int, int],
+        randomize: bool = True,
+        max_generations: Optional[float] = float("inf"),
+        max_nodes: int = 1_000_000,
+    ) -> None:
+        super().__init__(size, randomize=randomize, max_generations=max_generations)
+        self.universe = HashLife(max_nodes=max_nodes)
+        self._window: Grid = []
+
+    def _sync(self) -> HashLife:
+        # Поле могли заменить или изменить снаружи (GUI, тесты) - перестроить вселенную
+        if self.curr_generation != self._window:
+            self.universe.set_cells(
+                (row, col)
+                for row, values in enumerate(self.curr_generation)
+                for col, value in enumerate(values)
+                if value
+            )
+        return self.universe
+
+    def _update_window(self) -> None:
+        self.curr_generation = self.universe.to_grid(self.rows, self.cols)
+        self._window = [row[:] for row in self.curr_generation]
+
+    def get_next_generation(self) -> Grid:
+        universe = self._sync()
+        root, generation = universe.root, universe.generation
+        # Поле возвращается к root, поэтому сборка мусора во время шага не должна
+        # выбросить его узлы из таблицы, иначе они перестанут быть каноническими
+        universe.pinned.append(root)
+        try:
+            universe.advance(1)
+            grid = universe.to_grid(self.rows, self.cols)
+        finally:
+            universe.pinned.pop()
+            universe.root, universe.generation = root, generation
+        return grid
+
+    def advance(self, generations: int) -> None:
+        """
+        Выполнить сразу generations шагов игры.
+        """
+        if generations <= 0:
+            return
+        self._sync().advance(generations)
+        self.prev_generation = self.curr_generation
+        self._update_window()
+        self.generations += generations
+
+    def step(self) -> None:
+        """
+        Выполнить один шаг игры.
+        """
+        self.advance(1)
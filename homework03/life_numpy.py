@@ -0,0 +1,96 @@
+import random
+from typing import Optional, Tuple
+
+import numpy as np
+
+from life import GameOfLife
+
+
+def next_generation(padded: np.ndarray) -> np.ndarray:
+    """
+    Следующее поколение внутренней части массива padded (без рамки в одну клетку).
+
+    Считается по двум последним осям, так что padded может быть и стопкой полей.
+    """
+    # Сумма по вертикали из трех строк, затем по горизонтали из трех столбцов:
+    # получается сумма квадрата 3 x 3 вместе с самой клеткой
+    vertical = padded[..., :-2, :] + padded[..., 1:-1, :] + padded[..., 2:, :]
+    total = vertical[..., :-2] + vertical[..., 1:-1] + vertical[..., 2:]
+    alive = padded[..., 1:-1, 1:-1]
+    # B3/S23: три соседа (сумма 3) или живая клетка с тремя соседями (сумма 4)
+    return ((total == 3) | ((total == 4) & (alive == 1))).view(np.uint8)
+
+
+def zobrist_keys(indices: np.ndarray) -> np.ndarray:
+    """
+    life.zobrist_key сразу для массива номеров клеток.
+    """
+    keys = indices.astype(np.uint64) + np.uint64(0x9E3779B97F4A7C15)
+    keys = (keys ^ (keys >> np.uint64(30))) * np.uint64(0xBF58476D1CE4E5B9)
+    keys = (keys ^ (keys >> np.uint64(27))) * np.uint64(0x94D049BB133111EB)
+    return keys ^ (keys >> np.uint64(31))
+
+
+def zobrist_hash(mask: np.ndarray) -> int:
+    """
+    XOR ключей Зобриста клеток, в которых mask истинна.
+    """
+    return int(np.bitwise_xor.reduce(zobrist_keys(np.flatnonzero(mask))))
+
+
+class NumpyGameOfLife(GameOfLife):
+    """
+    Игра «Жизнь» на массивах NumPy.
+
+    Поколения хранятся в массивах uint8 формы (rows, cols), поэтому Console и GUI
+    по-прежнему обращаются к клеткам как curr_generation[i][j]. Следующее поколение
+    считается для всего поля сразу: суммы 3 x 3 складываются из сдвинутых срезов,
+    а правило B3/S23 применяется одним векторным выражением.
+    """
+
+    curr_generation: np.ndarray
+    prev_generation: np.ndarray
+
+    def __init__(
+        self,
+        size: Tuple[int, int],
+        randomize: bool = True,
+        max_generations: Optional[float] = float("inf"),
+    ) -> None:
+        super().__init__(size, randomize=randomize, max_generations=max_generations)
+        # Поле с рамкой из мертвых клеток, чтобы не выделять его на каждом шаге
+        self._padded = np.zeros((self.rows + 2, self.cols + 2), dtype=np.uint8)
+
+    def create_grid(self, randomize: bool = False) -> np.ndarray:
+        if randomize:
+            # Зерно берется из random, чтобы random.seed делал поле воспроизводимым
+            rng = np.random.default_rng(random.getrandbits(64))
+            return rng.integers(0, 2, size=(self.rows, self.cols), dtype=np.uint8)
+        return np.zeros((self.rows, self.cols), dtype=np.uint8)
+
+    def get_next_generation(self) -> np.ndarray:
+        padded = self._padded
+        padded[1:-1, 1:-1] = self.curr_generation
+        return next_generation(padded)
+
+    def step(self) -> None:
+        """
+        Выполнить один шаг игры.
+        """
+        self.prev_generation = np.asarray(self.curr_generation, dtype=np.uint8)
+        self.curr_generation = self.get_next_generation()
+        self.generations += 1
+
+    def board_hash(self) -> int:
+        return zobrist_hash(np.asarray(self.curr_generation))
+
+    def changes_hash(self) -> int:
+        prev = np.asarray(self.prev_generation, dtype=np.uint8)
+        return zobrist_hash(prev != np.asarray(self.curr_generation, dtype=np.uint8))
+
+    @property
+    def is_changing(self) -> bool:
+        """
+        Изменилось ли состояние клеток с предыдущего шага.
+        """
+        return not np.array_equal(self.prev_generation, self.curr_generation)
@@ -0,0 +1,198 @@
+import multiprocessing
+import os
+import threading
+import weakref
+from multiprocessing import shared_memory
+from typing import Any, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from life_numpy import NumpyGameOfLife, next_generation
+
+
+def stripes(rows: int, workers: int) -> List[Tuple[int, int]]:
+    """
+    Разбить строки 0..rows на workers полос почти одинаковой высоты.
+    """
+    workers = max(1, min(workers, rows))
+    bounds = [rows * k // workers for k in range(workers + 1)]
+    return list(zip(bounds[:-1], bounds[1:]))
+
+
+def _worker(
+    names: Sequence[str],
+    shape: Tuple[int, int],
+    stripe: Tuple[int, int],
+    barrier: Any,
+    command: Any,
+) -> None:
+    """
+    Процесс, считающий строки stripe поля.
+
+    Ждет на барьере команду (число поколений и номер исходного буфера), затем
+    на каждом поколении читает свою полосу вместе с граничными строками соседей
+    из одного буфера, пишет результат в другой и ждет на барьере остальных.
+    Число поколений 0 - сигнал завершиться.
+    """
+    blocks = [shared_memory.SharedMemory(name=name) for name in names]
+    boards = [np.ndarray(shape, dtype=np.uint8, buffer=block.buf) for block in blocks]
+    top, bottom = stripe
+    src = dst = None
+    try:
+        while True:
+            barrier.wait()
+            generations, source = command[0], command[1]
+            if generations == 0:
+                break
+            for generation in range(generations):
+                src = boards[(source + generation) % 2]
+                dst = boards[(source + generation + 1) % 2]
+                dst[top + 1 : bottom + 1, 1:-1] = next_generation(src[top : bottom + 2])
+                barrier.wait()
+    except threading.BrokenBarrierError:
+        pass
+    except BaseException:
+        # Не оставлять остальных ждать на барьере вечно
+        barrier.abort()
+        raise
+    finally:
+        del src, dst, boards
+        for block in blocks:
+            block.close()
+
+
+def _shutdown(
+    processes: List[Any], barrier: Any, command: Any, blocks: List[shared_memory.SharedMemory]
+) -> None:
+    command[0] = 0
+    try:
+        barrier.wait(timeout=5)
+    except threading.BrokenBarrierError:
+        pass
+    for process in processes:
+        process.join(timeout=5)
+        if process.is_alive():
+            process.terminate()
+    for block in blocks:
+        try:
+            block.close()
+        except BufferError:
+            # На буфер еще ссылаются массивы снаружи; память освободится вместе с ними
+            pass
+        block.unlink()
+
+
+class ParallelGameOfLife(NumpyGameOfLife):
+    """
+    Игра «Жизнь», которая считает поколение в нескольких процессах.
+
+    Поле делится на горизонтальные полосы, по одной на процесс. Два поколения
+    лежат в буферах multiprocessing.shared_memory размером (rows + 2) x (cols + 2)
+    с рамкой из мертвых клеток; процессы по очереди читают один буфер и пишут
+    другой. Граничные строки соседних полос (halo) процесс читает прямо из
+    общего буфера, так что поле между процессами не пересылается, а поколения
+    разделяет multiprocessing.Barrier.
+
+    curr_generation и prev_generation - представления буферов без копирования:
+    правки curr_generation на месте сразу видны процессам. Процессы живут до
+    close() (или выхода из with) и сборки объекта.
+    """
+
+    def __init__(
+        self,
+        size: Tuple[int, int],
+        randomize: bool = True,
+        max_generations: Optional[float] = float("inf"),
+        workers: Optional[int] = None,
+    ) -> None:
+        super().__init__(size, randomize=randomize, max_generations=max_generations)
+        shape = (self.rows + 2, self.cols + 2)
+        self.stripes = stripes(self.rows, workers or os.cpu_count() or 1)
+        self.workers = len(self.stripes)
+
+        self._blocks = [
+            shared_memory.SharedMemory(create=True, size=shape[0] * shape[1]) for _ in range(2)
+        ]
+        boards = [np.ndarray(shape, dtype=np.uint8, buffer=block.buf) for block in self._blocks]
+        for board in boards:
+            board[...] = 0
+        # Поля без рамки; curr_generation всегда одно из них, пока его не заменят снаружи
+        self._views = [board[1:-1, 1:-1] for board in boards]
+        self._source = 0
+        self._views[0][...] = self.curr_generation
+        self.curr_generation = self._views[0]
+
+        context = multiprocessing.get_context()
+        self._barrier = context.Barrier(self.workers + 1)
+        self._command = context.RawArray("q", 2)
+        self._processes = [
+            context.Process(
+                target=_worker,
+                args=(
+                    [block.name for block in self._blocks],
+                    shape,
+                    stripe,
+                    self._barrier,
+                    self._command,
+                ),
+                daemon=True,
+            )
+            for stripe in self.stripes
+        ]
+        for process in self._processes:
+            process.start()
+        self._finalizer = weakref.finalize(
+            self, _shutdown, self._processes, self._barrier, self._command, self._blocks
+        )
+
+    def __enter__(self) -> "ParallelGameOfLife":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """
+        Остановить процессы и освободить общую память; поле остается доступным.
+        """
+        if not self._finalizer.alive:
+            return
+        self.curr_generation = np.array(self.curr_generation, dtype=np.uint8)
+        self.prev_generation = np.array(self.prev_generation, dtype=np.uint8)
+        self._views = []
+        self._finalizer()
+
+    def _load_current(self) -> None:
+        """
+        Перенести curr_generation в исходный буфер, если его заменили снаружи.
+        """
+        view = self._views[self._source]
+        if self.curr_generation is not view:
+            view[...] = self.curr_generation
+            self.curr_generation = view
+
+    def advance(self, generations: int) -> None:
+        """
+        Выполнить generations шагов подряд, не возвращаясь в основной процесс
+        между поколениями (кроме ожидания на барьере).
+        """
+        if generations <= 0:
+            return
+        if not self._finalizer.alive:
+            raise RuntimeError("ParallelGameOfLife is closed")
+        self._load_current()
+        self._command[0], self._command[1] = generations, self._source
+        self._barrier.wait()
+        for _ in range(generations):
+            self._barrier.wait()
+        self._source = (self._source + generations) % 2
+        # Предыдущее поколение лежит во втором буфере и перезапишется следующим шагом
+        self.prev_generation = self._views[1 - self._source]
+        self.curr_generation = self._views[self._source]
+        self.generations += generations
+
+    def step(self) -> None:
+        """
+        Выполнить один шаг игры.
+        """
+        self.advance(1)
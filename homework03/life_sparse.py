@@ -0,0 +1,199 @@
+import collections
+import functools
+import operator
+import random
+from typing import Iterable, Iterator, List, Set, Union, overload
+
+from life import Cell, GameOfLife, Grid, zobrist_key
+
+
+class LiveRow:
+    """
+    Строка LiveCells, чтобы к клеткам можно было обращаться как cells[i][j].
+    """
+
+    __slots__ = ("cells", "row")
+
+    def __init__(self, cells: "LiveCells", row: int) -> None:
+        self.cells = cells
+        self.row = row
+
+    def __len__(self) -> int:
+        return self.cells.cols
+
+    def __getitem__(self, col: int) -> int:
+        return self.cells[self.row, col]
+
+    def __setitem__(self, col: int, value: int) -> None:
+        self.cells[self.row, col] = value
+
+    def __iter__(self) -> Iterator[int]:
+        return (self.cells[self.row, col] for col in range(self.cells.cols))
+
+
+class LiveCells:
+    """
+    Поле rows x cols, заданное множеством живых клеток.
+
+    Клетка (r, c) хранится числом (r + 1) * (cols + 2) + c + 1: у поля как бы
+    есть рамка шириной в клетку, поэтому соседи любой клетки получаются
+    прибавлением одного из OFFSETS, а ключи рамки легко отбросить.
+    """
+
+    __slots__ = ("rows", "cols", "width", "keys")
+
+    def __init__(self, rows: int, cols: int, keys: Iterable[int] = ()) -> None:
+        self.rows = rows
+        self.cols = cols
+        self.width = cols + 2
+        self.keys: Set[int] = set(keys)
+
+    @property
+    def offsets(self) -> List[int]:
+        width = self.width
+        return [-width - 1, -width, -width + 1, -1, 1, width - 1, width, width + 1]
+
+    def key(self, row: int, col: int) -> int:
+        return (row + 1) * self.width + col + 1
+
+    def position(self, key: int) -> Cell:
+        row, col = divmod(key, self.width)
+        return row - 1, col - 1
+
+    @classmethod
+    def from_grid(cls, grid: Grid) -> "LiveCells":
+        rows, cols = len(grid), len(grid[0]) if grid else 0
+        cells = cls(rows, cols)
+        cells.keys = {
+            cells.key(row, col)
+            for row, values in enumerate(grid)
+            for col, value in enumerate(values)
+            if value
+        }
+        return cells
+
+    def to_grid(self) -> Grid:
+        grid = [[0] * self.cols for _ in range(self.rows)]
+        for key in self.keys:
+            row, col = self.position(key)
+            grid[row][col] = 1
+        return grid
+
+    @property
+    def population(self) -> int:
+        return len(self.keys)
+
+    def __len__(self) -> int:
+        return self.rows
+
+    @overload
+    def __getitem__(self, key: int) -> LiveRow: ...
+
+    @overload
+    def __getitem__(self, key: Cell) -> int: ...
+
+    def __getitem__(self, key: Union[int, Cell]) -> Union[int, LiveRow]:
+        if isinstance(key, tuple):
+            return int(self.key(*key) in self.keys)
+        return LiveRow(self, key)
+
+    def __setitem__(self, cell: Cell, value: int) -> None:
+        if value:
+            self.keys.add(self.key(*cell))
+        else:
+            self.keys.discard(self.key(*cell))
+
+    def __iter__(self) -> Iterator[LiveRow]:
+        return (LiveRow(self, row) for row in range(self.rows))
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, LiveCells):
+            return (self.rows, self.cols) == (other.rows, other.cols) and self.keys == other.keys
+        if isinstance(other, list):
+            return self.to_grid() == other
+        return NotImplemented
+
+    def step(self) -> "LiveCells":
+        """
+        Следующее поколение (B3/S23, за краем поля - мертвые клетки).
+
+        Соседи считаются только у живых клеток: Counter по ключам всех их
+        соседей, поэтому время шага пропорционально числу живых клеток.
+        """
+        live = self.keys
+        counts: "collections.Counter[int]" = collections.Counter()
+        for offset in self.offsets:
+            counts.update([key + offset for key in live])
+        width, last_row = self.width, self.rows
+        survivors = {key for key in live if 2 <= counts[key] <= 3}
+        born = {
+            key
+            for key, count in counts.items()
+            if count == 3
+            and key not in live
+            and 1 <= key // width <= last_row
+            and 1 <= key % width < width - 1
+        }
+        return LiveCells(self.rows, self.cols, survivors | born)
+
+
+class SparseGameOfLife(GameOfLife):
+    """
+    Игра «Жизнь», в которой хранятся только живые клетки (LiveCells).
+
+    Шаг стоит O(числа живых клеток), а не O(rows * cols), поэтому реализация
+    подходит для больших разреженных полей. curr_generation и prev_generation -
+    объекты LiveCells с доступом curr_generation[i][j]; список списков,
+    присвоенный curr_generation, преобразуется при следующем шаге.
+    """
+
+    curr_generation: Union[Grid, LiveCells]
+    prev_generation: LiveCells
+
+    def create_grid(self, randomize: bool = False) -> LiveCells:
+        cells = LiveCells(self.rows, self.cols)
+        if randomize:
+            # Тот же порядок вызовов random, что и у GameOfLife.create_grid
+            cells.keys = {
+                cells.key(row, col)
+                for row in range(self.rows)
+                for col in range(self.cols)
+                if random.randint(0, 1)
+            }
+        return cells
+
+    def _cells(self) -> LiveCells:
+        if not isinstance(self.curr_generation, LiveCells):
+            self.curr_generation = LiveCells.from_grid(self.curr_generation)
+        return self.curr_generation
+
+    def get_next_generation(self) -> LiveCells:
+        return self._cells().step()
+
+    def step(self) -> None:
+        """
+        Выполнить один шаг игры.
+        """
+        self.prev_generation = self._cells()
+        self.curr_generation = self.prev_generation.step()
+        self.generations += 1
+
+    def _keys_hash(self, keys: Iterable[int]) -> int:
+        cells = self._cells()
+        positions = (cells.position(key) for key in keys)
+        return functools.reduce(
+            operator.xor, (zobrist_key(row * self.cols + col) for row, col in positions), 0
+        )
+
+    def board_hash(self) -> int:
+        return self._keys_hash(self._cells().keys)
+
+    def changes_hash(self) -> int:
+        return self._keys_hash(self.prev_generation.keys ^ self._cells().keys)
+
+    @property
+    def is_changing(self) -> bool:
+        """
+        Изменилось ли состояние клеток с предыдущего шага.
+        """
+        return self.prev_generation != self.curr_generation
@@ -0,0 +1,182 @@
+from typing import Any, List, Optional, Tuple
+
+import numpy as np
+
+from life_numpy import NumpyGameOfLife, next_generation
+
+
+class TrackedBoard(np.ndarray):
+    """
+    Поле, которое сообщает игре о записи в себя.
+
+    Срезы (curr_generation[i], curr_generation[i][j:k]) тоже TrackedBoard,
+    поэтому запись вида curr_generation[i][j] = 1, как в GUI, помечает поле
+    измененным. Запись в обход индексирования (np.copyto, out=...) не видна.
+    """
+
+    game: Optional["TiledGameOfLife"]
+
+    def __array_finalize__(self, obj: Any) -> None:
+        self.game = getattr(obj, "game", None)
+
+    def __setitem__(self, key: Any, value: Any) -> None:
+        super().__setitem__(key, value)
+        if self.game is not None:
+            self.game._edited = True
+
+
+class TiledGameOfLife(NumpyGameOfLife):
+    """
+    Игра «Жизнь» на NumPy с отслеживанием изменившихся плиток.
+
+    Поле делится на плитки tile_size x tile_size. Плитка «грязная», если на
+    последнем шаге в ней что-то изменилось; на следующем шаге пересчитываются
+    только грязные плитки и их соседи. Поколения лежат в двух постоянных
+    буферах с рамкой из мертвых клеток: шаг читает один и пишет в другой только
+    пересчитанные плитки. Остальные плитки не менялись на прошлом шаге, поэтому
+    в обоих буферах уже одинаковы, и шаг стоит пропорционально числу активных
+    плиток, а не площади поля. Если пересчитывать нужно больше full_step_ratio
+    всех плиток, поле считается целиком одним векторным выражением.
+
+    curr_generation - представление буфера (TrackedBoard): правка клеток на
+    месте или присваивание нового поля помечает все плитки грязными, и
+    следующий шаг считается целиком. prev_generation - представление второго
+    буфера и перезаписывается следующим шагом. tiles_computed и tiles_skipped -
+    сколько плиток пересчитано и пропущено за все шаги.
+    """
+
+    def __init__(
+        self,
+        size: Tuple[int, int],
+        randomize: bool = True,
+        max_generations: Optional[float] = float("inf"),
+        tile_size: int = 32,
+        full_step_ratio: float = 0.25,
+    ) -> None:
+        rows, cols = size
+        self.tile_size = tile_size
+        self.full_step_ratio = full_step_ratio
+        self.tile_rows = -(-rows // tile_size)
+        self.tile_cols = -(-cols // tile_size)
+        self.tiles_computed = 0
+        self.tiles_skipped = 0
+        self._dirty = np.ones((self.tile_rows, self.tile_cols), dtype=bool)
+        self._edited = False
+        # Два поколения, дополненные до целого числа плиток, с рамкой из мертвых клеток
+        height, width = self.tile_rows * tile_size, self.tile_cols * tile_size
+        self._frames = [np.zeros((height + 2, width + 2), dtype=np.uint8) for _ in range(2)]
+        self._views: List[TrackedBoard] = []
+        for frame in self._frames:
+            view = frame[1 : rows + 1, 1 : cols + 1].view(TrackedBoard)
+            view.game = self
+            self._views.append(view)
+        self._source = 0
+        # Клетки дополнения за краем поля должны оставаться мертвыми
+        self._inside: Optional[np.ndarray] = None
+        if (height, width) != (rows, cols):
+            self._inside = np.zeros((height, width), dtype=np.uint8)
+            self._inside[:rows, :cols] = 1
+        super().__init__(size, randomize=randomize, max_generations=max_generations)
+
+    @property
+    def curr_generation(self) -> np.ndarray:
+        return self._views[self._source]
+
+    @curr_generation.setter
+    def curr_generation(self, grid: Any) -> None:
+        view = self._views[self._source]
+        if grid is not view:
+            view[...] = grid
+            self._edited = True
+
+    @property
+    def dirty_tiles(self) -> int:
+        return int(self._dirty.sum())
+
+    def _tiles(self, frame: np.ndarray, halo: int = 0) -> np.ndarray:
+        """
+        Плитки буфера с рамкой frame как массив (tile_rows, tile_cols, size, size)
+        без копирования; с halo = 1 - вместе с рамкой в одну клетку вокруг плитки.
+        """
+        size = self.tile_size
+        row_stride, col_stride = frame.strides
+        start = 1 - halo
+        return np.lib.stride_tricks.as_strided(
+            frame[start:, start:],
+            shape=(self.tile_rows, self.tile_cols, size + 2 * halo, size + 2 * halo),
+            strides=(size * row_stride, size * col_stride, row_stride, col_stride),
+        )
+
+    def _tiles_with(self, mask: np.ndarray) -> np.ndarray:
+        """
+        Плитки, в которых mask (поле, дополненное до целого числа плиток)
+        истинна хотя бы в одной клетке.
+        """
+        size = self.tile_size
+        if size % 8:
+            return np.asarray(
+                mask.reshape(self.tile_rows, size, self.tile_cols, size).any(axis=(1, 3))
+            )
+        # Строка плитки - size // 8 слов по 8 клеток: OR слов, затем OR по строкам плитки
+        words = mask.view(np.uint64).reshape(self.tile_rows * size, self.tile_cols, -1)
+        rows = words[:, :, 0].copy()
+        for k in range(1, size // 8):
+            rows |= words[:, :, k]
+        return np.asarray(rows.reshape(self.tile_rows, size, self.tile_cols).max(axis=1) != 0)
+
+    def _active_tiles(self) -> np.ndarray:
+        """
+        Грязные плитки и их соседи (включая соседей по диагонали).
+        """
+        active = self._dirty.copy()
+        active[1:] |= self._dirty[:-1]
+        active[:-1] |= self._dirty[1:]
+        vertical = active.copy()
+        active[:, 1:] |= vertical[:, :-1]
+        active[:, :-1] |= vertical[:, 1:]
+        return active
+
+    def step(self) -> None:
+        """
+        Выполнить один шаг игры.
+        """
+        if self._edited:
+            self._dirty[...] = True
+            self._edited = False
+        source, target = self._frames[self._source], self._frames[1 - self._source]
+
+        active = self._active_tiles()
+        computed = int(active.sum())
+        if computed > self.full_step_ratio * active.size:
+            new = next_generation(source)
+            if self._inside is not None:
+                new &= self._inside
+            changed = self._tiles_with(new != source[1:-1, 1:-1])
+            target[1:-1, 1:-1] = new
+        else:
+            # Все активные плитки считаются одной операцией над их стопкой
+            tile_rows, tile_cols = np.nonzero(active)
+            windows = self._tiles(source, halo=1)[tile_rows, tile_cols]
+            tiles = next_generation(windows)
+            if self._inside is not None:
+                tiles &= self._inside.reshape(
+                    self.tile_rows, self.tile_size, self.tile_cols, self.tile_size
+                ).swapaxes(1, 2)[tile_rows, tile_cols]
+            self._tiles(target)[tile_rows, tile_cols] = tiles
+            differs = (tiles != windows[:, 1:-1, 1:-1]).any(axis=(1, 2))
+            changed = np.zeros_like(self._dirty)
+            changed[tile_rows[differs], tile_cols[differs]] = True
+
+        self.tiles_computed += computed
+        self.tiles_skipped += active.size - computed
+        self._dirty = changed
+        self.prev_generation = self._views[self._source]
+        self._source = 1 - self._source
+        self.generations += 1
+
+    @property
+    def is_changing(self) -> bool:
+        """
+        Изменилось ли состояние клеток с предыдущего шага (по грязным плиткам).
+        """
+        return bool(self._dirty.any())
@@ -1,6 +1,9 @@
+import functools
 import json
+import operator
 import os
 import random
+import tempfile
 import unittest
 
 import life
@@ -138,3 +141,80 @@ class TestGameOfLife(unittest.TestCase):
         for _ in range(self.max_generations + 1):
             game.step()
         self.assertFalse(game.is_changing)
+
+    def test_from_file(self):
+        tests_dir = os.path.dirname(__file__)
+        game = life.GameOfLife.from_file(os.path.join(tests_dir, "..", "grid.txt"))
+        self.assertEqual((self.rows, self.cols), (game.rows, game.cols))
+        self.assertEqual(self.grid, game.curr_generation)
+
+    def test_save(self):
+        game = life.GameOfLife((self.rows, self.cols))
+        game.curr_generation = self.grid
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "grid.txt")
+            game.save(path)
+            self.assertEqual(self.grid, life.GameOfLife.from_file(path).curr_generation)
+
+    def test_run_detects_still_life(self):
+        game = life.GameOfLife((self.rows, self.cols))
+        game.curr_generation = self.grid
+        self.assertEqual(life.Cycle(period=1, start=19), game.run())
+        self.assertEqual(20, game.generations)
+
+    def test_run_detects_oscillator(self):
+        game = life.GameOfLife((5, 5), randomize=False)
+        game.curr_generation[2][1:4] = [1, 1, 1]
+        self.assertEqual(life.Cycle(period=2, start=1), game.run())
+        self.assertEqual(3, game.generations)
+
+    def test_run_ignores_longer_periods(self):
+        game = life.GameOfLife((5, 5), randomize=False, max_generations=10)
+        game.curr_generation[2][1:4] = [1, 1, 1]
+        self.assertIsNone(game.run(max_period=1))
+        self.assertEqual(10, game.generations)
+
+    def test_run_without_generation_cap(self):
+        game = life.GameOfLife((5, 5), randomize=False, max_generations=None)
+        game.curr_generation[2][1:4] = [1, 1, 1]
+        self.assertEqual(life.Cycle(period=2, start=1), game.run())
+
+    def test_changes_hash_updates_board_hash(self):
+        random.seed(4)
+        game = life.GameOfLife((7, 9))
+        board_hash = game.board_hash()
+        for _ in range(5):
+            game.step()
+            board_hash ^= game.changes_hash()
+            self.assertEqual(game.board_hash(), board_hash)
+
+    def test_changes_hash_is_collected_during_step(self):
+        game = life.GameOfLife((5, 5), randomize=False)
+        game.curr_generation[2][1:4] = [1, 1, 1]
+        game.step()
+        # Изменения собраны в get_next_generation, поколения заново не сравниваются
+        game.prev_generation = None
+        flipped = [(1, 2), (3, 2), (2, 1), (2, 3)]
+        expected = functools.reduce(
+            operator.xor, (life.zobrist_key(row * 5 + col) for row, col in flipped)
+        )
+        self.assertEqual(expected, game.changes_hash())
+
+    def test_changes_hash_of_assigned_board(self):
+        game = life.GameOfLife((5, 5), randomize=False)
+        game.step()
+        game.prev_generation = game.curr_generation
+        game.curr_generation = game.create_grid()
+        game.curr_generation[0][0] = 1
+        self.assertEqual(life.zobrist_key(0), game.changes_hash())
+
+
+class TestCycleDetector(unittest.TestCase):
+    def test_history_is_bounded(self):
+        detector = life.CycleDetector(max_period=2)
+        detector.reset(1, generation=1)
+        self.assertIsNone(detector.update(1 ^ 2, generation=2))
+        self.assertIsNone(detector.update(2 ^ 3, generation=3))
+        # Хеш поколения 1 уже вытеснен: период 3 больше max_period
+        self.assertIsNone(detector.update(3 ^ 1, generation=4))
+        self.assertEqual(life.Cycle(period=2, start=3), detector.update(1 ^ 3, generation=5))
@@ -0,0 +1,69 @@
+import contextlib
+import csv
+import io
+import json
+import unittest
+
+import life_batch
+
+
+class TestLifeBatch(unittest.TestCase):
+    def setUp(self):
+        self.params = life_batch.Params(size=(24, 24), density=0.3, max_generations=300)
+
+    def test_random_board(self):
+        board = life_batch.random_board((50, 40), 0.25, seed=1)
+        self.assertEqual((50, 40), board.shape)
+        self.assertTrue((board == life_batch.random_board((50, 40), 0.25, seed=1)).all())
+        self.assertAlmostEqual(0.25, board.mean(), delta=0.05)
+
+    def test_empty_board_is_stable(self):
+        result = life_batch.simulate(0, self.params._replace(density=0.0))
+        self.assertEqual(
+            (1, 0, 1, 0), (result.generations, result.stable_at, result.period, result.population)
+        )
+
+    def test_generation_cap(self):
+        result = life_batch.simulate(0, self.params._replace(max_generations=3, max_period=1))
+        self.assertEqual(3, result.generations)
+        self.assertIsNone(result.period)
+        self.assertIsNone(result.stable_at)
+
+    def test_backends_agree(self):
+        for backend in life_batch.BACKENDS:
+            with self.subTest(backend=backend):
+                result = life_batch.simulate(2, self.params._replace(backend=backend))
+                self.assertEqual(
+                    (76, 74, 2, 24),
+                    (result.generations, result.stable_at, result.period, result.population),
+                )
+
+    def test_unsupported_backends_are_rejected(self):
+        for backend in ("hashlife", "parallel"):
+            with self.subTest(backend=backend):
+                self.assertNotIn(backend, life_batch.BACKENDS)
+                with self.assertRaises(ValueError):
+                    life_batch.simulate(2, self.params._replace(backend=backend))
+                with self.assertRaises(SystemExit), contextlib.redirect_stderr(io.StringIO()):
+                    life_batch.main(["--backend", backend])
+
+    def test_serial_and_parallel_keep_order(self):
+        serial = list(life_batch.simulate_stream(range(6), self.params))
+        parallel = list(life_batch.simulate_stream(range(6), self.params, workers=2, chunk_size=2))
+        self.assertEqual(list(range(6)), [result.seed for result in parallel])
+        self.assertEqual([result[:-1] for result in serial], [result[:-1] for result in parallel])
+
+    def test_run_writes_csv_and_jsonl(self):
+        dst = io.StringIO()
+        summary, elapsed = life_batch.run(dst, range(3), self.params)
+        rows = list(csv.DictReader(io.StringIO(dst.getvalue())))
+        self.assertEqual(["0", "1", "2"], [row["seed"] for row in rows])
+        self.assertEqual(summary.generations, sum(int(row["generations"]) for row in rows))
+        self.assertIn("Ran 3 boards", summary.format(elapsed))
+
+        dst = io.StringIO()
+        life_batch.run(dst, range(3), self.params, output_format="jsonl")
+        records = [json.loads(line) for line in dst.getvalue().splitlines()]
+        self.assertEqual(
+            [row["generations"] for row in rows], [str(r["generations"]) for r in records]
+        )
@@ -0,0 +1,121 @@
+import json
+import os
+import random
+import unittest
+
+import numpy as np
+
+import life
+from life_bits import BitBoard, BitGameOfLife
+
+
+class TestBitBoard(unittest.TestCase):
+    def test_round_trip(self):
+        random.seed(2)
+        for cols in (1, 63, 64, 65, 130):
+            with self.subTest(cols=cols):
+                grid = [[random.randint(0, 1) for _ in range(cols)] for _ in range(3)]
+                board = BitBoard.from_grid(grid)
+                self.assertEqual(grid, board.to_grid())
+                self.assertEqual(sum(map(sum, grid)), board.population())
+                self.assertEqual(3 * ((cols + 63) // 64) * 8, board.nbytes)
+
+    def test_cell_access(self):
+        board = BitBoard(3, 70)
+        board[1, 69] = 1
+        board[2][0] = 1
+        self.assertEqual(1, board[1][69])
+        self.assertEqual(1, board[2, 0])
+        self.assertEqual(2, board.population())
+        board[1][69] = 0
+        self.assertEqual(0, board[1, 69])
+        self.assertEqual([1] + [0] * 69, list(board[2]))
+
+    def test_random_board_has_no_bits_past_last_column(self):
+        board = BitBoard.random(4, 70, seed=1)
+        self.assertEqual(0, int((board.words[:, -1] >> np.uint64(6)).max()))
+
+    def test_matches_numpy_engine_across_word_boundaries(self):
+        dense = life.get_backend("numpy")
+        for rows, cols in [(1, 1), (3, 64), (9, 65), (30, 200), (64, 129)]:
+            with self.subTest(size=(rows, cols)):
+                board = BitBoard.random(rows, cols, seed=rows * cols)
+                game = dense((rows, cols), randomize=False)
+                game.curr_generation = board.to_numpy()
+                for _ in range(10):
+                    board = board.step()
+                    game.step()
+                    self.assertEqual(game.curr_generation.tolist(), board.to_grid())
+
+    def test_glider_crosses_word_boundary(self):
+        board = BitBoard(8, 128)
+        for row, col in [(0, 61), (1, 62), (2, 60), (2, 61), (2, 62)]:
+            board[row, col] = 1
+        for _ in range(8):
+            board = board.step()
+        self.assertEqual(5, board.population())
+        self.assertEqual(1, board[2, 63])
+        self.assertEqual(1, board[4, 64])
+
+
+class TestBitGameOfLife(unittest.TestCase):
+    def setUp(self):
+        self.grid = [
+            [1, 1, 0, 0, 1, 1, 1, 1],
+            [0, 1, 1, 1, 1, 1, 1, 0],
+            [1, 0, 1, 1, 0, 0, 0, 0],
+            [1, 0, 0, 0, 0, 0, 0, 1],
+            [1, 0, 1, 1, 1, 1, 0, 0],
+            [1, 1, 1, 1, 0, 1, 1, 1],
+        ]
+        self.rows = 6
+        self.cols = 8
+        self.max_generations = 18
+
+    def test_get_backend(self):
+        self.assertIs(BitGameOfLife, life.get_backend("bits"))
+
+    def test_can_update(self):
+        game = BitGameOfLife((self.rows, self.cols))
+        game.curr_generation = self.grid
+
+        tests_dir = os.path.dirname(__file__)
+        steps_path = os.path.join(tests_dir, "steps.txt")
+        with open(steps_path) as f:
+            steps = json.load(f)
+
+        num_updates = 0
+        for step in sorted(steps.keys(), key=int):
+            with self.subTest(step=step):
+                for _ in range(int(step) - num_updates):
+                    game.curr_generation = game.get_next_generation()
+                    num_updates += 1
+                self.assertEqual(steps[step], game.curr_generation.to_grid())
+
+    def test_prev_generation_is_correct(self):
+        game = BitGameOfLife((self.rows, self.cols))
+        game.curr_generation = self.grid
+        game.step()
+        self.assertEqual(self.grid, game.prev_generation.to_grid())
+
+    def test_is_changing(self):
+        game = BitGameOfLife((self.rows, self.cols))
+        game.curr_generation = self.grid
+        game.step()
+        self.assertTrue(game.is_changing)
+
+    def test_is_not_changing(self):
+        game = BitGameOfLife((self.rows, self.cols))
+        game.curr_generation = self.grid
+        for _ in range(self.max_generations + 1):
+            game.step()
+        self.assertFalse(game.is_changing)
+
+    def test_run_matches_dense_engine(self):
+        for seed in range(3):
+            random.seed(seed)
+            dense = life.GameOfLife((12, 17), max_generations=300)
+            game = BitGameOfLife((12, 17), randomize=False, max_generations=300)
+            game.curr_generation = [row[:] for row in dense.curr_generation]
+            self.assertEqual(dense.run(), game.run())
+            self.assertEqual(dense.generations, game.generations)
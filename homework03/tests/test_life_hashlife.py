@@ -0,0 +1,110 @@
+import os
+import random
+import tempfile
+import unittest
+
+import life
+from life_hashlife import ALIVE, DEAD, HashLife, HashLifeGameOfLife
+
+GLIDER = [[0, 1, 0], [0, 0, 1], [1, 1, 1]]
+
+
+class TestHashLife(unittest.TestCase):
+    def test_cells_round_trip(self):
+        cells = {(0, 0), (-5, 3), (100, -70), (7, 7)}
+        universe = HashLife()
+        universe.set_cells(cells)
+        self.assertEqual(cells, universe.cells())
+        self.assertEqual(4, universe.population)
+
+    def test_leaves_are_their_own_quadrants(self):
+        for leaf in (DEAD, ALIVE):
+            self.assertEqual((leaf,) * 4, leaf.children())
+            self.assertEqual(0, leaf.level)
+        self.assertEqual((0, 1), (DEAD.population, ALIVE.population))
+
+    def test_glider_jump(self):
+        universe = HashLife.from_grid(GLIDER)
+        universe.step_pow2(40)
+        # A glider moves one cell down and right every 4 generations
+        shift = 2**40 // 4
+        expected = {(row + shift, col + shift) for row, col in HashLife.from_grid(GLIDER).cells()}
+        self.assertEqual(expected, universe.cells())
+        self.assertEqual(2**40, universe.generation)
+
+    def test_advance_matches_single_steps(self):
+        random.seed(3)
+        soup = [[random.randint(0, 1) for _ in range(12)] for _ in range(12)]
+        jumped, stepped = HashLife.from_grid(soup), HashLife.from_grid(soup)
+        jumped.advance(100)
+        for _ in range(100):
+            stepped.advance(1)
+        self.assertEqual(stepped.cells(), jumped.cells())
+
+    def test_matches_dense_engine_away_from_edges(self):
+        random.seed(4)
+        size, soup = 60, 10
+        dense = life.GameOfLife((size, size), randomize=False)
+        for row in range(25, 25 + soup):
+            for col in range(25, 25 + soup):
+                dense.curr_generation[row][col] = random.randint(0, 1)
+        game = HashLifeGameOfLife((size, size), randomize=False)
+        game.curr_generation = [row[:] for row in dense.curr_generation]
+        for _ in range(20):
+            dense.step()
+            game.step()
+            self.assertEqual(dense.curr_generation, game.curr_generation)
+            self.assertEqual(dense.is_changing, game.is_changing)
+
+    def test_garbage_collection_keeps_results_correct(self):
+        random.seed(5)
+        soup = [[random.randint(0, 1) for _ in range(16)] for _ in range(16)]
+        bounded, unbounded = HashLife.from_grid(soup, max_nodes=200), HashLife.from_grid(soup)
+        for _ in range(30):
+            bounded.advance(1)
+            unbounded.advance(1)
+        self.assertGreater(bounded.collections, 0)
+        self.assertEqual(unbounded.cells(), bounded.cells())
+
+
+class TestHashLifeGameOfLife(unittest.TestCase):
+    def test_get_backend(self):
+        self.assertIs(HashLifeGameOfLife, life.get_backend("hashlife"))
+
+    def test_from_file_and_save(self):
+        tests_dir = os.path.dirname(__file__)
+        game = HashLifeGameOfLife.from_file(os.path.join(tests_dir, "..", "glider.txt"))
+        self.assertIsInstance(game, HashLifeGameOfLife)
+        self.assertEqual((5, 5), (game.rows, game.cols))
+        game.advance(4)
+        self.assertEqual(5, game.generations)
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "glider.txt")
+            game.save(path)
+            loaded = life.GameOfLife.from_file(path)
+        self.assertEqual(game.curr_generation, loaded.curr_generation)
+        self.assertEqual([0, 0, 1, 0, 0], loaded.curr_generation[1])
+
+    def test_window_edits_are_picked_up(self):
+        game = HashLifeGameOfLife((5, 5), randomize=False)
+        for col in range(1, 4):
+            game.curr_generation[2][col] = 1
+        game.step()
+        self.assertEqual([0, 1, 1, 1, 0], [row[2] for row in game.curr_generation])
+        self.assertEqual([0, 0, 0, 0, 0], game.curr_generation[0])
+
+    def test_peeking_keeps_root_canonical_across_garbage_collection(self):
+        random.seed(6)
+        game = HashLifeGameOfLife((16, 16))
+        game.step()
+        universe = game.universe
+        # Любой следующий шаг переполнит таблицу и запустит сборку мусора
+        universe.max_nodes = 0
+        game.get_next_generation()
+        self.assertEqual(1, universe.collections)
+        stack, canonical = [universe.root], set(map(id, universe._nodes.values()))
+        while stack:
+            node = stack.pop()
+            if node.level:
+                self.assertIn(id(node), canonical)
+                stack.extend(node.children())
@@ -0,0 +1,117 @@
+import json
+import os
+import random
+import unittest
+
+import numpy as np
+
+import life
+from life_numpy import NumpyGameOfLife, zobrist_keys
+
+
+class TestNumpyGameOfLife(unittest.TestCase):
+    def setUp(self):
+        self.grid = [
+            [1, 1, 0, 0, 1, 1, 1, 1],
+            [0, 1, 1, 1, 1, 1, 1, 0],
+            [1, 0, 1, 1, 0, 0, 0, 0],
+            [1, 0, 0, 0, 0, 0, 0, 1],
+            [1, 0, 1, 1, 1, 1, 0, 0],
+            [1, 1, 1, 1, 0, 1, 1, 1],
+        ]
+        self.rows = 6
+        self.cols = 8
+        self.max_generations = 18
+
+    def test_get_backend(self):
+        self.assertIs(NumpyGameOfLife, life.get_backend("numpy"))
+        self.assertIs(life.GameOfLife, life.get_backend("dense"))
+        with self.assertRaises(ValueError):
+            life.get_backend("abacus")
+
+    def test_can_create_an_empty_grid(self):
+        game = NumpyGameOfLife((3, 4))
+        grid = game.create_grid(randomize=False)
+        self.assertEqual((3, 4), grid.shape)
+        self.assertEqual(0, grid.sum())
+
+    def test_random_grid_follows_random_seed(self):
+        game = NumpyGameOfLife((10, 10))
+        random.seed(12345)
+        first = game.create_grid(randomize=True)
+        random.seed(12345)
+        second = game.create_grid(randomize=True)
+        self.assertTrue(np.array_equal(first, second))
+        self.assertTrue(set(np.unique(first)) <= {0, 1})
+
+    def test_can_update(self):
+        game = NumpyGameOfLife((self.rows, self.cols))
+        game.curr_generation = self.grid
+
+        tests_dir = os.path.dirname(__file__)
+        steps_path = os.path.join(tests_dir, "steps.txt")
+        with open(steps_path) as f:
+            steps = json.load(f)
+
+        num_updates = 0
+        for step in sorted(steps.keys(), key=int):
+            with self.subTest(step=step):
+                for _ in range(int(step) - num_updates):
+                    game.curr_generation = game.get_next_generation()
+                    num_updates += 1
+                self.assertEqual(steps[step], game.curr_generation.tolist())
+
+    def test_matches_dense_engine(self):
+        random.seed(1)
+        for rows, cols in [(1, 1), (1, 7), (5, 1), (17, 23), (40, 40)]:
+            with self.subTest(size=(rows, cols)):
+                dense = life.GameOfLife((rows, cols))
+                game = NumpyGameOfLife((rows, cols), randomize=False)
+                game.curr_generation = np.array(dense.curr_generation, dtype=np.uint8)
+                for _ in range(20):
+                    dense.step()
+                    game.step()
+                    self.assertEqual(dense.curr_generation, game.curr_generation.tolist())
+                    self.assertEqual(dense.is_changing, game.is_changing)
+
+    def test_cells_are_indexed_like_lists(self):
+        game = NumpyGameOfLife((self.rows, self.cols), randomize=False)
+        game.curr_generation[2][3] = 1
+        self.assertEqual(1, game.curr_generation[2][3])
+        game.step()
+        self.assertEqual(0, game.curr_generation[2][3])
+        self.assertEqual(1, game.prev_generation[2][3])
+
+    def test_prev_generation_is_correct(self):
+        game = NumpyGameOfLife((self.rows, self.cols))
+        game.curr_generation = self.grid
+        game.step()
+        self.assertEqual(self.grid, game.prev_generation.tolist())
+
+    def test_is_changing(self):
+        game = NumpyGameOfLife((self.rows, self.cols))
+        game.curr_generation = self.grid
+        game.step()
+        self.assertTrue(game.is_changing)
+
+    def test_is_not_changing(self):
+        game = NumpyGameOfLife((self.rows, self.cols))
+        game.curr_generation = self.grid
+        for _ in range(self.max_generations + 1):
+            game.step()
+        self.assertFalse(game.is_changing)
+
+    def test_zobrist_keys_match_python(self):
+        indices = np.array([0, 1, 47, 10**8, 2**40])
+        expected = [life.zobrist_key(int(index)) for index in indices]
+        self.assertEqual(expected, zobrist_keys(indices).tolist())
+
+    def test_run_matches_dense_engine(self):
+        for seed in range(3):
+            random.seed(seed)
+            dense = life.GameOfLife((12, 17), max_generations=300)
+            game = NumpyGameOfLife((12, 17), randomize=False, max_generations=300)
+            game.curr_generation = np.array(dense.curr_generation, dtype=np.uint8)
+            self.assertEqual(dense.board_hash(), game.board_hash())
+            self.assertEqual(dense.run(), game.run())
+            self.assertEqual(dense.generations, game.generations)
@@ -0,0 +1,67 @@
+import random
+import unittest
+
+import numpy as np
+
+import life
+from life_numpy import NumpyGameOfLife
+from life_parallel import ParallelGameOfLife, stripes
+
+
+class TestStripes(unittest.TestCase):
+    def test_cover_all_rows(self):
+        self.assertEqual([(0, 3), (3, 6), (6, 10)], stripes(10, 3))
+        self.assertEqual([(0, 1), (1, 2)], stripes(2, 8))
+        self.assertEqual([(0, 5)], stripes(5, 0))
+
+
+class TestParallelGameOfLife(unittest.TestCase):
+    def test_get_backend(self):
+        self.assertIs(ParallelGameOfLife, life.get_backend("parallel"))
+
+    def test_matches_numpy_engine(self):
+        for workers in (1, 3):
+            with self.subTest(workers=workers):
+                random.seed(workers)
+                expected = NumpyGameOfLife((23, 19))
+                random.seed(workers)
+                with ParallelGameOfLife((23, 19), workers=workers) as game:
+                    self.assertEqual(workers, game.workers)
+                    for _ in range(20):
+                        expected.step()
+                        game.step()
+                        self.assertTrue(
+                            np.array_equal(expected.curr_generation, game.curr_generation)
+                        )
+                        self.assertEqual(expected.is_changing, game.is_changing)
+
+    def test_advance(self):
+        random.seed(7)
+        expected = NumpyGameOfLife((16, 16))
+        random.seed(7)
+        with ParallelGameOfLife((16, 16), workers=2) as game:
+            for _ in range(9):
+                expected.step()
+            game.advance(9)
+            self.assertEqual(10, game.generations)
+            self.assertTrue(np.array_equal(expected.prev_generation, game.prev_generation))
+            self.assertTrue(np.array_equal(expected.curr_generation, game.curr_generation))
+
+    def test_outside_edits(self):
+        with ParallelGameOfLife((8, 8), randomize=False, workers=2) as game:
+            # Правка на месте, как в GUI, и замена поля целиком
+            game.curr_generation[3, 2:5] = 1
+            game.step()
+            self.assertEqual([0, 1, 1, 1, 0], list(game.curr_generation[1:6, 3]))
+            game.curr_generation = [[1] * 8 if row == 0 else [0] * 8 for row in range(8)]
+            game.step()
+            self.assertEqual(12, int(game.curr_generation.sum()))
+
+    def test_close_keeps_board(self):
+        game = ParallelGameOfLife((6, 6), randomize=False, workers=2)
+        game.curr_generation[2, 1:4] = 1
+        game.step()
+        game.close()
+        self.assertEqual(3, int(game.curr_generation.sum()))
+        with self.assertRaises(RuntimeError):
+            game.step()
@@ -0,0 +1,115 @@
+import json
+import os
+import random
+import unittest
+
+import life
+from life_sparse import LiveCells, SparseGameOfLife
+
+
+class TestLiveCells(unittest.TestCase):
+    def test_round_trip(self):
+        grid = [[0, 1, 0], [1, 0, 0], [0, 0, 1], [1, 1, 1]]
+        cells = LiveCells.from_grid(grid)
+        self.assertEqual(grid, cells.to_grid())
+        self.assertEqual(6, cells.population)
+        self.assertEqual(1, cells[3][2])
+        self.assertEqual(0, cells[0, 0])
+
+    def test_edges_do_not_wrap(self):
+        # A vertical blinker against the right edge must not grow cells on the left
+        cells = LiveCells(5, 4)
+        for row in range(1, 4):
+            cells[row, 3] = 1
+        following = cells.step()
+        self.assertEqual({(2, 2), (2, 3)}, {following.position(k) for k in following.keys})
+
+    def test_huge_sparse_board(self):
+        cells = LiveCells(10**6, 10**6)
+        for row, col in [(0, 1), (1, 2), (2, 0), (2, 1), (2, 2)]:
+            cells[row + 500000, col + 500000] = 1
+        for _ in range(4):
+            cells = cells.step()
+        self.assertEqual(5, cells.population)
+        self.assertEqual(1, cells[500003, 500003])
+
+
+class TestSparseGameOfLife(unittest.TestCase):
+    def setUp(self):
+        self.grid = [
+            [1, 1, 0, 0, 1, 1, 1, 1],
+            [0, 1, 1, 1, 1, 1, 1, 0],
+            [1, 0, 1, 1, 0, 0, 0, 0],
+            [1, 0, 0, 0, 0, 0, 0, 1],
+            [1, 0, 1, 1, 1, 1, 0, 0],
+            [1, 1, 1, 1, 0, 1, 1, 1],
+        ]
+        self.rows = 6
+        self.cols = 8
+        self.max_generations = 18
+
+    def test_get_backend(self):
+        self.assertIs(SparseGameOfLife, life.get_backend("sparse"))
+
+    def test_random_grid_matches_dense_engine(self):
+        random.seed(12345)
+        dense = life.GameOfLife((3, 3)).curr_generation
+        random.seed(12345)
+        self.assertEqual(dense, SparseGameOfLife((3, 3)).curr_generation.to_grid())
+
+    def test_can_update(self):
+        game = SparseGameOfLife((self.rows, self.cols))
+        game.curr_generation = self.grid
+
+        tests_dir = os.path.dirname(__file__)
+        steps_path = os.path.join(tests_dir, "steps.txt")
+        with open(steps_path) as f:
+            steps = json.load(f)
+
+        num_updates = 0
+        for step in sorted(steps.keys(), key=int):
+            with self.subTest(step=step):
+                for _ in range(int(step) - num_updates):
+                    game.curr_generation = game.get_next_generation()
+                    num_updates += 1
+                self.assertEqual(steps[step], game.curr_generation.to_grid())
+
+    def test_matches_dense_engine(self):
+        for seed in range(5):
+            random.seed(seed)
+            dense = life.GameOfLife((12, 17))
+            random.seed(seed)
+            game = SparseGameOfLife((12, 17))
+            for _ in range(20):
+                dense.step()
+                game.step()
+                self.assertEqual(dense.curr_generation, game.curr_generation.to_grid())
+                self.assertEqual(dense.is_changing, game.is_changing)
+
+    def test_prev_generation_is_correct(self):
+        game = SparseGameOfLife((self.rows, self.cols))
+        game.curr_generation = self.grid
+        game.step()
+        self.assertEqual(self.grid, game.prev_generation.to_grid())
+
+    def test_is_changing(self):
+        game = SparseGameOfLife((self.rows, self.cols))
+        game.curr_generation = self.grid
+        game.step()
+        self.assertTrue(game.is_changing)
+
+    def test_is_not_changing(self):
+        game = SparseGameOfLife((self.rows, self.cols))
+        game.curr_generation = self.grid
+        for _ in range(self.max_generations + 1):
+            game.step()
+        self.assertFalse(game.is_changing)
+
+    def test_run_matches_dense_engine(self):
+        for seed in range(3):
+            random.seed(seed)
+            dense = life.GameOfLife((12, 17), max_generations=300)
+            game = SparseGameOfLife((12, 17), randomize=False, max_generations=300)
+            game.curr_generation = [row[:] for row in dense.curr_generation]
+            self.assertEqual(dense.run(), game.run())
+            self.assertEqual(dense.generations, game.generations)
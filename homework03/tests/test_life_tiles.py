@@ -0,0 +1,75 @@
+import random
+import unittest
+
+import numpy as np
+
+import life
+from life_numpy import NumpyGameOfLife
+from life_tiles import TiledGameOfLife
+
+
+class TestTiledGameOfLife(unittest.TestCase):
+    def test_get_backend(self):
+        self.assertIs(TiledGameOfLife, life.get_backend("tiles"))
+
+    def test_matches_numpy_engine(self):
+        for seed, (rows, cols), tile_size, ratio in [
+            (0, (40, 64), 8, 0.25),
+            (1, (37, 50), 8, 0.0),
+            (2, (23, 31), 5, 0.25),
+            (3, (64, 64), 16, 1.1),
+        ]:
+            with self.subTest(seed=seed, tile_size=tile_size, ratio=ratio):
+                random.seed(seed)
+                expected = NumpyGameOfLife((rows, cols))
+                random.seed(seed)
+                game = TiledGameOfLife((rows, cols), tile_size=tile_size, full_step_ratio=ratio)
+                for _ in range(60):
+                    expected.step()
+                    game.step()
+                    self.assertTrue(np.array_equal(expected.curr_generation, game.curr_generation))
+                    self.assertEqual(expected.is_changing, game.is_changing)
+
+    def test_settled_tiles_are_skipped(self):
+        game = TiledGameOfLife((64, 64), randomize=False, tile_size=8)
+        game.curr_generation[1:3, 1:3] = 1
+        game.curr_generation[44, 43:46] = 1
+        game.step()
+        game.tiles_computed = game.tiles_skipped = 0
+        for _ in range(10):
+            game.step()
+        # Мигалка задевает одну плитку: считаются она и ее восемь соседей
+        self.assertEqual(1, game.dirty_tiles)
+        self.assertEqual(90, game.tiles_computed)
+        self.assertEqual(10 * 64 - 90, game.tiles_skipped)
+        self.assertTrue(game.is_changing)
+        self.assertEqual(4, int(game.curr_generation[1:3, 1:3].sum()))
+
+    def test_still_life_is_not_changing(self):
+        game = TiledGameOfLife((16, 16), randomize=False, tile_size=4)
+        game.curr_generation[5:7, 5:7] = 1
+        game.step()
+        self.assertFalse(game.is_changing)
+        self.assertEqual(0, game.dirty_tiles)
+
+    def test_outside_edits_mark_tiles(self):
+        game = TiledGameOfLife((32, 32), randomize=False, tile_size=8)
+        game.step()
+        self.assertFalse(game.is_changing)
+        # Так клетки меняет GUI: на месте, в обход step
+        game.curr_generation[20, 10:13] = 1
+        game.step()
+        self.assertEqual(3, int(game.curr_generation[19:22, 11].sum()))
+        self.assertTrue(game.is_changing)
+
+    def test_assigned_board_is_picked_up(self):
+        game = TiledGameOfLife((16, 16), randomize=False, tile_size=4)
+        game.step()
+        self.assertEqual(0, game.dirty_tiles)
+        board = [[0] * 16 for _ in range(16)]
+        board[8][7:10] = [1, 1, 1]
+        game.curr_generation = board
+        game.step()
+        self.assertEqual(board, game.prev_generation.tolist())
+        self.assertEqual([1, 1, 1], game.curr_generation[7:10, 8].tolist())
+        self.assertTrue(game.is_changing)